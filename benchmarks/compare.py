@@ -0,0 +1,58 @@
+# Compares two result files written with --json and fails if a case got slower than the threshold, e.g. in CI.
+#
+#   python -m benchmarks.compare baseline.json results.json [--threshold 1.3]
+#
+# Cases missing in either file are skipped, so added or removed cases do not fail the comparison.
+
+import argparse
+import json
+import sys
+from typing import Any
+
+
+def load(path: str) -> dict[str, float]:
+    with open(path) as f:
+        return {result['name']: result['seconds'] for result in json.load(f)['results']}
+
+
+def compare(baseline: dict[str, float], results: dict[str, float], threshold: float) -> list[dict[str, Any]]:
+
+    comparisons = []
+
+    for name, seconds in results.items():
+        if name in baseline and baseline[name] > 0:
+            ratio = seconds / baseline[name]
+            comparisons.append({
+                'name': name,
+                'baseline': baseline[name],
+                'seconds': seconds,
+                'ratio': ratio,
+                'regression': ratio > threshold,
+            })
+
+    return comparisons
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('baseline', help='the results of the base revision')
+    parser.add_argument('results', help='the results of the revision under test')
+    parser.add_argument('--threshold', type=float, default=1.3, help='the slowdown ratio that counts as a regression')
+    args = parser.parse_args()
+
+    comparisons = compare(load(args.baseline), load(args.results), args.threshold)
+
+    for comparison in comparisons:
+        sys.stdout.write(
+            f"{comparison['name']:<36} {comparison['baseline'] * 1_000_000:>12,.2f} us"
+            f" {comparison['seconds'] * 1_000_000:>12,.2f} us  {comparison['ratio']:>6.2f}x"
+            f"{'  REGRESSION' if comparison['regression'] else ''}\n"
+        )
+
+    if any(comparison['regression'] for comparison in comparisons):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,354 @@
+# Throughput and latency of the operations against a throwaway PostgreSQL, created with initdb in a temporary directory.
+#
+#   python -m benchmarks.end_to_end [--calls 1000] [--json results.json]
+#
+# The PostgreSQL binaries are looked up in $PG_BIN, `pg_config --bindir` and $PATH. Set CONN_STR to use an existing
+# database instead, the benchmark only touches the schema pgcrud_benchmark.
+
+import argparse
+import asyncio
+import importlib.metadata
+import importlib.util
+import json
+import os
+from pathlib import Path
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from types import TracebackType
+from typing import Any, Awaitable, Callable
+
+import pgcrud as pg
+from pgcrud import IdentifierExpression as i
+
+
+SCHEMA = 'pgcrud_benchmark'
+SETUP_SCHEMA = Path(__file__).parent.parent / 'tests' / 'setup_schema.sql'
+N_CUSTOMERS = 10_000
+PAGE_SIZE = 100
+BATCH_SIZE = 100
+WARMUP_CALLS = 20
+
+
+def get_row_types() -> dict[str, Any]:
+
+    row_types: dict[str, Any] = {
+        'tuple': (tuple[int, str], {'validation': None}),
+        'dict': (dict[str, Any], {'validation': None}),
+    }
+
+    if importlib.util.find_spec('pydantic'):
+        from pydantic import BaseModel
+
+        class PydanticCustomer(BaseModel):
+            id: int
+            name: str
+
+        row_types['pydantic'] = (PydanticCustomer, {'validation': 'pydantic'})
+
+    if importlib.util.find_spec('msgspec'):
+        from msgspec import Struct
+
+        class MsgspecCustomer(Struct):
+            id: int
+            name: str
+
+        row_types['msgspec'] = (MsgspecCustomer, {'validation': 'msgspec'})
+
+    return row_types
+
+
+def find_bindir() -> Path:
+
+    if 'PG_BIN' in os.environ:
+        return Path(os.environ['PG_BIN'])
+
+    pg_config = shutil.which('pg_config')
+
+    if pg_config:
+        bindir = Path(subprocess.run([pg_config, '--bindir'], capture_output=True, text=True, check=True).stdout.strip())
+        if (bindir / 'initdb').exists():
+            return bindir
+
+    initdb = shutil.which('initdb')
+
+    if initdb:
+        return Path(initdb).parent
+
+    raise RuntimeError('Cannot find initdb, set PG_BIN to the directory of the PostgreSQL binaries or CONN_STR.')
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class TemporaryPostgres:
+
+    def __init__(self):
+        self.bindir = find_bindir()
+        self.tmpdir = tempfile.TemporaryDirectory(prefix='pgcrud-benchmark-')
+        self.datadir = Path(self.tmpdir.name) / 'data'
+        self.port = get_free_port()
+
+    @property
+    def conn_str(self) -> str:
+        return f'host={self.tmpdir.name} port={self.port} user=postgres dbname=postgres'
+
+    def __enter__(self) -> 'TemporaryPostgres':
+
+        subprocess.run(
+            [self.bindir / 'initdb', '-D', self.datadir, '-U', 'postgres', '--auth=trust', '--no-sync'],
+            capture_output=True,
+            check=True,
+        )
+
+        # unix socket only, fsync off: the benchmark measures pgcrud, not the disk
+        options = f"-p {self.port} -k {self.tmpdir.name} -c listen_addresses='' -c fsync=off -c synchronous_commit=off"
+
+        subprocess.run(
+            [self.bindir / 'pg_ctl', '-D', self.datadir, '-o', options, '-l', Path(self.tmpdir.name) / 'log', '-w', 'start'],
+            capture_output=True,
+            check=True,
+        )
+
+        return self
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None,
+    ) -> None:
+        subprocess.run([self.bindir / 'pg_ctl', '-D', self.datadir, '-m', 'fast', '-w', 'stop'], capture_output=True)
+        self.tmpdir.cleanup()
+
+
+def setup_schema(conn_str: str) -> None:
+
+    with pg.connect(conn_str, autocommit=True) as conn:
+        conn.execute(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE')
+        conn.execute(f'CREATE SCHEMA {SCHEMA}')
+        conn.execute(f'SET search_path = {SCHEMA}')
+
+        for query in SETUP_SCHEMA.read_text().split(';'):
+            if query.strip():
+                conn.execute(query)  # type: ignore
+
+        conn.execute(f"INSERT INTO customer (id, name) SELECT n, 'Customer ' || n FROM generate_series(3, {N_CUSTOMERS}) n")
+        conn.execute('ANALYZE')
+
+
+def summarize(operation: str, mode: str, row_type: str, latencies: list[float], rows: list[int]) -> dict[str, Any]:
+
+    # the warm-up calls are neither timed nor counted
+    latencies = sorted(latencies[WARMUP_CALLS:])
+
+    if not latencies:
+        raise ValueError(f'At least {WARMUP_CALLS + 1} calls are needed, the first {WARMUP_CALLS} are warm-up calls.')
+
+    total = sum(latencies)
+
+    return {
+        'operation': operation,
+        'mode': mode,
+        'row_type': row_type,
+        'calls': len(latencies),
+        'rows_per_sec': sum(rows[WARMUP_CALLS:]) / total if total else 0.0,
+        'p50': latencies[len(latencies) // 2],
+        'p99': latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)],
+    }
+
+
+def make_sync_operations(cursor: pg.Cursor, row_type: Any) -> dict[str, Callable[[int], int]]:
+
+    columns = (i.id, i.name)
+
+    def get_one(n: int) -> int:
+        pg.get_one(cursor[row_type], select=columns, from_=i.customer, where=i.id == n % N_CUSTOMERS + 1)
+        return 1
+
+    def get_many(n: int) -> int:
+        offset = n * PAGE_SIZE % (N_CUSTOMERS - PAGE_SIZE)
+        return len(pg.get_many(cursor[row_type], select=columns, from_=i.customer, where=i.id > offset, order_by=i.id, limit=PAGE_SIZE))
+
+    def insert_many(n: int) -> int:
+        start = N_CUSTOMERS + 1 + n * BATCH_SIZE
+        values = [{'id': id_, 'name': f'Customer {id_}'} for id_ in range(start, start + BATCH_SIZE)]
+        return len(pg.insert_many(cursor[row_type], insert_into=i.customer[i.id, i.name], values=values, returning=columns))
+
+    def update_many(n: int) -> int:
+        start = N_CUSTOMERS + 1 + n * BATCH_SIZE
+        where = (i.id >= start) & (i.id < start + BATCH_SIZE)
+        return len(pg.update_many(cursor[row_type], update=i.customer, set_=(i.name, 'Updated'), where=where, returning=columns))
+
+    def delete_many(n: int) -> int:
+        start = N_CUSTOMERS + 1 + n * BATCH_SIZE
+        where = (i.id >= start) & (i.id < start + BATCH_SIZE)
+        return len(pg.delete_many(cursor[row_type], delete_from=i.customer, where=where, returning=columns))
+
+    return {
+        'get_one': get_one,
+        'get_many': get_many,
+        'insert_many': insert_many,
+        'update_many': update_many,
+        'delete_many': delete_many,
+    }
+
+
+def make_async_operations(cursor: pg.AsyncCursor, row_type: Any) -> dict[str, Callable[[int], Awaitable[int]]]:
+
+    columns = (i.id, i.name)
+
+    async def get_one(n: int) -> int:
+        await pg.async_get_one(cursor[row_type], select=columns, from_=i.customer, where=i.id == n % N_CUSTOMERS + 1)
+        return 1
+
+    async def get_many(n: int) -> int:
+        offset = n * PAGE_SIZE % (N_CUSTOMERS - PAGE_SIZE)
+        return len(await pg.async_get_many(cursor[row_type], select=columns, from_=i.customer, where=i.id > offset, order_by=i.id, limit=PAGE_SIZE))
+
+    async def insert_many(n: int) -> int:
+        start = N_CUSTOMERS + 1 + n * BATCH_SIZE
+        values = [{'id': id_, 'name': f'Customer {id_}'} for id_ in range(start, start + BATCH_SIZE)]
+        return len(await pg.async_insert_many(cursor[row_type], insert_into=i.customer[i.id, i.name], values=values, returning=columns))
+
+    async def update_many(n: int) -> int:
+        start = N_CUSTOMERS + 1 + n * BATCH_SIZE
+        where = (i.id >= start) & (i.id < start + BATCH_SIZE)
+        return len(await pg.async_update_many(cursor[row_type], update=i.customer, set_=(i.name, 'Updated'), where=where, returning=columns))
+
+    async def delete_many(n: int) -> int:
+        start = N_CUSTOMERS + 1 + n * BATCH_SIZE
+        where = (i.id >= start) & (i.id < start + BATCH_SIZE)
+        return len(await pg.async_delete_many(cursor[row_type], delete_from=i.customer, where=where, returning=columns))
+
+    return {
+        'get_one': get_one,
+        'get_many': get_many,
+        'insert_many': insert_many,
+        'update_many': update_many,
+        'delete_many': delete_many,
+    }
+
+
+def bench_sync(conn_str: str, calls: int) -> list[dict[str, Any]]:
+
+    results = []
+
+    with pg.connect(conn_str, autocommit=True) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(f'SET search_path = {SCHEMA}')
+
+            for row_type_name, row_type in get_row_types().items():
+                operations = make_sync_operations(cursor, row_type)
+
+                # the write operations run in this order, so that every batch is inserted, updated and deleted again
+                for name, operation in operations.items():
+                    latencies = []
+                    rows = []
+                    for n in range(calls):
+                        start = time.perf_counter()
+                        rows.append(operation(n))
+                        latencies.append(time.perf_counter() - start)
+                    results.append(summarize(name, 'sync', row_type_name, latencies, rows))
+
+    return results
+
+
+async def bench_async(conn_str: str, calls: int) -> list[dict[str, Any]]:
+
+    results = []
+
+    async with await pg.async_connect(conn_str, autocommit=True) as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(f'SET search_path = {SCHEMA}')
+
+            for row_type_name, row_type in get_row_types().items():
+                operations = make_async_operations(cursor, row_type)
+
+                for name, operation in operations.items():
+                    latencies = []
+                    rows = []
+                    for n in range(calls):
+                        start = time.perf_counter()
+                        rows.append(await operation(n))
+                        latencies.append(time.perf_counter() - start)
+                    results.append(summarize(name, 'async', row_type_name, latencies, rows))
+
+    return results
+
+
+def get_server_version(conn_str: str) -> str:
+    with pg.connect(conn_str) as conn:
+        return conn.execute('SHOW server_version').fetchone()[0]  # type: ignore
+
+
+def get_pgcrud_version() -> str:
+
+    try:
+        return importlib.metadata.version('pgcrud')
+    except importlib.metadata.PackageNotFoundError:
+        pass
+
+    # a checkout which is not installed is identified by its git revision
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run(conn_str: str, calls: int) -> dict[str, Any]:
+
+    setup_schema(conn_str)
+
+    return {
+        'pgcrud': get_pgcrud_version(),
+        'python': platform.python_version(),
+        'postgres': get_server_version(conn_str),
+        'calls': calls,
+        'results': bench_sync(conn_str, calls) + asyncio.run(bench_async(conn_str, calls)),
+    }
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', type=int, default=1000, help='calls per operation and row type')
+    parser.add_argument('--json', help='writes the results to this file')
+    args = parser.parse_args()
+
+    if args.calls <= WARMUP_CALLS:
+        parser.error(f'--calls must be greater than {WARMUP_CALLS}, the number of warm-up calls')
+
+    if 'CONN_STR' in os.environ:
+        report = run(os.environ['CONN_STR'], args.calls)
+    else:
+        with TemporaryPostgres() as postgres:
+            report = run(postgres.conn_str, args.calls)
+
+    for result in report['results']:
+        sys.stdout.write(
+            f"{result['operation']:<12} {result['mode']:<6} {result['row_type']:<9}"
+            f" {result['rows_per_sec']:>12,.0f} rows/s"
+            f"  p50 {result['p50'] * 1000:>8.3f} ms  p99 {result['p99'] * 1000:>8.3f} ms\n"
+        )
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# Compares the previous executemany, which converted the whole batch into a list upfront, with the lazy conversion.
+#
+#   python -m benchmarks.executemany                   conversion only
+#   CONN_STR=... python -m benchmarks.executemany      conversion and rows/sec against a database
+
+import os
+import time
+import tracemalloc
+from typing import Any, Callable, Iterable
+
+import msgspec
+import psycopg
+
+import pgcrud as pg
+from pgcrud.db.shared import deserialize_params, deserialize_params_seq
+
+
+N = 100_000
+
+NAMED_QUERY = 'INSERT INTO bench_executemany (id, name, balance) VALUES (%(id)s, %(name)s, %(balance)s)'
+POSITIONAL_QUERY = 'INSERT INTO bench_executemany (id, name, balance) VALUES (%s, %s, %s)'
+
+
+class Account(msgspec.Struct):
+    id: int
+    name: str
+    balance: float
+
+
+def make_params() -> dict[str, list[Any]]:
+    return {
+        'dict': [{'id': n, 'name': f'account {n}', 'balance': n / 10} for n in range(N)],
+        'msgspec': [Account(id=n, name=f'account {n}', balance=n / 10) for n in range(N)],
+    }
+
+
+def eager(query: str, params_seq: Iterable[Any]) -> None:
+    for _ in [deserialize_params(params) for params in params_seq]:
+        pass
+
+
+def lazy(query: str, params_seq: Iterable[Any]) -> None:
+    for _ in deserialize_params_seq(query, params_seq):
+        pass
+
+
+def measure(fun: Callable[[str, Iterable[Any]], None], query: str, params_seq: list[Any]) -> tuple[float, int]:
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    fun(query, params_seq)
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return duration, peak
+
+
+def bench_conversion(params: dict[str, list[Any]]) -> None:
+
+    print(f'conversion of {N} parameters')
+
+    for name, params_seq in params.items():
+        for fun in (eager, lazy):
+            duration, peak = measure(fun, NAMED_QUERY, params_seq)
+            print(f'  {name:<8} {fun.__name__:<6} {N / duration:>12,.0f} params/s  peak {peak / 1024:>10,.0f} KiB')
+
+
+def bench_execution(conn_str: str, params: dict[str, list[Any]]) -> None:
+
+    print(f'executemany of {N} rows')
+
+    with pg.connect(conn_str, autocommit=True) as conn:
+        conn.execute('CREATE TEMP TABLE bench_executemany (id int, name text, balance float8)')
+
+        for name, params_seq in params.items():
+            for label in ('eager', 'lazy'):
+                conn.execute('TRUNCATE bench_executemany')
+
+                with conn.cursor() as cursor:
+                    start = time.perf_counter()
+                    if label == 'eager':
+                        psycopg.Cursor.executemany(cursor, NAMED_QUERY, [deserialize_params(p) for p in params_seq])
+                    else:
+                        cursor.executemany(NAMED_QUERY, params_seq)
+                    duration = time.perf_counter() - start
+
+                print(f'  {name:<8} {label:<6} {N / duration:>12,.0f} rows/s')
+
+        with conn.cursor() as cursor:
+            conn.execute('TRUNCATE bench_executemany')
+            start = time.perf_counter()
+            cursor.executemany(POSITIONAL_QUERY, params['msgspec'])
+            duration = time.perf_counter() - start
+            print(f'  {"msgspec":<8} {"lazy":<6} {N / duration:>12,.0f} rows/s  (positional placeholders)')
+
+
+def main() -> None:
+
+    params = make_params()
+    bench_conversion(params)
+
+    conn_str = os.environ.get('CONN_STR')
+
+    if conn_str:
+        bench_execution(conn_str, params)
+
+
+if __name__ == '__main__':
+    main()
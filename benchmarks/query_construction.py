@@ -0,0 +1,100 @@
+# Building and rendering representative queries, no database needed.
+#
+#   python -m benchmarks.query_construction [--repeat 5] [--scale 1.0] [--filter render] [--json results.json]
+
+from functools import reduce
+import operator
+from typing import Any, Callable
+
+from pgcrud import IdentifierExpression as i, QueryBuilder as q, functions as f
+from pgcrud.query import Query
+
+from benchmarks.runner import Case, main
+
+
+__all__ = [
+    'QUERIES',
+    'CASES',
+]
+
+
+def simple_lookup() -> Query:
+    return q.SELECT(i.id, i.name, i.email).FROM(i.customer).WHERE(i.id == 1).LIMIT(1)
+
+
+def where_tree() -> Query:
+    # 20 predicates, alternating AND and OR groups of 4
+    groups = [reduce(operator.and_, [i(f'col_{n}_{m}') == m for m in range(4)]) for n in range(5)]
+    return q.SELECT(i.id).FROM(i.customer).WHERE(reduce(operator.or_, groups))
+
+
+def joins_with_windows() -> Query:
+    return (
+        q.SELECT(
+            i.customer.id,
+            i.customer.name,
+            f.sum(i.account.balance).AS(i.total_balance),
+            f.row_number().OVER(i.w).AS(i.rank),
+        )
+        .FROM(
+            i.customer
+            .LEFT_JOIN(i.account).ON(i.account.customer_id == i.customer.id)
+            .LEFT_JOIN(i.address).ON(i.address.customer_id == i.customer.id)
+        )
+        .WHERE((i.customer.created_at > '2024-01-01') & i.account.type.IN(['savings', 'checking']))
+        .GROUP_BY(i.customer.id, i.customer.name)
+        .WINDOW(i.w.AS(q.PARTITION_BY(i.customer.country).ORDER_BY(i.customer.created_at)))
+        .ORDER_BY(i.customer.id)
+        .LIMIT(100)
+    )
+
+
+VALUES_ROWS = [{'id': n, 'name': f'customer {n}', 'balance': n / 10} for n in range(10_000)]
+
+
+def values_10k() -> Query:
+    return q.INSERT_INTO(i.customer[i.id, i.name, i.balance]).VALUES(*VALUES_ROWS).RETURNING(i.id)
+
+
+def multi_column_set() -> Query:
+    return (
+        q.UPDATE(i.customer)
+        .SET((i.name, i.email, i.balance, i.country, i.updated_at), ('A', 'a@example.com', 1.5, 'AT', '2024-01-01'))
+        .WHERE((i.id == 1) & (i.version == 3))
+        .RETURNING(i.id, i.version)
+    )
+
+
+QUERIES: dict[str, tuple[Callable[[], Query], int]] = {
+    'simple_lookup': (simple_lookup, 10_000),
+    'where_tree': (where_tree, 1_000),
+    'joins_with_windows': (joins_with_windows, 2_000),
+    'values_10k': (values_10k, 5),
+    'multi_column_set': (multi_column_set, 5_000),
+}
+
+
+def make_render(build: Callable[[], Query]) -> Callable[[], Any]:
+    # str() caches the SQL of a query, a new query of the same clauses is rendered instead. Only public API is used, so
+    # that the case also runs against older revisions.
+    clauses = list(build().clauses)
+    return lambda: str(Query(clauses))
+
+
+def make_build_and_render(build: Callable[[], Query]) -> Callable[[], Any]:
+    return lambda: str(build())
+
+
+CASES = [
+    case
+    for name, (build, number) in QUERIES.items()
+    for case in (
+        Case(f'{name}.build', build, number),
+        Case(f'{name}.render', make_render(build), number),
+        Case(f'{name}.build_and_render', make_build_and_render(build), number),
+    )
+]
+
+
+if __name__ == '__main__':
+    main(CASES)
@@ -0,0 +1,171 @@
+# Row construction of every branch of get_row_factory, per validation mode and strictness, no database needed.
+#
+#   python -m benchmarks.row_factories [--repeat 5] [--scale 1.0] [--filter pydantic] [--json results.json]
+#
+# The row factories are fed a synthetic cursor and row tuples, the same way psycopg calls them for a fetched result.
+# The pydantic and msgspec cases are skipped if the package is not installed.
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import importlib.util
+from typing import Any, Callable, NamedTuple
+
+from psycopg import pq
+
+from pgcrud.db.shared import get_row_factory
+from pgcrud.types import ValidationType
+
+from benchmarks.runner import Case, main
+
+
+__all__ = [
+    'ROW_TYPES',
+    'ROWS',
+    'SyntheticCursor',
+    'CASES',
+]
+
+
+N_ROWS = 1000
+NAMES = ('id', 'name', 'email', 'balance', 'created_at')
+ROWS = [
+    (n, f'customer {n}', f'customer{n}@example.com', n / 10, datetime(2024, 1, 1) + timedelta(minutes=n))
+    for n in range(N_ROWS)
+]
+
+
+@dataclass
+class CustomerDataclass:
+    id: int
+    name: str
+    email: str
+    balance: float
+    created_at: datetime
+
+
+class CustomerNamedTuple(NamedTuple):
+    id: int
+    name: str
+    email: str
+    balance: float
+    created_at: datetime
+
+
+def get_row_types() -> dict[str, Any]:
+
+    # one row type per branch of make_row_factory
+    row_types: dict[str, Any] = {
+        'scalar': int,
+        'tuple': tuple[int, str, str, float, datetime],
+        'list': list[Any],
+        'set': set[Any],
+        'dict': dict[str, Any],
+        'dataclass': CustomerDataclass,
+        'named_tuple': CustomerNamedTuple,
+    }
+
+    if importlib.util.find_spec('pydantic'):
+        from pydantic import BaseModel
+
+        class CustomerPydantic(BaseModel):
+            id: int
+            name: str
+            email: str
+            balance: float
+            created_at: datetime
+
+        row_types['pydantic_model'] = CustomerPydantic
+
+    if importlib.util.find_spec('msgspec'):
+        from msgspec import Struct
+
+        class CustomerMsgspec(Struct):
+            id: int
+            name: str
+            email: str
+            balance: float
+            created_at: datetime
+
+        row_types['msgspec_struct'] = CustomerMsgspec
+
+    return row_types
+
+
+ROW_TYPES = get_row_types()
+
+VALIDATIONS: tuple[ValidationType, ...] = tuple(
+    validation for validation in (None, 'pydantic', 'msgspec') if validation is None or importlib.util.find_spec(validation)
+)
+
+
+class SyntheticColumn:
+
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class SyntheticResult:
+
+    status = pq.ExecStatus.TUPLES_OK
+
+    def __init__(self, names: tuple[str, ...]):
+        self.nfields = len(names)
+        self._names = [name.encode() for name in names]
+
+    def fname(self, column_number: int) -> bytes:
+        return self._names[column_number]
+
+
+class SyntheticCursor:
+
+    # the attributes psycopg and pgcrud read from a cursor to construct rows
+    _encoding = 'utf-8'
+
+    def __init__(self, names: tuple[str, ...]):
+        self.pgresult = SyntheticResult(names)
+        self.description = [SyntheticColumn(name) for name in names]
+
+
+def make_fetch(row_type: Any, validation: ValidationType, strict: bool) -> Callable[[], list[Any]]:
+
+    row_factory = get_row_factory(row_type, validation, strict)
+    cursor = SyntheticCursor(NAMES)
+
+    # like fetchall, the row maker is requested once per result
+    def fetch() -> list[Any]:
+        row_maker = row_factory(cursor)  # type: ignore
+        return [row_maker(row) for row in ROWS]
+
+    return fetch
+
+
+def is_supported(row_type: Any, validation: ValidationType, strict: bool) -> bool:
+
+    # e.g. pydantic has no schema for msgspec structs and rejects dicts as dataclasses in strict mode
+    try:
+        make_fetch(row_type, validation, strict)()
+    except Exception:
+        return False
+    else:
+        return True
+
+
+CASES = [
+    Case(
+        f"{name}.{validation or 'none'}{'.strict' if strict else ''}",
+        make_fetch(row_type, validation, strict),
+        number=20,
+        rows=N_ROWS,
+    )
+    for name, row_type in ROW_TYPES.items()
+    for validation in VALIDATIONS
+    for strict in (False, True)
+    # strict only applies to validation
+    if (validation is not None or not strict) and is_supported(row_type, validation, strict)
+]
+
+
+if __name__ == '__main__':
+    main(CASES)
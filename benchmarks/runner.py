@@ -0,0 +1,125 @@
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+
+__all__ = [
+    'Case',
+    'measure_time',
+    'measure_memory',
+    'run',
+    'main',
+]
+
+
+class Case:
+
+    def __init__(
+            self,
+            name: str,
+            fun: Callable[[], Any],
+            number: int = 1000,
+            rows: int | None = None,
+    ):
+        self.name = name
+        self.fun = fun
+        self.number = number
+        self.rows = rows
+
+    def __str__(self):
+        return f'Case(name={self.name}, number={self.number})'
+
+    def __repr__(self):
+        return str(self)
+
+
+def measure_time(fun: Callable[[], Any], number: int, repeat: int) -> float:
+
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                fun()
+            timings.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    # the minimum is the least disturbed run
+    return min(timings)
+
+
+def measure_memory(fun: Callable[[], Any]) -> tuple[int, int]:
+
+    fun()
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        fun()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # memory still held after the call, e.g. by caches, without the snapshots themselves
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), 'filename')
+    retained = sum(stat.size_diff for stat in stats)
+
+    return peak, retained
+
+
+def run(cases: list[Case], repeat: int = 5, scale: float = 1.0) -> list[dict[str, Any]]:
+
+    results = []
+
+    for case in cases:
+        number = max(int(case.number * scale), 1)
+        seconds = measure_time(case.fun, number, repeat)
+        peak, retained = measure_memory(case.fun)
+        result = {
+            'name': case.name,
+            'seconds': seconds,
+            'peak_bytes': peak,
+            'retained_bytes': retained,
+        }
+        if case.rows is not None:
+            result['ns_per_row'] = seconds / case.rows * 1_000_000_000
+        results.append(result)
+
+    return results
+
+
+def main(cases: list[Case]) -> None:
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--scale', type=float, default=1.0, help='scales the number of calls per repeat')
+    parser.add_argument('--filter', default='', help='runs only the cases containing this string')
+    parser.add_argument('--json', help='writes the results to this file')
+    args = parser.parse_args()
+
+    results = run([case for case in cases if args.filter in case.name], args.repeat, args.scale)
+
+    for result in results:
+        sys.stdout.write(
+            f"{result['name']:<36} {result['seconds'] * 1_000_000:>12,.2f} us"
+            f"  peak {result['peak_bytes'] / 1024:>10,.1f} KiB  retained {result['retained_bytes'] / 1024:>8,.1f} KiB"
+        )
+        if 'ns_per_row' in result:
+            sys.stdout.write(f"  {result['ns_per_row']:>10,.0f} ns/row")
+        sys.stdout.write('\n')
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'python': sys.version, 'results': results}, f, indent=2)
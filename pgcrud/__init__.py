@@ -1,5 +1,22 @@
+from pgcrud.cache import Cache
 from pgcrud.config import config
-from pgcrud.db import ConnectionPool, Connection, Cursor, AsyncConnectionPool, AsyncConnection, AsyncCursor
+from pgcrud.explain import Plan
+from pgcrud.instrumentation import Hook, ExecuteEvent
+from pgcrud.metrics import Metrics
+from pgcrud.slow_query_log import SlowQueryLog
+from pgcrud.db.warmup import Warmup
+from pgcrud.db import (
+    ConnectionPool,
+    Connection,
+    TypedConnection,
+    Cursor,
+    AsyncConnectionPool,
+    AsyncConnection,
+    AsyncTypedConnection,
+    AsyncCursor,
+    RoutingPool,
+    AsyncRoutingPool,
+)
 from pgcrud.expressions.base import (
     LiteralExpression,
     IdentifierExpression,
@@ -22,22 +39,38 @@ from pgcrud.operations.async_insert_one import async_insert_one
 from pgcrud.operations.async_insert_many import async_insert_many
 from pgcrud.operations.async_update_many import async_update_many
 from pgcrud.operations.async_delete_many import async_delete_many
+from pgcrud.operators import all_of, any_of
 from pgcrud.query_builder import QueryBuilder
+from pgcrud.schema import use_schema
 
 
 __all__ = [
     'config',
+    'Cache',
+    'Plan',
+    'Hook',
+    'ExecuteEvent',
+    'Metrics',
+    'SlowQueryLog',
 
     'ConnectionPool',
     'Connection',
+    'TypedConnection',
     'Cursor',
     'AsyncConnectionPool',
     'AsyncConnection',
+    'AsyncTypedConnection',
     'AsyncCursor',
+    'RoutingPool',
+    'AsyncRoutingPool',
+    'Warmup',
     'connect',
     'async_connect',
 
     'QueryBuilder',
+    'use_schema',
+    'all_of',
+    'any_of',
 
     'LiteralExpression',
     'PlaceholderExpression',
@@ -0,0 +1,459 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import logging
+from threading import Event, Lock, Thread
+import time
+from typing import Any, Hashable, Iterable, Iterator, TYPE_CHECKING
+from weakref import WeakSet
+
+from psycopg._cursor_base import BaseCursor
+from psycopg.pq import TransactionStatus
+from psycopg.sql import SQL, Identifier
+
+from pgcrud.clauses import Clause, DeleteFromClause, FromClause, InsertIntoClause, UpdateClause, UsingClause
+from pgcrud.expressions.base import (
+    make_expr,
+    Expression,
+    IdentifierExpression,
+    AsClauseExpression,
+    JoinClauseExpression,
+    LeftJoinClauseExpression,
+    RightJoinClauseExpression,
+    InnerJoinClauseExpression,
+    FullJoinClauseExpression,
+    CrossJoinClauseExpression,
+    OnClauseExpression,
+    QueryExpression,
+)
+from pgcrud.query import Query
+from pgcrud.schema import current_schema
+
+
+if TYPE_CHECKING:
+    from pgcrud.db import ConnectionPool, AsyncConnectionPool, Cursor, ServerCursor, AsyncCursor, AsyncServerCursor
+    from pgcrud.db import Connection, AsyncConnection
+
+
+__all__ = [
+    'MISSING',
+    'Cache',
+    'CacheListener',
+    'AsyncCacheListener',
+    'get_table_names',
+]
+
+
+MISSING: Any = object()
+
+logger = logging.getLogger('pgcrud.cache')
+
+JoinClauseExpressions = (
+    JoinClauseExpression,
+    LeftJoinClauseExpression,
+    RightJoinClauseExpression,
+    InnerJoinClauseExpression,
+    FullJoinClauseExpression,
+    CrossJoinClauseExpression,
+)
+
+TableClauses = (
+    FromClause,
+    UsingClause,
+    UpdateClause,
+    DeleteFromClause,
+)
+
+
+def get_from_table_names(expression: Expression) -> set[str]:
+
+    if isinstance(expression, IdentifierExpression):
+        return {expression._name}
+    elif isinstance(expression, AsClauseExpression):
+        return get_from_table_names(expression.expression)
+    elif isinstance(expression, OnClauseExpression):
+        return get_from_table_names(expression.left)
+    elif isinstance(expression, JoinClauseExpressions):
+        return get_from_table_names(expression.left) | get_from_table_names(expression.right)
+    else:
+        return set()
+
+
+def get_clause_items(clause: Clause) -> Iterator[Any]:
+
+    for value in vars(clause).values():
+        if isinstance(value, dict):
+            yield from value.values()
+        elif isinstance(value, (list, tuple)):
+            yield from value
+        else:
+            yield value
+
+
+def get_table_names(value: Any) -> set[str]:
+
+    expression = make_expr(value)
+    names = get_from_table_names(expression)
+
+    # Besides the tables in FROM position, every subquery is searched, so that tables read in a WHERE or SELECT clause
+    # or in a common table expression invalidate the result as well.
+    stack: list[Any] = [expression]
+
+    while stack:
+        item = stack.pop()
+
+        if isinstance(item, QueryExpression):
+            item = item.query
+
+        if isinstance(item, Query):
+            for clause in item.clauses:
+                if isinstance(clause, InsertIntoClause):
+                    names |= get_from_table_names(clause.identifier_expression)
+                elif isinstance(clause, TableClauses):
+                    names |= get_from_table_names(make_expr(clause.expression))
+                stack.extend(child for child in get_clause_items(clause) if isinstance(child, (Expression, Query)))
+        elif isinstance(item, Expression) and not item._leaf:
+            stack.extend(part for part in item._parts() if isinstance(part, (Expression, Query)))
+
+    return names
+
+
+def get_search_path(connection: Any) -> Any:
+
+    # PostgreSQL 18 reports the search_path to the client, older servers only through the search_path of the pool
+    search_path = connection.info.parameter_status('search_path')
+
+    if search_path is None:
+        search_path = getattr(getattr(connection, '_pool', None), 'search_path', None)
+        if isinstance(search_path, list):
+            search_path = tuple(search_path)
+
+    return search_path
+
+
+class Cache:
+
+    def __init__(
+            self,
+            ttl: float = 60.0,
+            max_size: int = 1024,
+            channel: str | None = None,
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.channel = channel
+        self._entries: OrderedDict[Hashable, tuple[float, Any, set[str]]] = OrderedDict()
+        self._keys_by_table: dict[str, set[Hashable]] = {}
+        self._version = 0
+        self._invalidated_at: dict[str, int] = {}
+        self._cleared_at = 0
+        self._pending: dict[str, WeakSet[Connection[Any] | AsyncConnection[Any]]] = {}
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __str__(self):
+        return f'Cache(ttl={self.ttl}, max_size={self.max_size}, size={self.size}, hits={self.hits}, misses={self.misses})'
+
+    def __repr__(self):
+        return str(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def version(self) -> int:
+        # take the version before reading from the database and pass it to set, so that a result read before an
+        # invalidation of its tables is not cached
+        return self._version
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            'size': self.size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    @staticmethod
+    def make_key(cursor: BaseCursor[Any, Any], query: Query | Expression | str, params: Any = None) -> Hashable | None:
+
+        # The same query reads other tables under another schema or search_path. If neither is known, e.g. after a
+        # manual SET search_path on a server before PostgreSQL 18, the result is not cached at all.
+        schema = current_schema.get()
+        search_path = get_search_path(cursor.connection)
+
+        if schema is None and search_path is None:
+            return None
+
+        if params is not None and not isinstance(params, Hashable):
+            params = repr(params)
+
+        return str(query), params, cursor.row_factory, schema, search_path
+
+    def get(self, key: Hashable | None) -> Any:
+
+        if key is None:
+            return MISSING
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return MISSING
+
+            expires_at, value, table_names = entry
+
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self._misses += 1
+                return MISSING
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable | None, value: Any, table_names: set[str], version: int | None = None) -> None:
+
+        if key is None:
+            return
+
+        with self._lock:
+            if self._is_pending(table_names):
+                return
+
+            if version is not None and self._is_stale(table_names, version):
+                return
+
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (time.monotonic() + self.ttl, value, table_names)
+
+            for table_name in table_names:
+                self._keys_by_table.setdefault(table_name, set()).add(key)
+
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, *table_names: str) -> None:
+        with self._lock:
+            self._invalidate(table_names)
+
+    def notify(self, cursor: Cursor[Any] | ServerCursor[Any], table_names: set[str]) -> None:
+
+        self._mark_pending(cursor.connection, table_names)
+
+        # the notifications are delivered on commit, the separate cursor keeps the results of the write
+        if self.channel:
+            for table_name in table_names:
+                cursor.connection.execute('SELECT pg_notify(%s, %s)', (self.channel, table_name))
+
+    async def async_notify(self, cursor: AsyncCursor[Any] | AsyncServerCursor[Any], table_names: set[str]) -> None:
+
+        self._mark_pending(cursor.connection, table_names)
+
+        if self.channel:
+            for table_name in table_names:
+                await cursor.connection.execute('SELECT pg_notify(%s, %s)', (self.channel, table_name))
+
+    def listen(self, pool: ConnectionPool[Any]) -> CacheListener:
+        listener = CacheListener(self, pool)
+        listener.start()
+        return listener
+
+    def async_listen(self, pool: AsyncConnectionPool[Any]) -> AsyncCacheListener:
+        listener = AsyncCacheListener(self, pool)
+        listener.start()
+        return listener
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._cleared_at = self._version
+            self._entries.clear()
+            self._keys_by_table.clear()
+
+    def reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _invalidate(self, table_names: Iterable[str]) -> None:
+
+        self._version += 1
+
+        for table_name in table_names:
+            self._invalidated_at[table_name] = self._version
+            for key in list(self._keys_by_table.get(table_name, ())):
+                self._remove(key)
+
+    def _is_stale(self, table_names: set[str], version: int) -> bool:
+        if self._cleared_at > version:
+            return True
+        return any(self._invalidated_at.get(table_name, 0) > version for table_name in table_names)
+
+    def _mark_pending(self, connection: Connection[Any] | AsyncConnection[Any], table_names: set[str]) -> None:
+
+        # Other connections see the write only after it is committed. Until then, results of the tables are not cached,
+        # otherwise a concurrent read would cache the old rows again right after the invalidation.
+        with self._lock:
+            if connection.info.transaction_status != TransactionStatus.IDLE:
+                for table_name in table_names:
+                    self._pending.setdefault(table_name, WeakSet()).add(connection)
+            self._invalidate(table_names)
+
+    def _is_pending(self, table_names: set[str]) -> bool:
+
+        pending = False
+
+        for table_name in table_names:
+            connections = self._pending.get(table_name)
+            if connections is None:
+                continue
+
+            # a connection without an open transaction has committed or rolled back the write
+            for connection in list(connections):
+                if connection.closed or connection.info.transaction_status == TransactionStatus.IDLE:
+                    connections.discard(connection)
+
+            if connections:
+                pending = True
+            else:
+                del self._pending[table_name]
+                # a result read while the write was pending may still be on its way to set
+                self._invalidate((table_name,))
+
+        return pending
+
+    def _remove(self, key: Hashable) -> None:
+
+        _, _, table_names = self._entries.pop(key)
+
+        for table_name in table_names:
+            keys = self._keys_by_table.get(table_name)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_table[table_name]
+
+
+class CacheListener:
+
+    def __init__(
+            self,
+            cache: Cache,
+            pool: ConnectionPool[Any],
+            timeout: float = 1.0,
+            reconnect_delay: float = 5.0,
+    ):
+        if not cache.channel:
+            raise ValueError('Cannot listen because the cache has no channel.')
+
+        self.cache = cache
+        self.pool = pool
+        self.timeout = timeout
+        self.reconnect_delay = reconnect_delay
+        self._stop_event = Event()
+        self._thread = Thread(target=self._run, name=f'pgcrud-cache-listener-{cache.channel}', daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+
+        while not self._stop_event.is_set():
+            try:
+                kwargs = {**(self.pool.kwargs or {}), 'autocommit': True}
+
+                # a dedicated connection, so that the listener does not occupy the pool
+                with self.pool.connection_class.connect(self.pool.conninfo, **kwargs) as conn:  # type: ignore
+                    conn.execute(SQL('LISTEN {}').format(Identifier(self.cache.channel)))  # type: ignore
+
+                    # anything cached before listening may have missed a notification
+                    self.cache.clear()
+
+                    while not self._stop_event.is_set():
+                        for notify in conn.notifies(timeout=self.timeout):
+                            self.cache.invalidate(notify.payload)
+
+            except Exception:
+                # notifications may have been missed, and the listener must not stop invalidating for good
+                logger.exception('The cache listener on channel %s failed, reconnecting.', self.cache.channel)
+                self.cache.clear()
+                self._stop_event.wait(self.reconnect_delay)
+
+
+class AsyncCacheListener:
+
+    def __init__(
+            self,
+            cache: Cache,
+            pool: AsyncConnectionPool[Any],
+            timeout: float = 1.0,
+            reconnect_delay: float = 5.0,
+    ):
+        if not cache.channel:
+            raise ValueError('Cannot listen because the cache has no channel.')
+
+        self.cache = cache
+        self.pool = pool
+        self.timeout = timeout
+        self.reconnect_delay = reconnect_delay
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+
+        while True:
+            try:
+                kwargs = {**(self.pool.kwargs or {}), 'autocommit': True}
+
+                async with await self.pool.connection_class.connect(self.pool.conninfo, **kwargs) as conn:  # type: ignore
+                    await conn.execute(SQL('LISTEN {}').format(Identifier(self.cache.channel)))  # type: ignore
+                    self.cache.clear()
+
+                    while True:
+                        async for notify in conn.notifies(timeout=self.timeout):
+                            self.cache.invalidate(notify.payload)
+
+            except Exception:
+                logger.exception('The cache listener on channel %s failed, reconnecting.', self.cache.channel)
+                self.cache.clear()
+                await asyncio.sleep(self.reconnect_delay)
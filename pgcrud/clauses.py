@@ -8,15 +8,10 @@ from pgcrud.expressions.base import (
     Expression,
     IdentifierExpression,
     UndefinedExpression,
+    compile_expression,
 )
-from pgcrud.optional_dependencies import (
-    is_pydantic_installed,
-    is_pydantic_instance,
-    pydantic_to_dict,
-    is_msgspec_installed,
-    is_msgspec_instance,
-    msgspec_to_dict,
-)
+from pgcrud.converters import convert_params
+from pgcrud.schema import qualify
 from pgcrud.types import SequenceType
 
 
@@ -56,6 +51,20 @@ __all__ = [
 ]
 
 
+def snapshot_params(value: Any) -> Any:
+
+    # Values are converted and copied when the clause is built. A query caches its SQL, which must not change when the
+    # values are mutated or other converters are registered afterward.
+    params = convert_params(value)
+
+    if isinstance(params, dict):
+        return dict(params)
+    elif isinstance(params, SequenceType):
+        return tuple(params)
+    else:
+        return params
+
+
 class Clause:
 
     @abstractmethod
@@ -90,7 +99,7 @@ class DeleteFromClause(Clause):
         self.expression = expression
 
     def __str__(self) -> str:
-        return f'DELETE FROM {self.expression}'
+        return f'DELETE FROM {qualify(self.expression)}'
 
 
 class DescClause(Clause):
@@ -138,7 +147,7 @@ class FromClause(Clause):
         self.expression = expression
 
     def __str__(self) -> str:
-        return f'FROM {self.expression}'
+        return f'FROM {qualify(self.expression)}'
 
 
 class GroupByClause(Clause):
@@ -159,7 +168,7 @@ class HavingClause(Clause):
             self,
             expression: Expression,
     ):
-        self.expression = expression
+        self.expression = compile_expression(expression)
 
     def __str__(self) -> str:
         if self:
@@ -198,7 +207,7 @@ class InsertIntoClause(Clause):
         self.identifier_expression = identifier_expression
 
     def __str__(self) -> str:
-        return f'INSERT INTO {self.identifier_expression}'
+        return f'INSERT INTO {qualify(self.identifier_expression)}'
 
 
 class LimitClause(Clause):
@@ -363,43 +372,30 @@ class SetClause(Clause):
             values: Any,
             additional_values: dict[str, Any],
     ):
-        self.columns = columns
-        self.values = values
-        self.additional_values = additional_values
+        self.columns = tuple(columns)
+        self.values = snapshot_params(values)
+        self.additional_values = dict(additional_values)
 
     def __str__(self) -> str:
 
         col_strs = []
         val_strs = []
 
-        if is_pydantic_installed and is_pydantic_instance(self.values):
-            params = pydantic_to_dict(self.values)
-            params.update(self.additional_values)
-            for identifier in self.columns:
-                col_strs.append(str(identifier))
-                val_strs.append(str(make_expr(params[identifier._name])))
-
-        elif is_msgspec_installed and is_msgspec_instance(self.values):
-            params = msgspec_to_dict(self.values)
-            params.update(self.additional_values)
-            for identifier in self.columns:
-                col_strs.append(str(identifier))
-                val_strs.append(str(make_expr(params[identifier._name])))
+        params = self.values
 
-        elif isinstance(self.values, dict):
-            params = self.values
-            params.update(self.additional_values)
+        if isinstance(params, dict):
+            params = {**params, **self.additional_values}
             for identifier in self.columns:
                 col_strs.append(str(identifier))
                 val_strs.append(str(make_expr(params[identifier._name])))
 
-        elif isinstance(self.values, SequenceType):
-            for identifier, val in zip(self.columns, self.values, strict=True):
+        elif isinstance(params, SequenceType):
+            for identifier, val in zip(self.columns, params, strict=True):
                 col_strs.append(str(identifier))
                 val_strs.append(str(make_expr(val)))
 
         else:
-            for identifier, val in zip(self.columns, [self.values], strict=True):
+            for identifier, val in zip(self.columns, [params], strict=True):
                 col_strs.append(str(identifier))
                 val_strs.append(str(make_expr(val)))
 
@@ -418,7 +414,7 @@ class UpdateClause(Clause):
         self.expression = expression
 
     def __str__(self) -> str:
-        return f'UPDATE {self.expression}'
+        return f'UPDATE {qualify(self.expression)}'
 
 
 class UsingClause(Clause):
@@ -430,7 +426,7 @@ class UsingClause(Clause):
         self.expression = expression
 
     def __str__(self) -> str:
-        return f'USING {self.expression}'
+        return f'USING {qualify(self.expression)}'
 
 
 class ValuesClause(Clause):
@@ -441,48 +437,30 @@ class ValuesClause(Clause):
             additional_values: dict[str, Any],
             order: Sequence[IdentifierExpression] | None = None,
     ):
-        self.values = values
-        self.additional_values = additional_values
-        self.order = order
+        self.values = tuple(snapshot_params(value) for value in values)
+        self.additional_values = dict(additional_values)
+        self.order = tuple(order) if order else None
 
     def __str__(self) -> str:
 
         str_list = []
 
-        for value in self.values:
+        for params in self.values:
 
-            if is_pydantic_installed and is_pydantic_instance(value):
-                params = pydantic_to_dict(value)
-                params.update(self.additional_values)
+            if isinstance(params, dict):
+                if self.additional_values:
+                    params = {**params, **self.additional_values}
                 if self.order:
                     str_item = ', '.join([str(make_expr(params[identifier._name])) for identifier in self.order])
                 else:
                     str_item = ', '.join(str(make_expr(v)) for v in params.values())
                 str_list.append(f'({str_item})')
 
-            elif is_msgspec_installed and is_msgspec_instance(value):
-                params = msgspec_to_dict(value)
-                params.update(self.additional_values)
-                if self.order:
-                    str_item = ', '.join([str(make_expr(params[identifier._name])) for identifier in self.order])
-                else:
-                    str_item = ', '.join(str(make_expr(v)) for v in params.values())
-                str_list.append(f'({str_item})')
-
-            elif isinstance(value, dict):
-                params = value.copy()
-                params.update(self.additional_values)
-                if self.order:
-                    str_item = ', '.join([str(make_expr(params[identifier._name])) for identifier in self.order])
-                else:
-                    str_item = ', '.join(str(make_expr(v)) for v in params.values())
-                str_list.append(f'({str_item})')
-
-            elif isinstance(value, SequenceType):
-                str_list.append(f"({', '.join(str(make_expr(v)) for v in value)})")
+            elif isinstance(params, SequenceType):
+                str_list.append(f"({', '.join(str(make_expr(v)) for v in params)})")
 
             else:
-                str_list.append(f"({make_expr(value)})")
+                str_list.append(f"({make_expr(params)})")
 
         return f"VALUES {', '.join(str_list)}"
 
@@ -493,7 +471,7 @@ class WhereClause(Clause):
             self,
             expression: Expression,
     ):
-        self.expression = expression
+        self.expression = compile_expression(expression)
 
     def __str__(self) -> str:
         if self:
@@ -1,11 +1,16 @@
-from typing import TypedDict
+from typing import Any, Callable, TypedDict, TYPE_CHECKING
 
 import psycopg.types.json
 
+from pgcrud.converters import register_converter
 from pgcrud.optional_dependencies import is_pydantic_installed, is_msgspec_installed, msgspec_json_dumps, msgspec_json_loads
 from pgcrud.types import ValidationType
 
 
+if TYPE_CHECKING:
+    from pgcrud.instrumentation import Hook
+
+
 __all__ = [
     'ConfigDict',
     'config',
@@ -21,6 +26,7 @@ class Config:
     ):
         self._validation = validation
         self._strict = strict
+        self._hooks: list['Hook'] = []
 
     def __str__(self):
         return f'Config(validation={self.validation}, strict={self.strict})'
@@ -58,6 +64,16 @@ class Config:
     def strict(self, value: bool) -> None:
         self._strict = value
 
+    @property
+    def hooks(self) -> list['Hook']:
+        return self._hooks
+
+    def add_hook(self, hook: 'Hook') -> None:
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: 'Hook') -> None:
+        self._hooks.remove(hook)
+
     @staticmethod
     def set_json_loads(loads: psycopg.types.json.JsonLoadsFunction):
         psycopg.types.json.set_json_loads(loads)
@@ -66,6 +82,10 @@ class Config:
     def set_json_dumps(dumps: psycopg.types.json.JsonDumpsFunction):
         psycopg.types.json.set_json_dumps(dumps)
 
+    @staticmethod
+    def register_converter(type_: type, converter: Callable[[Any], Any]):
+        register_converter(type_, converter)
+
 
 class ConfigDict(TypedDict, total=False):
     validation: ValidationType
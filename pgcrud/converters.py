@@ -0,0 +1,115 @@
+import dataclasses
+from typing import Any, Callable
+
+from pgcrud.optional_dependencies import (
+    is_pydantic_model,
+    is_msgspec_model,
+    pydantic_to_dict,
+    msgspec_to_dict,
+)
+
+
+__all__ = [
+    'register_converter',
+    'get_converter',
+    'get_positional_converter',
+    'convert_params',
+]
+
+
+# Converters turn a parameter value into a dict, a sequence or a scalar. They are resolved once per type and cached,
+# so that the (abstract) model checks are not repeated for every value.
+
+registered_converters: dict[type, Callable[[Any], Any]] = {}
+converters: dict[type, Callable[[Any], Any]] = {}
+positional_converters: dict[type, Callable[[Any], Any]] = {}
+
+
+def identity(value: Any) -> Any:
+    return value
+
+
+def register_converter(type_: type, converter: Callable[[Any], Any]) -> None:
+    registered_converters[type_] = converter
+    converters.clear()
+    positional_converters.clear()
+
+
+def resolve_converter(type_: type) -> Callable[[Any], Any]:
+
+    for base in type_.__mro__:
+        if base in registered_converters:
+            return registered_converters[base]
+
+    if is_pydantic_model(type_):
+        return pydantic_to_dict
+    elif is_msgspec_model(type_):
+        return msgspec_to_dict
+    else:
+        return identity
+
+
+def get_converter(type_: type) -> Callable[[Any], Any]:
+
+    converter = converters.get(type_)
+
+    if converter is None:
+        converter = converters[type_] = resolve_converter(type_)
+
+    return converter
+
+
+# Queries with positional placeholders need a sequence. Models with a declared field order (dataclasses, pydantic and
+# msgspec models) are converted to a tuple in that order. Dicts are passed as they are, since their order does not have to
+# match the placeholders, and psycopg rejects them.
+
+def has_field_order(type_: type) -> bool:
+    return dataclasses.is_dataclass(type_) or is_pydantic_model(type_) or is_msgspec_model(type_)
+
+
+def get_field_names(type_: Any) -> tuple[str, ...]:
+    if dataclasses.is_dataclass(type_):
+        return tuple(field.name for field in dataclasses.fields(type_))
+    elif is_pydantic_model(type_):
+        return tuple(type_.model_fields)
+    else:
+        return tuple(type_.__struct_fields__)
+
+
+def resolve_positional_converter(type_: type) -> Callable[[Any], Any]:
+
+    converter = get_converter(type_)
+
+    if not has_field_order(type_):
+        return converter
+
+    # The fields are read in declaration order. Encoding the model first could omit fields (e.g. msgspec's omit_defaults)
+    # and shift the remaining values to the wrong placeholders.
+    if converter in (identity, pydantic_to_dict, msgspec_to_dict):
+        names = get_field_names(type_)
+
+        def field_converter(value: Any) -> Any:
+            return tuple(getattr(value, name) for name in names)
+
+        return field_converter
+
+    # a registered converter decides about the values itself
+    def positional_converter(value: Any) -> Any:
+        params = converter(value)
+        return tuple(params.values()) if isinstance(params, dict) else params
+
+    return positional_converter
+
+
+def get_positional_converter(type_: type) -> Callable[[Any], Any]:
+
+    converter = positional_converters.get(type_)
+
+    if converter is None:
+        converter = positional_converters[type_] = resolve_positional_converter(type_)
+
+    return converter
+
+
+def convert_params(value: Any) -> Any:
+    return get_converter(type(value))(value)
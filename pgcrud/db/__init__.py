@@ -1,6 +1,7 @@
 from pgcrud.db.connection_pool import ConnectionPool, AsyncConnectionPool
-from pgcrud.db.connection import Connection, AsyncConnection
+from pgcrud.db.connection import Connection, AsyncConnection, TypedConnection, AsyncTypedConnection
 from pgcrud.db.cursor import Cursor, ServerCursor, AsyncCursor, AsyncServerCursor
+from pgcrud.db.routing_pool import RoutingPool, AsyncRoutingPool
 
 
 __all__ = [
@@ -8,6 +9,10 @@ __all__ = [
     'ConnectionPool',
     'AsyncConnection',
     'AsyncConnectionPool',
+    'TypedConnection',
+    'AsyncTypedConnection',
+    'RoutingPool',
+    'AsyncRoutingPool',
     'Cursor',
     'ServerCursor',
     'AsyncCursor',
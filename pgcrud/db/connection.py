@@ -1,15 +1,18 @@
 # pyright: reportIncompatibleMethodOverride=false, reportIncompatibleVariableOverride=false
 
-from typing import Any, Literal, cast, overload
+from collections.abc import Sequence
+from types import TracebackType
+from typing import Any, Generic, Literal, Self, cast, overload
 
 import psycopg
 from psycopg.abc import AdaptContext, ConnParam
 from psycopg.pq.abc import PGconn
-from psycopg.rows import RowFactory, AsyncRowFactory, tuple_row
+from psycopg.rows import BaseRowFactory, RowFactory, AsyncRowFactory, tuple_row
 
 from pgcrud.config import config, ConfigDict
 from pgcrud.db.cursor import Cursor, ServerCursor, AsyncCursor, AsyncServerCursor
-from pgcrud.db.shared import get_row_factory, get_params
+from pgcrud.db.shared import get_row_factory, get_params, has_adapters_of
+from pgcrud.instrumentation import Hook
 from pgcrud.query import Query
 from pgcrud.types import ParamsType, QueryType, Row, T, ValidationType
 
@@ -17,6 +20,8 @@ from pgcrud.types import ParamsType, QueryType, Row, T, ValidationType
 __all__ = [
     'Connection',
     'AsyncConnection',
+    'TypedConnection',
+    'AsyncTypedConnection',
 ]
 
 
@@ -24,6 +29,8 @@ class Connection(psycopg.Connection[Row]):
 
     cursor_factory: type[Cursor[Row]]
     server_cursor_factory: type[ServerCursor[Row]]
+    hooks: Sequence[Hook] = ()
+    max_idle_cursors: int = 4
 
     def __init__(
         self,
@@ -32,11 +39,32 @@ class Connection(psycopg.Connection[Row]):
         super().__init__(pgconn, cast(RowFactory[Row], tuple_row))
         self.cursor_factory = Cursor
         self.server_cursor_factory = ServerCursor
+        self._idle_cursors: list[Cursor[Any]] = []
 
-    def __getitem__(self, item: type[T] | tuple[type[T], ConfigDict]) -> 'Connection[T]':
+    def __getitem__(self, item: type[T] | tuple[type[T], ConfigDict]) -> 'TypedConnection[T]':
         row_type, validate, strict = get_params(item)
-        self.row_factory = get_row_factory(row_type, validate, strict)  # type: ignore
-        return self  # type: ignore
+        return TypedConnection(self, get_row_factory(row_type, validate, strict))
+
+    def _acquire_cursor(self, row_factory: BaseRowFactory[T]) -> Cursor[T]:
+
+        # the operations reuse the cursors of a connection instead of constructing one per statement
+        try:
+            cursor = self._idle_cursors.pop()
+        except IndexError:
+            return self.cursor(row_factory=row_factory)
+
+        if not has_adapters_of(cursor, self):
+            # adapters were registered on the connection after the idle cursors were created
+            self._idle_cursors.clear()
+            return self.cursor(row_factory=row_factory)
+
+        cursor.row_factory = row_factory  # type: ignore
+        return cursor
+
+    def _release_cursor(self, cursor: Cursor[Any]) -> None:
+        if not cursor.closed and len(self._idle_cursors) < self.max_idle_cursors:
+            cursor._reset()
+            self._idle_cursors.append(cursor)
 
     @classmethod
     def connect(
@@ -66,21 +94,28 @@ class Connection(psycopg.Connection[Row]):
     def cursor(  # noqa
             self,
             name: Literal[""] = "",
+            *,
+            row_factory: BaseRowFactory[Any] | None = None,
     ) -> Cursor[Row]: ...
 
     @overload
     def cursor(  # noqa
             self,
             name: str,
+            *,
+            row_factory: BaseRowFactory[Any] | None = None,
     ) -> ServerCursor[Row]: ...
 
     def cursor(  # noqa
         self,
         name: str = "",
-    ) -> Cursor[Row] | ServerCursor[Row]:
+        *,
+        row_factory: BaseRowFactory[Any] | None = None,
+    ) -> Cursor[Any] | ServerCursor[Any]:
 
         return super().cursor(
             name=name,
+            row_factory=row_factory,  # type: ignore
         )  # type: ignore
 
     def execute(
@@ -104,6 +139,8 @@ class AsyncConnection(psycopg.AsyncConnection[Row]):
 
     cursor_factory: type[AsyncCursor[Row]]
     server_cursor_factory: type[AsyncServerCursor[Row]]
+    hooks: Sequence[Hook] = ()
+    max_idle_cursors: int = 4
 
     def __init__(
         self,
@@ -112,11 +149,32 @@ class AsyncConnection(psycopg.AsyncConnection[Row]):
         super().__init__(pgconn, cast(AsyncRowFactory[Row], tuple_row))
         self.cursor_factory = AsyncCursor
         self.server_cursor_factory = AsyncServerCursor
+        self._idle_cursors: list[AsyncCursor[Any]] = []
 
-    def __getitem__(self, item: type[T] | tuple[type[T], ConfigDict]) -> 'AsyncConnection[T]':
+    def __getitem__(self, item: type[T] | tuple[type[T], ConfigDict]) -> 'AsyncTypedConnection[T]':
         row_type, validate, strict = get_params(item)
-        self.row_factory = get_row_factory(row_type, validate, strict)  # type: ignore
-        return self  # type: ignore
+        return AsyncTypedConnection(self, get_row_factory(row_type, validate, strict))
+
+    def _acquire_cursor(self, row_factory: BaseRowFactory[T]) -> AsyncCursor[T]:
+
+        # the operations reuse the cursors of a connection instead of constructing one per statement
+        try:
+            cursor = self._idle_cursors.pop()
+        except IndexError:
+            return self.cursor(row_factory=row_factory)
+
+        if not has_adapters_of(cursor, self):
+            # adapters were registered on the connection after the idle cursors were created
+            self._idle_cursors.clear()
+            return self.cursor(row_factory=row_factory)
+
+        cursor.row_factory = row_factory  # type: ignore
+        return cursor
+
+    def _release_cursor(self, cursor: AsyncCursor[Any]) -> None:
+        if not cursor.closed and len(self._idle_cursors) < self.max_idle_cursors:
+            cursor._reset()
+            self._idle_cursors.append(cursor)
 
     @classmethod
     async def connect(
@@ -146,21 +204,28 @@ class AsyncConnection(psycopg.AsyncConnection[Row]):
     def cursor(  # noqa
             self,
             name: Literal[""] = "",
+            *,
+            row_factory: BaseRowFactory[Any] | None = None,
     ) -> AsyncCursor[Row]: ...
 
     @overload
     def cursor(  # noqa
             self,
             name: str,
+            *,
+            row_factory: BaseRowFactory[Any] | None = None,
     ) -> AsyncServerCursor[Row]: ...
 
     def cursor(  # noqa
         self,
         name: str = "",
-    ) -> AsyncCursor[Row] | AsyncServerCursor[Row]:
+        *,
+        row_factory: BaseRowFactory[Any] | None = None,
+    ) -> AsyncCursor[Any] | AsyncServerCursor[Any]:
 
         return super().cursor(
             name=name,
+            row_factory=row_factory,  # type: ignore
         )  # type: ignore
 
     async def execute(
@@ -178,3 +243,132 @@ class AsyncConnection(psycopg.AsyncConnection[Row]):
             prepare=prepare,
             binary=binary,
         )  # type: ignore
+
+
+class TypedConnection(Generic[T]):
+
+    # A view of a connection with its own row factory. Unlike a typed cursor, it does not change the connection, so a
+    # connection shared between threads can run differently typed queries at the same time.
+    __slots__ = ('connection', 'row_factory')
+
+    def __init__(
+        self,
+        connection: Connection[Any],
+        row_factory: BaseRowFactory[T],
+    ):
+        self.connection = connection
+        self.row_factory = row_factory
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.connection, name)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.connection!r})'
+
+    # special methods are looked up on the type, so __getattr__ does not forward them
+    def __enter__(self) -> Self:
+        self.connection.__enter__()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None) -> None:
+        self.connection.__exit__(exc_type, exc_val, exc_tb)
+
+    @overload
+    def cursor(  # noqa
+            self,
+            name: Literal[""] = "",
+    ) -> Cursor[T]: ...
+
+    @overload
+    def cursor(  # noqa
+            self,
+            name: str,
+    ) -> ServerCursor[T]: ...
+
+    def cursor(  # noqa
+        self,
+        name: str = "",
+    ) -> Cursor[T] | ServerCursor[T]:
+
+        return self.connection.cursor(name, row_factory=self.row_factory)  # type: ignore
+
+    def execute(
+        self,
+        query: QueryType,
+        params: ParamsType | None = None,
+        *,
+        prepare: bool | None = None,
+        binary: bool = False,
+    ) -> Cursor[T]:
+
+        cursor = self.cursor()
+        if binary:
+            cursor.format = psycopg.pq.Format.BINARY
+
+        try:
+            return cursor.execute(query, params, prepare=prepare)
+        except psycopg.Error as ex:
+            raise ex.with_traceback(None)
+
+
+class AsyncTypedConnection(Generic[T]):
+
+    __slots__ = ('connection', 'row_factory')
+
+    def __init__(
+        self,
+        connection: AsyncConnection[Any],
+        row_factory: BaseRowFactory[T],
+    ):
+        self.connection = connection
+        self.row_factory = row_factory
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.connection, name)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.connection!r})'
+
+    async def __aenter__(self) -> Self:
+        await self.connection.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None) -> None:
+        await self.connection.__aexit__(exc_type, exc_val, exc_tb)
+
+    @overload
+    def cursor(  # noqa
+            self,
+            name: Literal[""] = "",
+    ) -> AsyncCursor[T]: ...
+
+    @overload
+    def cursor(  # noqa
+            self,
+            name: str,
+    ) -> AsyncServerCursor[T]: ...
+
+    def cursor(  # noqa
+        self,
+        name: str = "",
+    ) -> AsyncCursor[T] | AsyncServerCursor[T]:
+
+        return self.connection.cursor(name, row_factory=self.row_factory)  # type: ignore
+
+    async def execute(
+        self,
+        query: QueryType,
+        params: ParamsType | None = None,
+        *,
+        prepare: bool | None = None,
+        binary: bool = False,
+    ) -> AsyncCursor[T]:
+
+        cursor = self.cursor()
+        if binary:
+            cursor.format = psycopg.pq.Format.BINARY
+
+        try:
+            return await cursor.execute(query, params, prepare=prepare)
+        except psycopg.Error as ex:
+            raise ex.with_traceback(None)
@@ -1,12 +1,17 @@
 # pyright: reportIncompatibleMethodOverride=false, reportIncompatibleVariableOverride=false
 from __future__ import annotations
 
+from collections.abc import Sequence
 from contextlib import contextmanager, asynccontextmanager
 from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
 
 import psycopg_pool
+from psycopg.sql import SQL, Identifier
 
 from pgcrud.db.connection import Connection, AsyncConnection
+from pgcrud.db.pool_metrics import PoolMetrics
+from pgcrud.db.warmup import Warmup
+from pgcrud.instrumentation import Hook
 from pgcrud.types import Row
 
 
@@ -39,7 +44,17 @@ class ConnectionPool(psycopg_pool.ConnectionPool[Row]):  # type: ignore
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: Callable[['ConnectionPool[Row]'], None] | None = None,
         num_workers: int = 3,
+        hooks: Sequence[Hook] | None = None,
+        leak_threshold: float | None = None,
+        warmup: Warmup | None = None,
+        search_path: str | Sequence[str] | None = None,
     ):
+        self.hooks = list(hooks or [])
+        self.warmup = warmup
+        self.search_path = search_path
+        self.metrics = PoolMetrics(leak_threshold)
+        self._user_configure = configure
+
         super().__init__(
             conninfo=conninfo,
             connection_class=Connection,  # type: ignore
@@ -47,7 +62,7 @@ class ConnectionPool(psycopg_pool.ConnectionPool[Row]):  # type: ignore
             min_size=min_size,
             max_size=max_size,
             open=open,
-            configure=configure,  # type: ignore
+            configure=self._configure_connection,  # type: ignore
             check=check,  # type: ignore
             reset=reset,  # type: ignore
             name=name,
@@ -60,17 +75,57 @@ class ConnectionPool(psycopg_pool.ConnectionPool[Row]):  # type: ignore
             num_workers=num_workers,
         )
 
+    def _configure_connection(self, conn: Connection[Row]) -> None:
+        conn.hooks = self.hooks
+        if self.search_path:
+            # set once per connection and committed, so that a rollback does not reset it
+            conn.execute(get_set_search_path_query(self.search_path))
+            if not conn.autocommit:
+                conn.commit()
+        if self._user_configure:
+            self._user_configure(conn)
+        if self.warmup:
+            self.warmup.run(conn)
+
+    def connect(self) -> Connection[Row]:
+        # a connection configured like the pooled ones, which the pool does not manage
+        conn = self.connection_class.connect(self.conninfo, **(self.kwargs or {}))
+        self._configure_connection(conn)
+        return conn
+
     @contextmanager
     def connection(self, timeout: float | None = None) -> Iterator[Connection[Row]]:
         with super().connection(timeout=timeout) as conn:
             yield conn  # type: ignore
 
     def getconn(self, timeout: float | None = None) -> Connection[Row]:
-        return super().getconn(timeout)  # type: ignore
+
+        start = self.metrics.start_wait()
+
+        try:
+            conn = super().getconn(timeout)
+        except BaseException:
+            self.metrics.end_wait(start, None)
+            raise
+
+        self.metrics.end_wait(start, conn)
+        return conn  # type: ignore
 
     def putconn(self, conn: Connection[Row]) -> None:
+        self.metrics.checkin(conn)
         super().putconn(conn)  # type: ignore
 
+    def close(self, timeout: float = 5.0) -> None:
+        super().close(timeout)
+        self.metrics.stop_reaper()
+
+    # psycopg_pool offers no public hook to tell whether a caller is queued, this is where it decides
+    def _get_ready_connection(self, timeout: float | None) -> Connection[Row] | None:
+        conn = super()._get_ready_connection(timeout)  # type: ignore
+        if conn is None:
+            self.metrics.block()
+        return conn
+
     @staticmethod
     def check_connection(conn: Connection[Row]) -> None:
         psycopg_pool.ConnectionPool.check_connection(conn)  # type: ignore
@@ -99,7 +154,17 @@ class AsyncConnectionPool(psycopg_pool.AsyncConnectionPool[Row]):  # type: ignor
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: Callable[['AsyncConnectionPool[Row]'], Awaitable[None]] | None = None,
         num_workers: int = 3,
+        hooks: Sequence[Hook] | None = None,
+        leak_threshold: float | None = None,
+        warmup: Warmup | None = None,
+        search_path: str | Sequence[str] | None = None,
     ):
+        self.hooks = list(hooks or [])
+        self.warmup = warmup
+        self.search_path = search_path
+        self.metrics = PoolMetrics(leak_threshold)
+        self._user_configure = configure
+
         super().__init__(
             conninfo=conninfo,
             connection_class=AsyncConnection,  # type: ignore
@@ -107,7 +172,7 @@ class AsyncConnectionPool(psycopg_pool.AsyncConnectionPool[Row]):  # type: ignor
             min_size=min_size,
             max_size=max_size,
             open=open,
-            configure=configure,  # type: ignore
+            configure=self._configure_connection,  # type: ignore
             check=check,  # type: ignore
             reset=reset,  # type: ignore
             name=name,
@@ -120,17 +185,59 @@ class AsyncConnectionPool(psycopg_pool.AsyncConnectionPool[Row]):  # type: ignor
             num_workers=num_workers,
         )
 
+    async def _configure_connection(self, conn: AsyncConnection[Row]) -> None:
+        conn.hooks = self.hooks
+        if self.search_path:
+            await conn.execute(get_set_search_path_query(self.search_path))
+            if not conn.autocommit:
+                await conn.commit()
+        if self._user_configure:
+            await self._user_configure(conn)
+        if self.warmup:
+            await self.warmup.async_run(conn)
+
+    async def connect(self) -> AsyncConnection[Row]:
+        conn = await self.connection_class.connect(self.conninfo, **(self.kwargs or {}))
+        await self._configure_connection(conn)
+        return conn
+
     @asynccontextmanager
     async def connection(self, timeout: float | None = None) -> AsyncIterator[AsyncConnection[Row]]:
         async with super().connection(timeout=timeout) as conn:
             yield conn  # type: ignore
 
     async def getconn(self, timeout: float | None = None) -> AsyncConnection[Row]:
-        return await super().getconn(timeout)  # type: ignore
+
+        start = self.metrics.start_wait()
+
+        try:
+            conn = await super().getconn(timeout)
+        except BaseException:
+            self.metrics.end_wait(start, None)
+            raise
+
+        self.metrics.end_wait(start, conn)
+        return conn  # type: ignore
 
     async def putconn(self, conn: AsyncConnection[Row]) -> None:
+        self.metrics.checkin(conn)
         await super().putconn(conn)  # type: ignore
 
+    async def close(self, timeout: float = 5.0) -> None:
+        await super().close(timeout)
+        self.metrics.stop_reaper()
+
+    async def _get_ready_connection(self, timeout: float | None) -> AsyncConnection[Row] | None:
+        conn = await super()._get_ready_connection(timeout)  # type: ignore
+        if conn is None:
+            self.metrics.block()
+        return conn
+
     @staticmethod
     async def check_connection(conn: AsyncConnection[Row]) -> None:
         await psycopg_pool.AsyncConnectionPool.check_connection(conn)  # type: ignore
+
+
+def get_set_search_path_query(search_path: str | Sequence[str]) -> SQL:
+    schemas = [search_path] if isinstance(search_path, str) else search_path
+    return SQL('SET search_path TO {}').format(SQL(', ').join([Identifier(schema) for schema in schemas]))  # type: ignore
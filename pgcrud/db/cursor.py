@@ -1,11 +1,12 @@
 # pyright: reportIncompatibleMethodOverride=false, reportIncompatibleVariableOverride=false
 
-from typing import Any, Iterable, Iterator, Sequence, AsyncIterator
+from typing import Any, Iterable, Iterator, AsyncIterator
 
 import psycopg
 
 from pgcrud.config import ConfigDict
-from pgcrud.db.shared import deserialize_params, get_params, get_row_factory
+from pgcrud.db.shared import deserialize_params, deserialize_params_seq, get_params, get_row_factory
+from pgcrud.instrumentation import Instrumentation, count_params, get_hooks, instrument_stream, async_instrument_stream
 from pgcrud.query import Query
 from pgcrud.types import ParamsType, QueryType, Row, T
 
@@ -37,26 +38,50 @@ class Cursor(psycopg.Cursor[Row]):
         binary: bool | None = None,
     ) -> 'Cursor[Row]':
 
-        return super().execute(
-            query=str(query) if isinstance(query, Query) else query,  # type: ignore
-            params=deserialize_params(params),
-            prepare=prepare,
-            binary=binary,
-        )
+        query = str(query) if isinstance(query, Query) else query  # type: ignore
+        params = deserialize_params(params)
+        hooks = get_hooks(self)
+
+        if hooks:
+            with Instrumentation(hooks, self, query, params):
+                return super().execute(
+                    query=query,
+                    params=params,
+                    prepare=prepare,
+                    binary=binary,
+                )
+        else:
+            return super().execute(
+                query=query,
+                params=params,
+                prepare=prepare,
+                binary=binary,
+            )
 
     def executemany(
         self,
         query: QueryType,
-        params_seq: Sequence[ParamsType],
+        params_seq: Iterable[ParamsType],
         *,
         returning: bool = False
     ) -> None:
 
-        super().executemany(
-            query=str(query) if isinstance(query, Query) else query,  # type: ignore
-            params_seq=[deserialize_params(params) for params in params_seq],
-            returning=returning,
-        )
+        query = str(query) if isinstance(query, Query) else query  # type: ignore
+        hooks = get_hooks(self)
+
+        if hooks:
+            with Instrumentation(hooks, self, query, None, 0) as event:
+                super().executemany(
+                    query=query,
+                    params_seq=count_params(event, deserialize_params_seq(query, params_seq)),
+                    returning=returning,
+                )
+        else:
+            super().executemany(
+                query=query,
+                params_seq=deserialize_params_seq(query, params_seq),
+                returning=returning,
+            )
 
     def stream(
         self,
@@ -67,13 +92,22 @@ class Cursor(psycopg.Cursor[Row]):
         size: int = 1,
     ) -> Iterator[Row]:
 
-        return super().stream(
-            query=str(query) if isinstance(query, Query) else query,  # type: ignore
-            params=deserialize_params(params),
+        query = str(query) if isinstance(query, Query) else query  # type: ignore
+        params = deserialize_params(params)
+        hooks = get_hooks(self)
+
+        iterator = super().stream(
+            query=query,
+            params=params,
             binary=binary,
             size=size,
         )
 
+        if hooks:
+            return instrument_stream(Instrumentation(hooks, self, query, params), iterator)
+        else:
+            return iterator
+
 
 class ServerCursor(psycopg.ServerCursor[Row]):
 
@@ -95,12 +129,25 @@ class ServerCursor(psycopg.ServerCursor[Row]):
         **kwargs: Any,
     ) -> 'ServerCursor[Row]':
 
-        return super().execute(
-            query=str(query) if isinstance(query, Query) else query,  # type: ignore
-            params=deserialize_params(params),
-            binary=binary,
-            **kwargs,
-        )
+        query = str(query) if isinstance(query, Query) else query  # type: ignore
+        params = deserialize_params(params)
+        hooks = get_hooks(self)
+
+        if hooks:
+            with Instrumentation(hooks, self, query, params):
+                return super().execute(
+                    query=query,
+                    params=params,
+                    binary=binary,
+                    **kwargs,
+                )
+        else:
+            return super().execute(
+                query=query,
+                params=params,
+                binary=binary,
+                **kwargs,
+            )
 
     def executemany(
         self,
@@ -110,11 +157,22 @@ class ServerCursor(psycopg.ServerCursor[Row]):
         returning: bool = True,
     ) -> None:
 
-        super().executemany(
-            query=str(query) if isinstance(query, Query) else query,  # type: ignore
-            params_seq=[deserialize_params(params) for params in params_seq],
-            returning=returning,
-        )
+        query = str(query) if isinstance(query, Query) else query  # type: ignore
+        hooks = get_hooks(self)
+
+        if hooks:
+            with Instrumentation(hooks, self, query, None, 0) as event:
+                super().executemany(
+                    query=query,
+                    params_seq=count_params(event, deserialize_params_seq(query, params_seq)),
+                    returning=returning,
+                )
+        else:
+            super().executemany(
+                query=query,
+                params_seq=deserialize_params_seq(query, params_seq),
+                returning=returning,
+            )
 
     def stream(
         self,
@@ -125,13 +183,22 @@ class ServerCursor(psycopg.ServerCursor[Row]):
         size: int = 1,
     ) -> Iterator[Row]:
 
-        return super().stream(
-            query=str(query) if isinstance(query, Query) else query,  # type: ignore
-            params=deserialize_params(params),
+        query = str(query) if isinstance(query, Query) else query  # type: ignore
+        params = deserialize_params(params)
+        hooks = get_hooks(self)
+
+        iterator = super().stream(
+            query=query,
+            params=params,
             binary=binary,
             size=size,
         )
 
+        if hooks:
+            return instrument_stream(Instrumentation(hooks, self, query, params), iterator)
+        else:
+            return iterator
+
 
 class AsyncCursor(psycopg.AsyncCursor[Row]):
 
@@ -149,12 +216,25 @@ class AsyncCursor(psycopg.AsyncCursor[Row]):
         binary: bool | None = None,
     ) -> 'AsyncCursor[Row]':
 
-        return await super().execute(
-            query=str(query) if isinstance(query, Query) else query,  # type: ignore
-            params=deserialize_params(params),
-            prepare=prepare,
-            binary=binary,
-        )
+        query = str(query) if isinstance(query, Query) else query  # type: ignore
+        params = deserialize_params(params)
+        hooks = get_hooks(self)
+
+        if hooks:
+            with Instrumentation(hooks, self, query, params):
+                return await super().execute(
+                    query=query,
+                    params=params,
+                    prepare=prepare,
+                    binary=binary,
+                )
+        else:
+            return await super().execute(
+                query=query,
+                params=params,
+                prepare=prepare,
+                binary=binary,
+            )
 
     async def executemany(
         self,
@@ -164,11 +244,22 @@ class AsyncCursor(psycopg.AsyncCursor[Row]):
         returning: bool = False,
     ) -> None:
 
-        await super().executemany(
-            query=str(query) if isinstance(query, Query) else query,  # type: ignore
-            params_seq=[deserialize_params(params) for params in params_seq],
-            returning=returning,
-        )
+        query = str(query) if isinstance(query, Query) else query  # type: ignore
+        hooks = get_hooks(self)
+
+        if hooks:
+            with Instrumentation(hooks, self, query, None, 0) as event:
+                await super().executemany(
+                    query=query,
+                    params_seq=count_params(event, deserialize_params_seq(query, params_seq)),
+                    returning=returning,
+                )
+        else:
+            await super().executemany(
+                query=query,
+                params_seq=deserialize_params_seq(query, params_seq),
+                returning=returning,
+            )
 
     async def stream(
         self,
@@ -179,13 +270,22 @@ class AsyncCursor(psycopg.AsyncCursor[Row]):
         size: int = 1,
     ) -> AsyncIterator[Row]:
 
-        return super().stream(
-            query=str(query) if isinstance(query, Query) else query,  # type: ignore
-            params=deserialize_params(params),
+        query = str(query) if isinstance(query, Query) else query  # type: ignore
+        params = deserialize_params(params)
+        hooks = get_hooks(self)
+
+        iterator = super().stream(
+            query=query,
+            params=params,
             binary=binary,
             size=size,
         )
 
+        if hooks:
+            return async_instrument_stream(Instrumentation(hooks, self, query, params), iterator)
+        else:
+            return iterator
+
 
 class AsyncServerCursor(psycopg.AsyncServerCursor[Row]):
 
@@ -203,12 +303,25 @@ class AsyncServerCursor(psycopg.AsyncServerCursor[Row]):
         **kwargs: Any,
     ) -> 'AsyncServerCursor[Row]':
 
-        return await super().execute(
-            query=str(query) if isinstance(query, Query) else query,  # type: ignore
-            params=deserialize_params(params),
-            binary=binary,
-            **kwargs,
-        )
+        query = str(query) if isinstance(query, Query) else query  # type: ignore
+        params = deserialize_params(params)
+        hooks = get_hooks(self)
+
+        if hooks:
+            with Instrumentation(hooks, self, query, params):
+                return await super().execute(
+                    query=query,
+                    params=params,
+                    binary=binary,
+                    **kwargs,
+                )
+        else:
+            return await super().execute(
+                query=query,
+                params=params,
+                binary=binary,
+                **kwargs,
+            )
 
     async def executemany(
         self,
@@ -218,11 +331,22 @@ class AsyncServerCursor(psycopg.AsyncServerCursor[Row]):
         returning: bool = True,
     ) -> None:
 
-        await super().executemany(
-            query=str(query) if isinstance(query, Query) else query,  # type: ignore
-            params_seq=[deserialize_params(params) for params in params_seq],
-            returning=returning,
-        )
+        query = str(query) if isinstance(query, Query) else query  # type: ignore
+        hooks = get_hooks(self)
+
+        if hooks:
+            with Instrumentation(hooks, self, query, None, 0) as event:
+                await super().executemany(
+                    query=query,
+                    params_seq=count_params(event, deserialize_params_seq(query, params_seq)),
+                    returning=returning,
+                )
+        else:
+            await super().executemany(
+                query=query,
+                params_seq=deserialize_params_seq(query, params_seq),
+                returning=returning,
+            )
 
     async def stream(
         self,
@@ -233,9 +357,18 @@ class AsyncServerCursor(psycopg.AsyncServerCursor[Row]):
         size: int = 1,
     ) -> AsyncIterator[Row]:
 
-        return super().stream(
-            query=str(query) if isinstance(query, Query) else query,  # type: ignore
-            params=deserialize_params(params),
+        query = str(query) if isinstance(query, Query) else query  # type: ignore
+        params = deserialize_params(params)
+        hooks = get_hooks(self)
+
+        iterator = super().stream(
+            query=query,
+            params=params,
             binary=binary,
             size=size,
         )
+
+        if hooks:
+            return async_instrument_stream(Instrumentation(hooks, self, query, params), iterator)
+        else:
+            return iterator
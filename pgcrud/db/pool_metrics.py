@@ -0,0 +1,181 @@
+from contextvars import ContextVar
+import logging
+from threading import Event, Lock, Thread
+import time
+import traceback
+from typing import Any
+
+from pgcrud.metrics import LatencyHistogram
+
+
+__all__ = [
+    'Checkout',
+    'PoolMetrics',
+]
+
+
+logger = logging.getLogger('pgcrud.pool')
+
+# whether the current checkout had to wait in the queue of the pool, set per thread or task
+blocked: ContextVar[bool] = ContextVar('blocked', default=False)
+
+
+class Checkout:
+
+    __slots__ = ('connection_id', 'start', 'stack', 'reported')
+
+    def __init__(self, connection_id: int, start: float, stack: str | None):
+        self.connection_id = connection_id
+        self.start = start
+        self.stack = stack
+        self.reported = False
+
+    def __str__(self):
+        return f'Checkout(connection_id={self.connection_id}, held_for={self.held_for:.3f})'
+
+    def __repr__(self):
+        return str(self)
+
+    @property
+    def held_for(self) -> float:
+        return time.perf_counter() - self.start
+
+
+class PoolMetrics:
+
+    def __init__(self, leak_threshold: float | None = None):
+        self.leak_threshold = leak_threshold
+        self.wait = LatencyHistogram()
+        self.hold = LatencyHistogram()
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.errors = 0
+        self.leaks_reported = 0
+        self._checkouts: dict[int, Checkout] = {}
+        self._reaper: tuple[Thread, Event] | None = None
+        self._lock = Lock()
+
+    def start_wait(self) -> float:
+        blocked.set(False)
+        return time.perf_counter()
+
+    def block(self) -> None:
+
+        # Only called when no connection is ready, so callers served right away are not counted as waiting. A getconn
+        # can ask for a ready connection again after a failed check, but it is counted once.
+        if blocked.get():
+            return
+
+        blocked.set(True)
+
+        with self._lock:
+            self.waiting += 1
+            self.peak_waiting = max(self.peak_waiting, self.waiting)
+
+    def end_wait(self, start: float, conn: Any | None) -> None:
+
+        now = time.perf_counter()
+
+        # the stack is only captured with leak detection, extracting it on every checkout is not for free
+        stack = ''.join(traceback.format_stack()[:-1]) if conn is not None and self.leak_threshold is not None else None
+
+        with self._lock:
+            if blocked.get():
+                self.waiting -= 1
+            self.wait.record(now - start)
+
+            if conn is None:
+                self.errors += 1
+            else:
+                self._checkouts[id(conn)] = Checkout(id(conn), now, stack)
+                self.in_use += 1
+                self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+        if self.leak_threshold is not None and self._reaper is None:
+            self.start_reaper()
+
+    def checkin(self, conn: Any) -> None:
+
+        with self._lock:
+            checkout = self._checkouts.pop(id(conn), None)
+
+            if checkout is not None:
+                self.in_use -= 1
+                self.hold.record(time.perf_counter() - checkout.start)
+
+    def leaks(self) -> list[Checkout]:
+
+        if self.leak_threshold is None:
+            return []
+
+        with self._lock:
+            return [checkout for checkout in self._checkouts.values() if checkout.held_for > self.leak_threshold]
+
+    def report_leaks(self) -> None:
+
+        for checkout in self.leaks():
+            if not checkout.reported:
+                checkout.reported = True
+                self.leaks_reported += 1
+                logger.warning(
+                    'Connection %s has been held for %.3fs, it was checked out at:\n%s',
+                    checkout.connection_id,
+                    checkout.held_for,
+                    checkout.stack,
+                )
+
+    def start_reaper(self) -> None:
+
+        # A leak is reported by a background thread, so that it is noticed even if the pool is idle afterward. It is
+        # started with the first checkout and stopped when the pool is closed.
+        with self._lock:
+            if self._reaper is not None or self.leak_threshold is None:
+                return
+
+            stop_event = Event()
+            thread = Thread(target=self._reap, args=(stop_event, self.leak_threshold), name='pgcrud-pool-leaks', daemon=True)
+            self._reaper = thread, stop_event
+
+        thread.start()
+
+    def stop_reaper(self) -> None:
+
+        with self._lock:
+            reaper, self._reaper = self._reaper, None
+
+        if reaper is not None:
+            thread, stop_event = reaper
+            stop_event.set()
+            thread.join()
+
+    def _reap(self, stop_event: Event, interval: float) -> None:
+        while not stop_event.wait(interval):
+            self.report_leaks()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.wait = LatencyHistogram()
+            self.hold = LatencyHistogram()
+            self.peak_in_use = self.in_use
+            self.peak_waiting = self.waiting
+            self.errors = 0
+            self.leaks_reported = 0
+
+    def snapshot(self, percentiles: tuple[float, ...] = (50, 90, 99)) -> dict[str, Any]:
+        with self._lock:
+            return {
+                'in_use': self.in_use,
+                'peak_in_use': self.peak_in_use,
+                'waiting': self.waiting,
+                'peak_waiting': self.peak_waiting,
+                'errors': self.errors,
+                'leaks_reported': self.leaks_reported,
+                'wait_count': self.wait.count,
+                'wait_max': self.wait.max,
+                **{f'wait_p{percentile:g}': self.wait.percentile(percentile) for percentile in percentiles},
+                'hold_count': self.hold.count,
+                'hold_max': self.hold.max,
+                **{f'hold_p{percentile:g}': self.hold.percentile(percentile) for percentile in percentiles},
+            }
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from contextlib import AsyncExitStack, ExitStack, contextmanager, asynccontextmanager
+from contextvars import ContextVar
+import itertools
+import logging
+import time
+from types import TracebackType
+from typing import Any, AsyncIterator, Generic, Iterator, Literal, Self, TypeVar
+
+from psycopg import OperationalError
+from psycopg_pool import PoolTimeout
+
+from pgcrud.db.connection import Connection, AsyncConnection
+from pgcrud.db.connection_pool import ConnectionPool, AsyncConnectionPool
+from pgcrud.instrumentation import operation
+from pgcrud.types import Row
+
+
+__all__ = [
+    'LAG_QUERY',
+    'Replica',
+    'RoutingPool',
+    'AsyncRoutingPool',
+]
+
+
+# a replica which has replayed everything it received is not lagging, even if the primary has not written for a while
+LAG_QUERY = (
+    'SELECT CASE WHEN pg_last_wal_receive_lsn() IS NULL OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+    'ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END'
+)
+
+logger = logging.getLogger('pgcrud.pool')
+
+P = TypeVar('P', ConnectionPool[Any], AsyncConnectionPool[Any])
+
+
+class Replica(Generic[P]):
+
+    __slots__ = ('pool', 'lag', 'checked_at')
+
+    def __init__(self, pool: P):
+        self.pool = pool
+        self.lag = 0.0
+        self.checked_at = float('-inf')
+
+    def __str__(self):
+        return f'Replica(pool={self.pool.name}, lag={self.lag})'
+
+    def __repr__(self):
+        return str(self)
+
+    @property
+    def in_use(self) -> int:
+        return self.pool.metrics.in_use
+
+
+class BaseRoutingPool(Generic[P]):
+
+    def __init__(
+            self,
+            primary: P,
+            replicas: list[P],
+            *,
+            strategy: Literal['round_robin', 'least_busy'] = 'round_robin',
+            read_your_writes: float = 1.0,
+            max_lag: float | None = None,
+            lag_check_interval: float = 5.0,
+    ):
+        if strategy not in ('round_robin', 'least_busy'):
+            raise ValueError(f'Unknown strategy {strategy}.')
+
+        self.primary = primary
+        self.replicas = [Replica(replica) for replica in replicas]
+        self.strategy = strategy
+        self.read_your_writes = read_your_writes
+        self.max_lag = max_lag
+        self.lag_check_interval = lag_check_interval
+        self._counter = itertools.count()
+        self._last_write: ContextVar[float] = ContextVar(f'pgcrud_last_write_{id(self)}', default=float('-inf'))
+
+    def mark_write(self) -> None:
+        self._last_write.set(time.monotonic())
+
+    def reads_own_writes(self) -> bool:
+        return time.monotonic() - self._last_write.get() < self.read_your_writes
+
+    def get_candidates(self) -> list[Replica[P]]:
+
+        if not self.replicas or self.reads_own_writes():
+            return []
+
+        n = next(self._counter) % len(self.replicas)
+        replicas = self.replicas[n:] + self.replicas[:n]
+
+        if self.strategy == 'least_busy':
+            replicas.sort(key=lambda replica: replica.in_use)
+
+        if self.max_lag is None:
+            return replicas
+        else:
+            # replicas known to be lagging are skipped until their lag is checked again
+            now = time.monotonic()
+            return [
+                replica for replica in replicas
+                if replica.lag <= self.max_lag or now - replica.checked_at >= self.lag_check_interval
+            ]
+
+    def needs_lag_check(self, replica: Replica[P]) -> bool:
+        return self.max_lag is not None and time.monotonic() - replica.checked_at >= self.lag_check_interval
+
+    def set_lag(self, replica: Replica[P], lag: Any) -> bool:
+        replica.lag = float(lag or 0.0)
+        replica.checked_at = time.monotonic()
+        return replica.lag <= self.max_lag  # type: ignore
+
+
+class RoutingPool(BaseRoutingPool[ConnectionPool[Any]]):
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def open(self, wait: bool = False, timeout: float = 30.0) -> None:
+        for pool in [self.primary, *(replica.pool for replica in self.replicas)]:
+            pool.open(wait, timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        for pool in [self.primary, *(replica.pool for replica in self.replicas)]:
+            pool.close(timeout)
+
+    @contextmanager
+    def connection(self, timeout: float | None = None) -> Iterator[Connection[Row]]:
+
+        with self.primary.connection(timeout) as conn:
+            yield conn
+
+        self.mark_write()
+
+    @contextmanager
+    def read_connection(self, timeout: float | None = None) -> Iterator[Connection[Row]]:
+
+        for replica in self.get_candidates():
+            with ExitStack() as stack:
+                # an unavailable replica is skipped, only errors while getting the connection are retried
+                try:
+                    conn = stack.enter_context(replica.pool.connection(timeout))
+                    if self.needs_lag_check(replica) and not self.set_lag(replica, check_lag(conn)):
+                        continue
+                except (PoolTimeout, OperationalError):
+                    log_unavailable(replica)
+                    continue
+                yield conn
+                return
+
+        with self.primary.connection(timeout) as conn:
+            yield conn
+
+
+class AsyncRoutingPool(BaseRoutingPool[AsyncConnectionPool[Any]]):
+
+    async def __aenter__(self) -> Self:
+        await self.open()
+        return self
+
+    async def __aexit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def open(self, wait: bool = False, timeout: float = 30.0) -> None:
+        for pool in [self.primary, *(replica.pool for replica in self.replicas)]:
+            await pool.open(wait, timeout)
+
+    async def close(self, timeout: float = 5.0) -> None:
+        for pool in [self.primary, *(replica.pool for replica in self.replicas)]:
+            await pool.close(timeout)
+
+    @asynccontextmanager
+    async def connection(self, timeout: float | None = None) -> AsyncIterator[AsyncConnection[Row]]:
+
+        async with self.primary.connection(timeout) as conn:
+            yield conn
+
+        self.mark_write()
+
+    @asynccontextmanager
+    async def read_connection(self, timeout: float | None = None) -> AsyncIterator[AsyncConnection[Row]]:
+
+        for replica in self.get_candidates():
+            async with AsyncExitStack() as stack:
+                try:
+                    conn = await stack.enter_async_context(replica.pool.connection(timeout))
+                    if self.needs_lag_check(replica) and not self.set_lag(replica, await async_check_lag(conn)):
+                        continue
+                except (PoolTimeout, OperationalError):
+                    log_unavailable(replica)
+                    continue
+                yield conn
+                return
+
+        async with self.primary.connection(timeout) as conn:
+            yield conn
+
+
+def log_unavailable(replica: Replica[Any]) -> None:
+    logger.warning('The replica %s is unavailable, trying the next one or the primary.', replica.pool.name, exc_info=True)
+
+
+@operation('check_replica_lag')
+def check_lag(conn: Connection[Any]) -> Any:
+
+    lag = conn.execute(LAG_QUERY).fetchone()[0]  # type: ignore
+
+    if not conn.autocommit:
+        conn.rollback()
+
+    return lag
+
+
+@operation('check_replica_lag')
+async def async_check_lag(conn: AsyncConnection[Any]) -> Any:
+
+    lag = (await (await conn.execute(LAG_QUERY)).fetchone())[0]  # type: ignore
+
+    if not conn.autocommit:
+        await conn.rollback()
+
+    return lag
@@ -1,8 +1,14 @@
+from collections.abc import Iterable, Iterator, Sequence
+import dataclasses
 from types import GenericAlias, UnionType
 from typing import Annotated, Any, get_args, get_origin
-from psycopg.rows import BaseRowFactory, scalar_row, tuple_row, dict_row, class_row, args_row, kwargs_row
+
+from psycopg._cursor_base import BaseCursor
+from psycopg.adapt import PyFormat
+from psycopg.rows import BaseRowFactory, RowMaker, no_result, scalar_row, tuple_row, dict_row, class_row, args_row, kwargs_row
 
 from pgcrud.config import ConfigDict, config
+from pgcrud.converters import convert_params, get_converter, get_positional_converter, identity
 from pgcrud.optional_dependencies import (
     is_pydantic_installed,
     is_pydantic_model,
@@ -14,28 +20,63 @@ from pgcrud.optional_dependencies import (
     msgspec_args_fun_generator,
     pydantic_scalar_row_generator,
     msgspec_scalar_row_generator,
-    pydantic_to_dict,
-    msgspec_to_dict,
-    is_pydantic_instance,
-    is_msgspec_instance,
 )
 from pgcrud.types import T, ValidationType
 
 
 __all__ = [
     'deserialize_params',
+    'deserialize_params_seq',
     'get_params',
     'get_row_factory',
+    'has_adapters_of',
 ]
 
 
+row_makers: dict[tuple[type, tuple[str, ...]], RowMaker[Any]] = {}
+row_factories: dict[tuple[Any, ValidationType, bool], BaseRowFactory[Any]] = {}
+
+
 def deserialize_params(params: Any) -> Any:
-    if is_pydantic_installed and is_pydantic_instance(params):
-        return pydantic_to_dict(params)  # type: ignore
-    elif is_msgspec_installed and is_msgspec_instance(params):
-        return msgspec_to_dict(params)  # type: ignore
-    else:
-        return params
+    return convert_params(params)
+
+
+def deserialize_params_seq(query: Any, params_seq: Iterable[Any]) -> Iterator[Any]:
+
+    # the parameters are converted while psycopg consumes them, instead of building a second list of the whole batch
+    positional = isinstance(query, str) and '%(' not in query
+    last_type: type | None = None
+    converter = identity
+
+    for params in params_seq:
+        type_ = type(params)
+
+        if type_ is not last_type:
+            last_type = type_
+            converter = get_positional_converter(type_) if positional else get_converter(type_)
+
+        yield converter(params)
+
+
+def has_adapters_of(cursor: BaseCursor[Any, Any], connection: Any) -> bool:
+
+    # a cursor shares the adapters of its connection until either of them registers a new one
+    adapters = cursor.adapters
+    template = connection.adapters
+    loaders, template_loaders = adapters._loaders, template._loaders
+    dumpers, template_dumpers = adapters._dumpers, template._dumpers
+    dumpers_by_oid, template_dumpers_by_oid = adapters._dumpers_by_oid, template._dumpers_by_oid
+
+    return (
+        adapters.types._registry is template.types._registry
+        and loaders[0] is template_loaders[0]
+        and loaders[1] is template_loaders[1]
+        and dumpers_by_oid[0] is template_dumpers_by_oid[0]
+        and dumpers_by_oid[1] is template_dumpers_by_oid[1]
+        and dumpers[PyFormat.AUTO] is template_dumpers[PyFormat.AUTO]
+        and dumpers[PyFormat.TEXT] is template_dumpers[PyFormat.TEXT]
+        and dumpers[PyFormat.BINARY] is template_dumpers[PyFormat.BINARY]
+    )
 
 
 def get_params(item: type[T] | tuple[type[T], ConfigDict]) -> tuple[type[T], ValidationType, bool]:
@@ -47,8 +88,8 @@ def get_params(item: type[T] | tuple[type[T], ConfigDict]) -> tuple[type[T], Val
         row_type = item
         config_dict: ConfigDict = {}
 
-    validate = config_dict.get('validation') or config.validation
-    strict = config_dict.get('strict') or config.strict
+    validate = config_dict['validation'] if 'validation' in config_dict else config.validation
+    strict = config_dict['strict'] if 'strict' in config_dict else config.strict
 
     return row_type, validate, strict
 
@@ -66,8 +107,150 @@ def extract_origin(row_type: Any) -> type:
             return row_type
 
 
+def make_list(*values: Any) -> list[Any]:
+    return list(values)
+
+
+def make_set(*values: Any) -> set[Any]:
+    return set(values)
+
+
+def is_dataclass(type_: type) -> bool:
+    return dataclasses.is_dataclass(type_)
+
+
+def is_named_tuple(type_: type) -> bool:
+    return issubclass(type_, tuple) and hasattr(type_, '_fields')
+
+
+def get_fields(row_type: type) -> tuple[str, ...]:
+    if is_named_tuple(row_type):
+        return row_type._fields  # type: ignore
+    else:
+        return tuple(field.name for field in dataclasses.fields(row_type) if field.init)  # type: ignore
+
+
+def get_kw_only_fields(row_type: type) -> set[str]:
+    if is_named_tuple(row_type):
+        return set()
+    else:
+        return {field.name for field in dataclasses.fields(row_type) if field.init and field.kw_only}  # type: ignore
+
+
+def get_positions(row_type: type, names: tuple[str, ...]) -> dict[str, int]:
+
+    fields = get_fields(row_type)
+    positions = {name: i for i, name in enumerate(names)}
+
+    unknown_names = [name for name in names if name not in fields]
+    if unknown_names:
+        raise TypeError(f"{row_type.__name__} has no fields {', '.join(unknown_names)}.")
+
+    return positions
+
+
+def make_row_maker(row_type: type, names: tuple[str, ...]) -> RowMaker[Any]:
+
+    fields = get_fields(row_type)
+    kw_only_fields = get_kw_only_fields(row_type)
+    positions = get_positions(row_type, names)
+
+    # pass arguments positionally as long as the fields are consecutive, the remaining and keyword-only ones by keyword
+    args = []
+    positional = True
+
+    for field in fields:
+        if field in positions:
+            if positional and field not in kw_only_fields:
+                args.append(f'values[{positions[field]}]')
+            else:
+                args.append(f'{field}=values[{positions[field]}]')
+        else:
+            positional = False
+
+    namespace = {'row_type': row_type}
+    exec(f"def row_maker(values):\n    return row_type({', '.join(args)})", namespace)
+
+    return namespace['row_maker']
+
+
+def make_ordered_row_maker(row_type: type, names: tuple[str, ...], args_fun: Any) -> RowMaker[Any]:
+
+    positions = get_positions(row_type, names)
+
+    # the values are passed in field order, so only trailing fields can be omitted
+    indices = []
+    for field in get_fields(row_type):
+        if field not in positions:
+            break
+        indices.append(positions[field])
+
+    if len(indices) < len(positions):
+        raise TypeError(f'{row_type.__name__} can only omit trailing fields.')
+
+    def row_maker(values: Sequence[Any]) -> Any:
+        return args_fun(*[values[i] for i in indices])
+
+    return row_maker
+
+
+def generated_row_generator(row_type: type) -> BaseRowFactory[Any]:
+
+    def generated_row(cursor: BaseCursor[Any, Any]) -> RowMaker[Any]:
+
+        if cursor.description is None:
+            return no_result
+
+        names = tuple(column.name for column in cursor.description)
+        row_maker = row_makers.get((row_type, names))
+
+        if row_maker is None:
+            row_maker = row_makers[(row_type, names)] = make_row_maker(row_type, names)
+
+        return row_maker
+
+    return generated_row
+
+
+def ordered_row_generator(row_type: type, args_fun: Any) -> BaseRowFactory[Any]:
+
+    origin = extract_origin(row_type)
+    cached_row_makers: dict[tuple[str, ...], RowMaker[Any]] = {}
+
+    def ordered_row(cursor: BaseCursor[Any, Any]) -> RowMaker[Any]:
+
+        if cursor.description is None:
+            return no_result
+
+        names = tuple(column.name for column in cursor.description)
+        row_maker = cached_row_makers.get(names)
+
+        if row_maker is None:
+            row_maker = cached_row_makers[names] = make_ordered_row_maker(origin, names, args_fun)
+
+        return row_maker
+
+    return ordered_row
+
+
 def get_row_factory(row_type: type[T], validate: ValidationType, strict: bool) -> BaseRowFactory[T]:
 
+    key = (row_type, validate, strict)
+
+    try:
+        row_factory = row_factories.get(key)
+    except TypeError:
+        # type hints with unhashable metadata cannot be cached
+        return make_row_factory(row_type, validate, strict)
+
+    if row_factory is None:
+        row_factory = row_factories[key] = make_row_factory(row_type, validate, strict)
+
+    return row_factory
+
+
+def make_row_factory(row_type: type[T], validate: ValidationType, strict: bool) -> BaseRowFactory[T]:
+
     origin = extract_origin(row_type)
 
     if is_msgspec_installed and is_msgspec_model(origin):
@@ -88,6 +271,23 @@ def get_row_factory(row_type: type[T], validate: ValidationType, strict: bool) -
             # always validates because it is the only way to construct the model recursively
             return class_row(row_type) # type: ignore
 
+    elif is_dataclass(origin):
+        if validate == 'pydantic':
+            return kwargs_row(pydantic_kwargs_fun_generator(row_type, strict))
+        elif validate == 'msgspec':
+            return kwargs_row(msgspec_kwargs_fun_generator(row_type, strict))
+        else:
+            return generated_row_generator(origin)
+
+    elif is_named_tuple(origin):
+        if validate == 'pydantic':
+            return kwargs_row(pydantic_kwargs_fun_generator(row_type, strict))
+        elif validate == 'msgspec':
+            # msgspec converts named tuples from arrays only, the values are put in field order by column name
+            return ordered_row_generator(row_type, msgspec_args_fun_generator(row_type, strict))
+        else:
+            return generated_row_generator(origin)
+
     elif issubclass(origin, dict):
         if validate == 'pydantic':
             return kwargs_row(pydantic_kwargs_fun_generator(row_type, strict))
@@ -102,7 +302,7 @@ def get_row_factory(row_type: type[T], validate: ValidationType, strict: bool) -
         elif validate == 'msgspec':
             return args_row(msgspec_args_fun_generator(row_type, strict))
         else:
-            return args_row(list)  # type: ignore
+            return args_row(make_list)  # type: ignore
 
     elif issubclass(origin, tuple):
         if validate == 'pydantic':
@@ -118,7 +318,7 @@ def get_row_factory(row_type: type[T], validate: ValidationType, strict: bool) -
         elif validate == 'msgspec':
             return args_row(msgspec_args_fun_generator(row_type, strict))
         else:
-            return args_row(set)  # type: ignore
+            return args_row(make_set)  # type: ignore
 
     else:
         if validate == 'pydantic':
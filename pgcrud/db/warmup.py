@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from enum import Enum
+from threading import Lock
+from typing import Any, Callable, TYPE_CHECKING
+
+from psycopg.types import TypeInfo
+from psycopg.types.composite import CompositeInfo, register_composite
+from psycopg.types.enum import EnumInfo, register_enum
+
+from pgcrud.instrumentation import operation
+from pgcrud.types import ParamsType, QueryType
+
+
+if TYPE_CHECKING:
+    from pgcrud.db.connection import Connection, AsyncConnection
+
+
+__all__ = ['Warmup']
+
+
+SET_READ_ONLY = 'SET TRANSACTION READ ONLY'
+
+
+class Warmup:
+
+    def __init__(
+            self,
+            statements: list[QueryType | tuple[QueryType, ParamsType]] | None = None,
+            composite_types: list[str] | None = None,
+            enum_types: list[str] | None = None,
+    ):
+        self.statements: list[tuple[QueryType, ParamsType | None]] = []
+        self.composite_types: dict[str, Callable[..., Any] | None] = {}
+        self.enum_types: dict[str, type[Enum] | None] = {}
+
+        # the type information is looked up once and shared by all connections of the pool
+        self._type_infos: dict[str, TypeInfo] = {}
+        self._lock = Lock()
+
+        for statement in statements or []:
+            if isinstance(statement, tuple):
+                self.add_statement(*statement)
+            else:
+                self.add_statement(statement)
+
+        for name in composite_types or []:
+            self.add_composite_type(name)
+
+        for name in enum_types or []:
+            self.add_enum_type(name)
+
+    def add_statement(self, query: QueryType, params: ParamsType | None = None) -> None:
+        self.statements.append((query, params))
+
+    def add_composite_type(self, name: str, factory: Callable[..., Any] | None = None) -> None:
+        self.composite_types[name] = factory
+
+    def add_enum_type(self, name: str, enum: type[Enum] | None = None) -> None:
+        self.enum_types[name] = enum
+
+    @operation('warmup')
+    def run(self, conn: Connection[Any]) -> None:
+
+        # The statements are executed with their parameters, a read-only transaction makes sure that they cannot change
+        # any data. It is committed, since psycopg discards its prepared statements on every rollback.
+        with conn.transaction():
+            conn.execute(SET_READ_ONLY)
+
+            for name, factory in self.composite_types.items():
+                info = self._type_infos.get(name)
+                if info is None:
+                    info = self._set_type_info(name, CompositeInfo.fetch(conn, name))
+                register_composite(info, conn, factory or info.python_type)  # type: ignore
+
+            for name, enum in self.enum_types.items():
+                info = self._type_infos.get(name)
+                if info is None:
+                    info = self._set_type_info(name, EnumInfo.fetch(conn, name))
+                register_enum(info, conn, enum or info.enum)  # type: ignore
+
+            # psycopg only prepares statements after prepare_threshold executions, prepare=True does it right away
+            for query, params in self.statements:
+                conn.execute(query, params, prepare=True)
+
+    @operation('warmup')
+    async def async_run(self, conn: AsyncConnection[Any]) -> None:
+
+        async with conn.transaction():
+            await conn.execute(SET_READ_ONLY)
+
+            for name, factory in self.composite_types.items():
+                info = self._type_infos.get(name)
+                if info is None:
+                    info = self._set_type_info(name, await CompositeInfo.fetch(conn, name))
+                register_composite(info, conn, factory or info.python_type)  # type: ignore
+
+            for name, enum in self.enum_types.items():
+                info = self._type_infos.get(name)
+                if info is None:
+                    info = self._set_type_info(name, await EnumInfo.fetch(conn, name))
+                register_enum(info, conn, enum or info.enum)  # type: ignore
+
+            for query, params in self.statements:
+                await conn.execute(query, params, prepare=True)
+
+    def _set_type_info(self, name: str, info: TypeInfo | None) -> TypeInfo:
+
+        if info is None:
+            raise ValueError(f'Type {name} does not exist.')
+
+        with self._lock:
+            return self._type_infos.setdefault(name, info)
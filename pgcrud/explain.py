@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+import json
+from typing import Any
+
+from psycopg._cursor_base import BaseCursor
+from psycopg.rows import tuple_row
+
+
+__all__ = [
+    'INDEX_SCAN_NODE_TYPES',
+    'PlanNode',
+    'Plan',
+    'get_explain_query',
+    'explain',
+    'async_explain',
+]
+
+
+INDEX_SCAN_NODE_TYPES = frozenset({'Index Scan', 'Index Only Scan', 'Bitmap Index Scan'})
+
+
+class PlanNode:
+
+    __slots__ = (
+        'node_type',
+        'relation_name',
+        'index_name',
+        'startup_cost',
+        'total_cost',
+        'plan_rows',
+        'actual_rows',
+        'actual_loops',
+        'shared_hit_blocks',
+        'shared_read_blocks',
+        'children',
+        'raw',
+    )
+
+    def __init__(self, raw: dict[str, Any]):
+        self.node_type: str = raw['Node Type']
+        self.relation_name: str | None = raw.get('Relation Name')
+        self.index_name: str | None = raw.get('Index Name')
+        self.startup_cost: float = raw.get('Startup Cost', 0.0)
+        self.total_cost: float = raw.get('Total Cost', 0.0)
+        self.plan_rows: int = raw.get('Plan Rows', 0)
+        self.actual_rows: float | None = raw.get('Actual Rows')
+        self.actual_loops: int | None = raw.get('Actual Loops')
+        self.shared_hit_blocks: int | None = raw.get('Shared Hit Blocks')
+        self.shared_read_blocks: int | None = raw.get('Shared Read Blocks')
+        self.children = [PlanNode(child) for child in raw.get('Plans', ())]
+        self.raw = raw
+
+    def __str__(self):
+        return f'PlanNode(node_type={self.node_type}, relation_name={self.relation_name}, index_name={self.index_name})'
+
+    def __repr__(self):
+        return str(self)
+
+    def walk(self) -> Iterator[PlanNode]:
+
+        stack = [self]
+
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+
+class Plan:
+
+    def __init__(self, raw: Any):
+
+        if isinstance(raw, (str, bytes)):
+            raw = json.loads(raw)
+
+        if isinstance(raw, list):
+            raw = raw[0]
+
+        self.raw: dict[str, Any] = raw
+        self.root = PlanNode(raw['Plan'])
+        self.planning_time: float | None = raw.get('Planning Time')
+        self.execution_time: float | None = raw.get('Execution Time')
+
+    def __str__(self):
+        return f'Plan(node_types={self.node_types}, total_cost={self.total_cost}, plan_rows={self.plan_rows}, actual_rows={self.actual_rows})'
+
+    def __repr__(self):
+        return str(self)
+
+    @property
+    def total_cost(self) -> float:
+        return self.root.total_cost
+
+    @property
+    def plan_rows(self) -> int:
+        return self.root.plan_rows
+
+    @property
+    def actual_rows(self) -> float | None:
+        return self.root.actual_rows
+
+    @property
+    def analyzed(self) -> bool:
+        return self.root.actual_rows is not None
+
+    @property
+    def nodes(self) -> list[PlanNode]:
+        return list(self.root.walk())
+
+    @property
+    def node_types(self) -> list[str]:
+        return [node.node_type for node in self.root.walk()]
+
+    @property
+    def index_names(self) -> set[str]:
+        return {node.index_name for node in self.root.walk() if node.index_name is not None}
+
+    @property
+    def uses_index(self) -> bool:
+        return any(node.node_type in INDEX_SCAN_NODE_TYPES for node in self.root.walk())
+
+    @property
+    def uses_seq_scan(self) -> bool:
+        return any(node.node_type == 'Seq Scan' for node in self.root.walk())
+
+
+def get_explain_query(query: Any, analyze: bool = False, buffers: bool = False) -> str:
+
+    options = []
+
+    if analyze:
+        options.append('ANALYZE')
+
+    if buffers:
+        options.append('BUFFERS')
+
+    options.append('FORMAT JSON')
+
+    return f'EXPLAIN ({", ".join(options)}) {query}'
+
+
+# a separate cursor on the same connection, so that the row factory of the given cursor is neither used nor changed
+
+def explain(
+        cursor: BaseCursor[Any, Any],
+        query: Any,
+        analyze: bool = False,
+        buffers: bool = False,
+        *,
+        params: Any = None,
+) -> Plan:
+
+    with cursor.connection.cursor(row_factory=tuple_row) as explain_cursor:
+        explain_cursor.execute(get_explain_query(query, analyze, buffers), params)
+        return Plan(explain_cursor.fetchone()[0])  # type: ignore
+
+
+async def async_explain(
+        cursor: BaseCursor[Any, Any],
+        query: Any,
+        analyze: bool = False,
+        buffers: bool = False,
+        *,
+        params: Any = None,
+) -> Plan:
+
+    async with cursor.connection.cursor(row_factory=tuple_row) as explain_cursor:  # type: ignore
+        await explain_cursor.execute(get_explain_query(query, analyze, buffers), params)
+        return Plan((await explain_cursor.fetchone())[0])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Iterable
 from typing import Any, Self, TYPE_CHECKING
 
 from psycopg.sql import Identifier, Literal
@@ -13,6 +14,8 @@ if TYPE_CHECKING:
 
 __all__ = [
     'make_expr',
+    'join_parts',
+    'render',
     'Expression',
 
     'LiteralExpression',
@@ -42,6 +45,10 @@ __all__ = [
     'LogicalOperationExpression',
     'IntersectionOperationExpression',
     'UnionOperationExpression',
+    'JunctionOperationExpression',
+    'ConjunctionOperationExpression',
+    'DisjunctionOperationExpression',
+    'compile_expression',
 
     'ClauseExpression',
     'AsClauseExpression',
@@ -72,15 +79,56 @@ def make_expr(value: Any) -> Expression:
     return getattr(value, '_expr', LiteralExpression(value))
 
 
+def join_parts(expressions: Iterable[Any], separator: str) -> list[Any]:
+
+    parts: list[Any] = []
+
+    for expression in expressions:
+        if parts:
+            parts.append(separator)
+        parts.append(expression)
+
+    return parts
+
+
+def render(expression: Expression) -> str:
+
+    # The parts of an expression are strings and child expressions. Instead of recursive __str__ calls, the children
+    # are expanded with an explicit stack of iterators, so arbitrarily deep trees render without hitting the recursion
+    # limit. Leaves, which cannot nest, are converted right away.
+    chunks: list[str] = []
+    append = chunks.append
+    stack = [iter(expression._parts())]
+
+    while stack:
+        for part in stack[-1]:
+            if type(part) is str:
+                append(part)
+            elif isinstance(part, Expression) and not part._leaf:
+                stack.append(iter(part._parts()))
+                break
+            else:
+                append(str(part))
+        else:
+            stack.pop()
+
+    return ''.join(chunks)
+
+
 class Expression:
 
-    @abstractmethod
+    _leaf = False
+
     def __str__(self) -> str:
-        pass
+        return render(self)
 
     def __bool__(self) -> bool:
         return True
 
+    def _parts(self) -> list[Any]:
+        # subclasses outside of pgcrud may only implement __str__
+        return [str(self)]
+
     def __repr__(self):
         return str(self)
 
@@ -210,12 +258,17 @@ class Expression:
 
 class LiteralExpression(Expression):
 
+    _leaf = True
+
     def __init__(self, value: Any) -> None:
         self.value = value
 
     def __str__(self) -> str:
         return Literal(self.value).as_string()
 
+    def _parts(self) -> list[Any]:
+        return [str(self)]
+
 
 class IdentifierExpressionType(type):
 
@@ -225,6 +278,8 @@ class IdentifierExpressionType(type):
 
 class IdentifierExpression(Expression, metaclass=IdentifierExpressionType):
 
+    _leaf = True
+
     def __init__(
             self,
             name: str,
@@ -233,7 +288,7 @@ class IdentifierExpression(Expression, metaclass=IdentifierExpressionType):
         self._name = name
         self._parent = parent
         self._identifier = Identifier(name).as_string()
-        self._columns = []
+        self._columns: tuple[IdentifierExpression, ...] = ()
 
     def __call__(self, item: str) -> IdentifierExpression:
         return IdentifierExpression(item, self)
@@ -241,12 +296,15 @@ class IdentifierExpression(Expression, metaclass=IdentifierExpressionType):
     def __getattr__(self, item: str) -> IdentifierExpression:
         return IdentifierExpression(item, self)
 
-    def __getitem__(self, item: IdentifierExpression | tuple[IdentifierExpression, ...]) -> Self:
-        self._columns += list(ensure_seq(item))
-        return self
+    def __getitem__(self, item: IdentifierExpression | tuple[IdentifierExpression, ...]) -> IdentifierExpression:
+        # a new identifier, so that an identifier already used in a query is never changed
+        expression = IdentifierExpression(self._name, self._parent)
+        expression._columns = (*self._columns, *ensure_seq(item))
+        return expression
 
     def __str__(self) -> str:
 
+        # identifiers only nest through their parents and columns, they are rendered directly
         base_str = self._identifier
 
         if self._columns:
@@ -257,11 +315,14 @@ class IdentifierExpression(Expression, metaclass=IdentifierExpressionType):
 
         return base_str
 
+    def _parts(self) -> list[Any]:
+        return [str(self)]
+
 
 class UndefinedExpression(Expression):
 
-    def __str__(self) -> str:
-        return ''
+    def _parts(self) -> list[Any]:
+        return []
 
     def __bool__(self) -> bool:
         return False
@@ -275,36 +336,35 @@ class PlaceholderExpression(Expression):
     ) -> None:
         self.name = name
 
-    @property
-    def _base_str(self) -> str:
+    def _parts(self) -> list[Any]:
         if self.name:
-            return f'%({self.name})s'
+            return [f'%({self.name})s']
         else:
-            return '%s'
+            return ['%s']
 
 
 class UnboundedExpression(Expression):
 
-    def __str__(self) -> str:
-        return 'UNBOUNDED'
+    def _parts(self) -> list[Any]:
+        return ['UNBOUNDED']
 
 
 class CurrentRowExpression(Expression):
 
-    def __str__(self) -> str:
-        return 'CURRENT ROW'
+    def _parts(self) -> list[Any]:
+        return ['CURRENT ROW']
 
 
 class DefaultExpression(Expression):
 
-    def __str__(self) -> str:
-        return 'DEFAULT'
+    def _parts(self) -> list[Any]:
+        return ['DEFAULT']
 
 
 class ExcludedExpression(Expression):
 
-    def __str__(self) -> str:
-        return 'EXCLUDED'
+    def _parts(self) -> list[Any]:
+        return ['EXCLUDED']
 
     def __call__(self, item: str) -> IdentifierExpression:
         return IdentifierExpression(item, self)
@@ -323,8 +383,17 @@ class ArithmeticOperationExpression(Expression):
         self.left = left
         self.right = right
 
-    def __str__(self) -> str:
-        return f'{self.left_str} {self.operator} {self.right_str}'
+    def _parts(self) -> list[Any]:
+
+        parts: list[Any] = ['(', self.left, ')'] if isinstance(self.left, self.left_nested_types) else [self.left]
+        parts.append(f' {self.operator} ')
+
+        if isinstance(self.right, self.right_nested_types):
+            parts += ['(', self.right, ')']
+        else:
+            parts.append(self.right)
+
+        return parts
 
     @property
     @abstractmethod
@@ -333,12 +402,12 @@ class ArithmeticOperationExpression(Expression):
 
     @property
     @abstractmethod
-    def left_str(self) -> str:
+    def left_nested_types(self) -> tuple[type[Expression], ...]:
         pass
 
     @property
     @abstractmethod
-    def right_str(self) -> str:
+    def right_nested_types(self) -> tuple[type[Expression], ...]:
         pass
 
 
@@ -349,18 +418,12 @@ class AddOperationExpression(ArithmeticOperationExpression):
         return '+'
 
     @property
-    def left_str(self) -> str:
-        if isinstance(self.left, (SubtractOperationExpression, MultiplyOperationExpression, DivideOperationExpression, PowerOperationExpression)):
-            return f'({self.left})'
-        else:
-            return str(self.left)
+    def left_nested_types(self) -> tuple[type[Expression], ...]:
+        return SubtractOperationExpression, MultiplyOperationExpression, DivideOperationExpression, PowerOperationExpression
 
     @property
-    def right_str(self) -> str:
-        if isinstance(self.right, (SubtractOperationExpression, MultiplyOperationExpression, DivideOperationExpression, PowerOperationExpression)):
-            return f'({self.right})'
-        else:
-            return str(self.right)
+    def right_nested_types(self) -> tuple[type[Expression], ...]:
+        return SubtractOperationExpression, MultiplyOperationExpression, DivideOperationExpression, PowerOperationExpression
 
 
 class SubtractOperationExpression(ArithmeticOperationExpression):
@@ -370,18 +433,12 @@ class SubtractOperationExpression(ArithmeticOperationExpression):
         return '-'
 
     @property
-    def left_str(self) -> str:
-        if isinstance(self.left, (AddOperationExpression, MultiplyOperationExpression, DivideOperationExpression, PowerOperationExpression)):
-            return f'({self.left})'
-        else:
-            return str(self.left)
+    def left_nested_types(self) -> tuple[type[Expression], ...]:
+        return AddOperationExpression, MultiplyOperationExpression, DivideOperationExpression, PowerOperationExpression
 
     @property
-    def right_str(self) -> str:
-        if isinstance(self.right, ArithmeticOperationExpression):
-            return f'({self.right})'
-        else:
-            return str(self.right)
+    def right_nested_types(self) -> tuple[type[Expression], ...]:
+        return ArithmeticOperationExpression,
 
 
 class MultiplyOperationExpression(ArithmeticOperationExpression):
@@ -391,18 +448,12 @@ class MultiplyOperationExpression(ArithmeticOperationExpression):
         return '*'
 
     @property
-    def left_str(self) -> str:
-        if isinstance(self.left, (AddOperationExpression, SubtractOperationExpression, DivideOperationExpression, PowerOperationExpression)):
-            return f'({self.left})'
-        else:
-            return str(self.left)
+    def left_nested_types(self) -> tuple[type[Expression], ...]:
+        return AddOperationExpression, SubtractOperationExpression, DivideOperationExpression, PowerOperationExpression
 
     @property
-    def right_str(self) -> str:
-        if isinstance(self.right, (AddOperationExpression, SubtractOperationExpression, DivideOperationExpression, PowerOperationExpression)):
-            return f'({self.right})'
-        else:
-            return str(self.right)
+    def right_nested_types(self) -> tuple[type[Expression], ...]:
+        return AddOperationExpression, SubtractOperationExpression, DivideOperationExpression, PowerOperationExpression
 
 
 class DivideOperationExpression(ArithmeticOperationExpression):
@@ -412,18 +463,12 @@ class DivideOperationExpression(ArithmeticOperationExpression):
         return '/'
 
     @property
-    def left_str(self) -> str:
-        if isinstance(self.left, (AddOperationExpression, SubtractOperationExpression, MultiplyOperationExpression, PowerOperationExpression)):
-            return f'({self.left})'
-        else:
-            return str(self.left)
+    def left_nested_types(self) -> tuple[type[Expression], ...]:
+        return AddOperationExpression, SubtractOperationExpression, MultiplyOperationExpression, PowerOperationExpression
 
     @property
-    def right_str(self) -> str:
-        if isinstance(self.right, ArithmeticOperationExpression):
-            return f'({self.right})'
-        else:
-            return str(self.right)
+    def right_nested_types(self) -> tuple[type[Expression], ...]:
+        return ArithmeticOperationExpression,
 
 
 class PowerOperationExpression(ArithmeticOperationExpression):
@@ -433,18 +478,12 @@ class PowerOperationExpression(ArithmeticOperationExpression):
         return '^'
 
     @property
-    def left_str(self) -> str:
-        if isinstance(self.left, ArithmeticOperationExpression):
-            return f'({self.left})'
-        else:
-            return str(self.left)
+    def left_nested_types(self) -> tuple[type[Expression], ...]:
+        return ArithmeticOperationExpression,
 
     @property
-    def right_str(self) -> str:
-        if isinstance(self.right, (AddOperationExpression, SubtractOperationExpression, MultiplyOperationExpression, DivideOperationExpression)):
-            return f'({self.right})'
-        else:
-            return str(self.right)
+    def right_nested_types(self) -> tuple[type[Expression], ...]:
+        return AddOperationExpression, SubtractOperationExpression, MultiplyOperationExpression, DivideOperationExpression
 
 
 class ComparisonOperationExpression(Expression):
@@ -457,11 +496,11 @@ class ComparisonOperationExpression(Expression):
         self.left = left
         self.right = right
 
-    def __str__(self):
+    def _parts(self) -> list[Any]:
         if self:
-            return f'{self.left} {self.operator} {self.right}'
+            return [self.left, f' {self.operator} ', self.right]
         else:
-            return ''
+            return []
 
     def __bool__(self) -> bool:
         return bool(self.left) and bool(self.right)
@@ -525,81 +564,183 @@ class LogicalOperationExpression(Expression):
         self.right = right
 
     def __bool__(self):
-        return bool(self.left) or bool(self.right)
+        return bool(compile_expression(self))
 
-    def __str__(self) -> str:
-        if self.left and self.right:
-            return f'{self.left_str} {self.operator} {self.right_str}'
-        elif self.left and not self.right:
-            return str(self.left)
-        elif not self.left and self.right:
-            return str(self.right)
-        else:
-            return ''
+    def _parts(self) -> list[Any]:
+        return [compile_expression(self)]
 
-    @property
-    @abstractmethod
-    def operator(self) -> str:
-        pass
+
+class IntersectionOperationExpression(LogicalOperationExpression):
+    pass
+
+
+class UnionOperationExpression(LogicalOperationExpression):
+    pass
+
+
+class JunctionOperationExpression(Expression):
+
+    def __init__(
+            self,
+            expressions: list[Expression],
+    ):
+        self.expressions = expressions
+        self._compiled = False
+
+    def __bool__(self) -> bool:
+        # a compiled junction has at least two operands, undefined ones are pruned
+        return self._compiled or bool(compile_expression(self))
+
+    def _parts(self) -> list[Any]:
+
+        if not self._compiled:
+            return [compile_expression(self)]
+
+        parts: list[Any] = []
+        separator = f' {self.operator} '
+
+        for expression in self.expressions:
+            if parts:
+                parts.append(separator)
+            if isinstance(expression, self.nested_types):
+                parts += ['(', expression, ')']
+            else:
+                parts.append(expression)
+
+        return parts
 
     @property
     @abstractmethod
-    def left_str(self) -> str:
+    def operator(self) -> str:
         pass
 
     @property
     @abstractmethod
-    def right_str(self) -> str:
+    def nested_types(self) -> tuple[type[Expression], ...]:
         pass
 
 
-class IntersectionOperationExpression(LogicalOperationExpression):
+class ConjunctionOperationExpression(JunctionOperationExpression):
 
     @property
     def operator(self) -> str:
         return 'AND'
 
     @property
-    def left_str(self) -> str:
-        if isinstance(self.left, UnionOperationExpression):
-            return f'({self.left})'
-        else:
-            return str(self.left)
+    def nested_types(self) -> tuple[type[Expression], ...]:
+        return UnionOperationExpression, DisjunctionOperationExpression
 
-    @property
-    def right_str(self) -> str:
-        if isinstance(self.right, UnionOperationExpression):
-            return f'({self.right})'
-        else:
-            return str(self.right)
 
-
-class UnionOperationExpression(LogicalOperationExpression):
+class DisjunctionOperationExpression(JunctionOperationExpression):
 
     @property
     def operator(self) -> str:
         return 'OR'
 
     @property
-    def left_str(self) -> str:
-        if isinstance(self.left, IntersectionOperationExpression):
-            return f'({self.left})'
-        else:
-            return str(self.left)
+    def nested_types(self) -> tuple[type[Expression], ...]:
+        return IntersectionOperationExpression, ConjunctionOperationExpression
 
-    @property
-    def right_str(self) -> str:
-        if isinstance(self.right, IntersectionOperationExpression):
-            return f'({self.right})'
+
+def is_conjunction(expression: Expression) -> bool:
+    return isinstance(expression, (IntersectionOperationExpression, ConjunctionOperationExpression))
+
+
+def is_uncompiled(expression: Expression) -> bool:
+    if isinstance(expression, LogicalOperationExpression):
+        return True
+    elif isinstance(expression, JunctionOperationExpression):
+        return not expression._compiled
+    else:
+        return False
+
+
+def get_operands(expression: Expression) -> list[Expression]:
+
+    # the operands of a chain of the same operator, in order and without recursion
+    conjunction = is_conjunction(expression)
+    operands = []
+    stack = [expression]
+
+    while stack:
+        current = stack.pop()
+        if is_uncompiled(current) and is_conjunction(current) is conjunction:
+            if isinstance(current, LogicalOperationExpression):
+                stack.extend((current.right, current.left))
+            else:
+                stack.extend(reversed(current.expressions))  # type: ignore
         else:
-            return str(self.right)
+            operands.append(current)
 
+    return operands
 
-class ClauseExpression(Expression):
 
-    @abstractmethod
-    def __str__(self) -> str:
-        pass
+def combine_operands(conjunction: bool, operands: list[Expression]) -> Expression:
+
+    junction_type = ConjunctionOperationExpression if conjunction else DisjunctionOperationExpression
+
+    # FALSE absorbs a conjunction and TRUE a disjunction, the other one is neutral
+    expressions = []
+    folded = False
+
+    for operand in operands:
+        if isinstance(operand, junction_type):
+            expressions.extend(operand.expressions)
+        elif isinstance(operand, LiteralExpression) and isinstance(operand.value, bool):
+            if operand.value is not conjunction:
+                return LiteralExpression(operand.value)
+            folded = True
+        elif operand:
+            expressions.append(operand)
+
+    if not expressions:
+        return LiteralExpression(conjunction) if folded else UndefinedExpression()
+    elif len(expressions) == 1:
+        return expressions[0]
+    else:
+        junction = junction_type(expressions)
+        junction._compiled = True
+        return junction
+
+
+def compile_expression(expression: Expression) -> Expression:
+
+    if not is_uncompiled(expression):
+        return expression
+
+    # Prunes undefined operands, folds boolean literals and flattens nested chains of AND and OR into n-ary junctions.
+    # The tree is traversed in post-order with an explicit stack, every node is compiled exactly once.
+    results: dict[int, Expression] = {}
+    chains: dict[int, list[Expression]] = {}
+    stack = [expression]
+
+    while stack:
+        node = stack[-1]
+
+        if id(node) in results:
+            stack.pop()
+            continue
+
+        operands = chains.get(id(node))
+        if operands is None:
+            operands = chains[id(node)] = get_operands(node)
+
+        pending = [operand for operand in operands if is_uncompiled(operand) and id(operand) not in results]
+        if pending:
+            stack.extend(pending)
+            continue
+
+        stack.pop()
+        results[id(node)] = combine_operands(
+            is_conjunction(node),
+            [results.get(id(operand), operand) for operand in operands],
+        )
+
+    return results[id(expression)]
+
+
+class ClauseExpression(Expression):
+    pass
 
 
 class AsClauseExpression(ClauseExpression):
@@ -612,8 +753,8 @@ class AsClauseExpression(ClauseExpression):
         self.expression = expression
         self.alias = alias
 
-    def __str__(self) -> str:
-        return f'{self.expression} AS {self.alias}'
+    def _parts(self) -> list[Any]:
+        return [self.expression, ' AS ', self.alias]
 
 
 class AscClauseExpression(ClauseExpression):
@@ -626,14 +767,14 @@ class AscClauseExpression(ClauseExpression):
         self.expression = expression
         self.flag = flag
 
-    def __str__(self) -> str:
+    def _parts(self) -> list[Any]:
         if self:
             if self.flag:
-                return 'ASC'
+                return [self.expression, ' ASC']
             else:
-                return 'DESC'
+                return [self.expression, ' DESC']
         else:
-            return ''
+            return []
 
     def __bool__(self) -> bool:
         return isinstance(self.flag, bool)
@@ -649,14 +790,14 @@ class DescClauseExpression(ClauseExpression):
         self.expression = expression
         self.flag = flag
 
-    def __str__(self) -> str:
+    def _parts(self) -> list[Any]:
         if self:
             if self.flag:
-                return 'DESC'
+                return [self.expression, ' DESC']
             else:
-                return 'ASC'
+                return [self.expression, ' ASC']
         else:
-            return ''
+            return []
 
     def __bool__(self) -> bool:
         return isinstance(self.flag, bool)
@@ -672,8 +813,8 @@ class IsClauseExpression(ClauseExpression):
         self.left = left
         self.right = right
 
-    def __str__(self) -> str:
-        return f'{self.left} IS {self.right}'
+    def _parts(self) -> list[Any]:
+        return [self.left, ' IS ', self.right]
 
     def __bool__(self) -> bool:
         return bool(self.left) or bool(self.right)
@@ -689,8 +830,8 @@ class IsNotClauseExpression(ClauseExpression):
         self.left = left
         self.right = right
 
-    def __str__(self) -> str:
-        return f'{self.left} IS NOT {self.right}'
+    def _parts(self) -> list[Any]:
+        return [self.left, ' IS NOT ', self.right]
 
     def __bool__(self) -> bool:
         return bool(self.left) or bool(self.right)
@@ -706,11 +847,8 @@ class InClauseExpression(ClauseExpression):
         self.left = left
         self.right = right
 
-    def __str__(self):
-        if self:
-            return f"{self.left} IN ({', '.join([str(expression) for expression in self.right])})"
-        else:
-            return ''
+    def _parts(self) -> list[Any]:
+        return [self.left, ' IN (', *join_parts(self.right, ', '), ')']
 
 
 class NotInClauseExpression(ClauseExpression):
@@ -723,11 +861,8 @@ class NotInClauseExpression(ClauseExpression):
         self.left = left
         self.right = right
 
-    def __str__(self):
-        if self:
-            return f"{self.left} NOT IN ({', '.join([str(expression) for expression in self.right])})"
-        else:
-            return ''
+    def _parts(self) -> list[Any]:
+        return [self.left, ' NOT IN (', *join_parts(self.right, ', '), ')']
 
 
 class BetweenClauseExpression(ClauseExpression):
@@ -742,8 +877,8 @@ class BetweenClauseExpression(ClauseExpression):
         self.start = start
         self.end = end
 
-    def __str__(self) -> str:
-        return f'{self.expression} BETWEEN {self.start} AND {self.end}'
+    def _parts(self) -> list[Any]:
+        return [self.expression, ' BETWEEN ', self.start, ' AND ', self.end]
 
 
 class FilterClauseExpression(ClauseExpression):
@@ -756,8 +891,8 @@ class FilterClauseExpression(ClauseExpression):
         self.left = left
         self.right = right
 
-    def __str__(self) -> str:
-        return f'{self.left} FILTER ({self.right})'
+    def _parts(self) -> list[Any]:
+        return [self.left, ' FILTER (', self.right, ')']
 
 
 class JoinClauseExpression(ClauseExpression):
@@ -770,8 +905,8 @@ class JoinClauseExpression(ClauseExpression):
         self.left = left
         self.right = right
 
-    def __str__(self) -> str:
-        return f'{self.left} JOIN {self.right}'
+    def _parts(self) -> list[Any]:
+        return [self.left, ' JOIN ', self.right]
 
 
 class LeftJoinClauseExpression(ClauseExpression):
@@ -784,8 +919,8 @@ class LeftJoinClauseExpression(ClauseExpression):
         self.left = left
         self.right = right
 
-    def __str__(self) -> str:
-        return f'{self.left} LEFT JOIN {self.right}'
+    def _parts(self) -> list[Any]:
+        return [self.left, ' LEFT JOIN ', self.right]
 
 
 class RightJoinClauseExpression(ClauseExpression):
@@ -798,8 +933,8 @@ class RightJoinClauseExpression(ClauseExpression):
         self.left = left
         self.right = right
 
-    def __str__(self) -> str:
-        return f'{self.left} RIGHT JOIN {self.right}'
+    def _parts(self) -> list[Any]:
+        return [self.left, ' RIGHT JOIN ', self.right]
 
 
 class InnerJoinClauseExpression(ClauseExpression):
@@ -812,8 +947,8 @@ class InnerJoinClauseExpression(ClauseExpression):
         self.left = left
         self.right = right
 
-    def __str__(self) -> str:
-        return f'{self.left} INNER JOIN {self.right}'
+    def _parts(self) -> list[Any]:
+        return [self.left, ' INNER JOIN ', self.right]
 
 
 class FullJoinClauseExpression(ClauseExpression):
@@ -826,8 +961,8 @@ class FullJoinClauseExpression(ClauseExpression):
         self.left = left
         self.right = right
 
-    def __str__(self) -> str:
-        return f'{self.left} FULL JOIN {self.right}'
+    def _parts(self) -> list[Any]:
+        return [self.left, ' FULL JOIN ', self.right]
 
 
 class CrossJoinClauseExpression(ClauseExpression):
@@ -840,8 +975,8 @@ class CrossJoinClauseExpression(ClauseExpression):
         self.left = left
         self.right = right
 
-    def __str__(self) -> str:
-        return f'{self.left} CROSS JOIN {self.right}'
+    def _parts(self) -> list[Any]:
+        return [self.left, ' CROSS JOIN ', self.right]
 
 
 class OnClauseExpression(ClauseExpression):
@@ -854,8 +989,8 @@ class OnClauseExpression(ClauseExpression):
         self.left = left
         self.right = right
 
-    def __str__(self) -> str:
-        return f'{self.left} ON {self.right}'
+    def _parts(self) -> list[Any]:
+        return [self.left, ' ON ', self.right]
 
 
 class OverClauseExpression(ClauseExpression):
@@ -868,8 +1003,8 @@ class OverClauseExpression(ClauseExpression):
         self.left = left
         self.right = right
 
-    def __str__(self) -> str:
-        return f'{self.left} OVER {self.right}'
+    def _parts(self) -> list[Any]:
+        return [self.left, ' OVER ', self.right]
 
 
 class PrecedingClauseExpression(ClauseExpression):
@@ -880,8 +1015,8 @@ class PrecedingClauseExpression(ClauseExpression):
     ):
         self.expression = expression
 
-    def __str__(self) -> str:
-        return f'{self.expression} PRECEDING'
+    def _parts(self) -> list[Any]:
+        return [self.expression, ' PRECEDING']
 
 
 class FollowingClauseExpression(ClauseExpression):
@@ -892,8 +1027,8 @@ class FollowingClauseExpression(ClauseExpression):
     ):
         self.expression = expression
 
-    def __str__(self) -> str:
-        return f'{self.expression} FOLLOWING'
+    def _parts(self) -> list[Any]:
+        return [self.expression, ' FOLLOWING']
 
 
 class QueryExpression(Expression):
@@ -904,5 +1039,5 @@ class QueryExpression(Expression):
     ):
         self.query = query
 
-    def __str__(self) -> str:
-        return f'({self.query})'
+    def _parts(self) -> list[Any]:
+        return ['(', str(self.query), ')']
@@ -1,8 +1,8 @@
 from abc import abstractmethod
 from collections.abc import Sequence
-from typing import Literal
+from typing import Any, Literal
 
-from pgcrud.expressions.base import Expression, LiteralExpression
+from pgcrud.expressions.base import Expression, LiteralExpression, IdentifierExpression, AsClauseExpression, join_parts
 
 
 __all__ = [
@@ -18,6 +18,7 @@ __all__ = [
     'JsonAggFunctionExpression',
     'ToJsonFunctionExpression',
     'JsonBuildObjectFunctionExpression',
+    'JsonNestFunctionExpression',
     'LowerFunctionExpression',
     'UpperFunctionExpression',
     'CoalesceFunctionExpression',
@@ -31,20 +32,20 @@ __all__ = [
 class FunctionExpression(Expression):
 
     @abstractmethod
-    def __str__(self) -> str:
+    def _parts(self) -> list[Any]:
         pass
 
 
 class NowFunctionExpression(FunctionExpression):
 
-    def __str__(self) -> str:
-        return 'now()'
+    def _parts(self) -> list[Any]:
+        return ['now()']
 
 
 class RowNumberFunctionExpression(FunctionExpression):
 
-    def __str__(self) -> str:
-        return 'row_number()'
+    def _parts(self) -> list[Any]:
+        return ['row_number()']
 
 
 class CountFunctionExpression(FunctionExpression):
@@ -55,8 +56,8 @@ class CountFunctionExpression(FunctionExpression):
     ):
         self.expression = expression
 
-    def __str__(self) -> str:
-        return f'count({self.expression})'
+    def _parts(self) -> list[Any]:
+        return ['count(', self.expression, ')']
 
 
 class SumFunctionExpression(FunctionExpression):
@@ -67,8 +68,8 @@ class SumFunctionExpression(FunctionExpression):
     ):
         self.expression = expression
 
-    def __str__(self) -> str:
-        return f'sum({self.expression})'
+    def _parts(self) -> list[Any]:
+        return ['sum(', self.expression, ')']
 
 
 class AvgFunctionExpression(FunctionExpression):
@@ -79,8 +80,8 @@ class AvgFunctionExpression(FunctionExpression):
     ):
         self.expression = expression
 
-    def __str__(self) -> str:
-        return f'avg({self.expression})'
+    def _parts(self) -> list[Any]:
+        return ['avg(', self.expression, ')']
 
 
 class MinFunctionExpression(FunctionExpression):
@@ -91,8 +92,8 @@ class MinFunctionExpression(FunctionExpression):
     ):
         self.expression = expression
 
-    def __str__(self) -> str:
-        return f'min({self.expression})'
+    def _parts(self) -> list[Any]:
+        return ['min(', self.expression, ')']
 
 
 class MaxFunctionExpression(FunctionExpression):
@@ -103,8 +104,8 @@ class MaxFunctionExpression(FunctionExpression):
     ):
         self.expression = expression
 
-    def __str__(self) -> str:
-        return f'max({self.expression})'
+    def _parts(self) -> list[Any]:
+        return ['max(', self.expression, ')']
 
 
 class LowerFunctionExpression(FunctionExpression):
@@ -115,8 +116,8 @@ class LowerFunctionExpression(FunctionExpression):
     ):
         self.expression = expression
 
-    def __str__(self) -> str:
-        return f'lower({self.expression})'
+    def _parts(self) -> list[Any]:
+        return ['lower(', self.expression, ')']
 
 
 class UpperFunctionExpression(FunctionExpression):
@@ -127,8 +128,8 @@ class UpperFunctionExpression(FunctionExpression):
     ):
         self.expression = expression
 
-    def __str__(self) -> str:
-        return f'upper({self.expression})'
+    def _parts(self) -> list[Any]:
+        return ['upper(', self.expression, ')']
 
 
 class ArrayAggFunctionExpression(FunctionExpression):
@@ -139,8 +140,8 @@ class ArrayAggFunctionExpression(FunctionExpression):
     ):
         self.expression = expression
 
-    def __str__(self) -> str:
-        return f'array_agg({self.expression})'
+    def _parts(self) -> list[Any]:
+        return ['array_agg(', self.expression, ')']
 
 
 class JsonAggFunctionExpression(FunctionExpression):
@@ -151,8 +152,8 @@ class JsonAggFunctionExpression(FunctionExpression):
     ):
         self.expression = expression
 
-    def __str__(self) -> str:
-        return f'json_agg({self.expression})'
+    def _parts(self) -> list[Any]:
+        return ['json_agg(', self.expression, ')']
 
 
 class CoalesceFunctionExpression(FunctionExpression):
@@ -163,8 +164,8 @@ class CoalesceFunctionExpression(FunctionExpression):
     ):
         self.expressions = expressions
 
-    def __str__(self) -> str:
-        return f"coalesce({', '.join([str(expression) for expression in self.expressions])})"
+    def _parts(self) -> list[Any]:
+        return ['coalesce(', *join_parts(self.expressions, ', '), ')']
 
 
 class ToJsonFunctionExpression(FunctionExpression):
@@ -175,8 +176,8 @@ class ToJsonFunctionExpression(FunctionExpression):
     ):
         self.expression = expression
 
-    def __str__(self) -> str:
-        return f'to_json({self.expression})'
+    def _parts(self) -> list[Any]:
+        return ['to_json(', self.expression, ')']
 
 
 class JsonBuildObjectFunctionExpression(FunctionExpression):
@@ -187,8 +188,43 @@ class JsonBuildObjectFunctionExpression(FunctionExpression):
     ):
         self.expressions = expressions
 
-    def __str__(self) -> str:
-        return f"json_build_object({', '.join([str(expression) for expression in self.expressions])})"
+    def _parts(self) -> list[Any]:
+        return ['json_build_object(', *join_parts(self.expressions, ', '), ')']
+
+
+class JsonNestFunctionExpression(FunctionExpression):
+
+    def __init__(
+            self,
+            expressions: Sequence[Expression],
+            key: Expression | None = None,
+    ):
+        if not expressions:
+            raise TypeError('json_nest requires at least one column.')
+
+        self.expressions = expressions
+        self.key = key
+
+    def _parts(self) -> list[Any]:
+
+        keys = []
+        values = []
+
+        for expression in self.expressions:
+            if isinstance(expression, AsClauseExpression) and isinstance(expression.alias, IdentifierExpression):
+                keys.append(expression.alias._name)
+                values.append(expression.expression)
+            elif isinstance(expression, IdentifierExpression):
+                keys.append(expression._name)
+                values.append(expression)
+            else:
+                raise TypeError(f'Cannot derive a json key from {expression!r}, use an identifier or an alias.')
+
+        pairs = join_parts((part for key, value in zip(keys, values) for part in (LiteralExpression(key), value)), ', ')
+
+        # the key is only NULL for a parent without children, by default the first column is assumed to be one
+        key = values[0] if self.key is None else self.key
+        return ['coalesce(json_agg(json_build_object(', *pairs, ')) FILTER (WHERE ', key, " IS NOT NULL), '[]')"]
 
 
 class CastFunctionExpression(FunctionExpression):
@@ -199,8 +235,8 @@ class CastFunctionExpression(FunctionExpression):
     ):
         self.expression = expression
 
-    def __str__(self) -> str:
-        return f'cast({self.expression})'
+    def _parts(self) -> list[Any]:
+        return ['cast(', self.expression, ')']
 
 
 # pgcrypto
@@ -216,8 +252,8 @@ class CryptFunctionExpression(FunctionExpression):
         self.password = password
         self.salt = salt
 
-    def __str__(self) -> str:
-        return f'crypt({self.password}, {self.salt})'
+    def _parts(self) -> list[Any]:
+        return ['crypt(', self.password, ', ', self.salt, ')']
 
 
 class GenSaltFunctionExpression(FunctionExpression):
@@ -230,8 +266,8 @@ class GenSaltFunctionExpression(FunctionExpression):
         self.algorithm = LiteralExpression(algorithm)
         self.cost = LiteralExpression(cost) if cost else None
 
-    def __str__(self) -> str:
+    def _parts(self) -> list[Any]:
         if self.cost:
-            return f'gen_salt({self.algorithm}, {self.cost})'
+            return ['gen_salt(', self.algorithm, ', ', self.cost, ')']
         else:
-            return f'gen_salt({self.algorithm})'
+            return ['gen_salt(', self.algorithm, ')']
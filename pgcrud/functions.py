@@ -7,6 +7,7 @@ from pgcrud.expressions.functions import (
     CryptFunctionExpression,
     GenSaltFunctionExpression,
     JsonBuildObjectFunctionExpression,
+    JsonNestFunctionExpression,
     LowerFunctionExpression,
     ToJsonFunctionExpression,
     UpperFunctionExpression,
@@ -38,6 +39,7 @@ __all__ = [
     'coalesce',
     'to_json',
     'json_build_object',
+    'json_nest',
 
     'crypt',
     'gen_salt',
@@ -100,6 +102,10 @@ def json_build_object(*args: Any) -> JsonBuildObjectFunctionExpression:
     return JsonBuildObjectFunctionExpression([make_expr(arg) for arg in args])
 
 
+def json_nest(*args: Any, key: Any | None = None) -> JsonNestFunctionExpression:
+    return JsonNestFunctionExpression([make_expr(arg) for arg in args], None if key is None else make_expr(key))
+
+
 def cast(value: Any) -> CastFunctionExpression:
     return CastFunctionExpression(make_expr(value))
 
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextvars import ContextVar
+from functools import wraps
+import inspect
+import time
+from types import TracebackType
+from typing import Any, Callable, TypeVar
+
+from psycopg._cursor_base import BaseCursor
+
+from pgcrud.config import config
+
+
+__all__ = [
+    'ExecuteEvent',
+    'Hook',
+    'current_operation',
+    'operation',
+    'get_hooks',
+    'Instrumentation',
+    'count_params',
+    'instrument_stream',
+    'async_instrument_stream',
+]
+
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+current_operation: ContextVar[str | None] = ContextVar('current_operation', default=None)
+
+
+class ExecuteEvent:
+
+    __slots__ = ('operation', 'query', 'params', 'params_count', 'row_count', 'duration', 'error')
+
+    def __init__(
+            self,
+            operation: str | None,
+            query: str,
+            params_count: int,
+            params: Any = None,
+    ):
+        self.operation = operation
+        self.query = query
+        self.params = params
+        self.params_count = params_count
+        self.row_count: int | None = None
+        self.duration: float | None = None
+        self.error: BaseException | None = None
+
+    def __str__(self):
+        return (
+            f'ExecuteEvent(operation={self.operation}, query={self.query}, params_count={self.params_count}, '
+            f'row_count={self.row_count}, duration={self.duration}, error={self.error!r})'
+        )
+
+    def __repr__(self):
+        return str(self)
+
+
+class Hook:
+
+    def before_execute(self, event: ExecuteEvent) -> None:
+        pass
+
+    def after_execute(self, event: ExecuteEvent) -> None:
+        pass
+
+
+def operation(name: str) -> Callable[[F], F]:
+
+    def decorator(fun: F) -> F:
+
+        if inspect.iscoroutinefunction(fun):
+
+            @wraps(fun)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                token = current_operation.set(name)
+                try:
+                    return await fun(*args, **kwargs)
+                finally:
+                    current_operation.reset(token)
+
+            return async_wrapper  # type: ignore
+
+        else:
+
+            @wraps(fun)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                token = current_operation.set(name)
+                try:
+                    return fun(*args, **kwargs)
+                finally:
+                    current_operation.reset(token)
+
+            return wrapper  # type: ignore
+
+    return decorator
+
+
+def get_hooks(cursor: BaseCursor[Any, Any]) -> Sequence[Hook]:
+
+    connection_hooks = getattr(cursor.connection, 'hooks', ())
+
+    if config.hooks:
+        if connection_hooks:
+            return [*config.hooks, *connection_hooks]
+        else:
+            return config.hooks
+    else:
+        return connection_hooks
+
+
+def get_query_str(query: Any) -> str:
+    if isinstance(query, bytes):
+        return query.decode()
+    else:
+        return str(query)
+
+
+def get_params_count(params: Any) -> int:
+    if params is None:
+        return 0
+    elif isinstance(params, (Sequence, dict)) and not isinstance(params, (str, bytes)):
+        return len(params)
+    else:
+        return 1
+
+
+class Instrumentation:
+
+    def __init__(
+            self,
+            hooks: Sequence[Hook],
+            cursor: BaseCursor[Any, Any],
+            query: Any,
+            params: Any,
+            params_count: int | None = None,
+    ):
+        self.hooks = hooks
+        self.cursor = cursor
+        self.event = ExecuteEvent(
+            operation=current_operation.get(),
+            query=get_query_str(query),
+            params_count=get_params_count(params) if params_count is None else params_count,
+            params=params,
+        )
+        self.start = 0.0
+
+    def __enter__(self) -> ExecuteEvent:
+
+        for hook in self.hooks:
+            hook.before_execute(self.event)
+
+        self.start = time.perf_counter()
+        return self.event
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None,
+    ) -> None:
+
+        self.event.duration = time.perf_counter() - self.start
+        self.event.error = exc_val
+
+        if self.event.row_count is None:
+            self.event.row_count = self.cursor.rowcount
+
+        for hook in self.hooks:
+            hook.after_execute(self.event)
+
+
+def count_params(event: ExecuteEvent, params_seq: Iterator[Any]) -> Iterator[Any]:
+    for params in params_seq:
+        event.params_count += 1
+        yield params
+
+
+def instrument_stream(instrumentation: Instrumentation, iterator: Iterator[Any]) -> Iterator[Any]:
+
+    with instrumentation as event:
+        event.row_count = 0
+        for row in iterator:
+            event.row_count += 1
+            yield row
+
+
+async def async_instrument_stream(instrumentation: Instrumentation, iterator: AsyncIterator[Any]) -> AsyncIterator[Any]:
+
+    with instrumentation as event:
+        event.row_count = 0
+        async for row in iterator:
+            event.row_count += 1
+            yield row
@@ -0,0 +1,202 @@
+from functools import lru_cache
+import re
+from threading import Lock
+from typing import Any
+
+from pgcrud.instrumentation import ExecuteEvent, Hook
+
+
+__all__ = [
+    'normalize_query',
+    'LatencyHistogram',
+    'StatementMetrics',
+    'Metrics',
+]
+
+
+LITERAL_PATTERN = re.compile(r"""
+    (?P<identifier>"(?:[^"]|"")*")          # quoted identifiers are kept
+    | (?P<placeholder>%(?:\(\w+\))?s)       # so are placeholders
+    | [EeBbXxUu]?'(?:[^']|'')*'             # string literals
+    | (?<![\w$])-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?(?![\w$])  # numeric literals
+""", re.VERBOSE | re.IGNORECASE)
+
+LIST_PATTERN = re.compile(r'\(\?(?:, \?)*\)')
+LIST_SEQUENCE_PATTERN = re.compile(r'\(\.\.\.\)(?:, \(\.\.\.\))+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def replace_literal(match: re.Match[str]) -> str:
+    return match.group('identifier') or match.group('placeholder') or '?'
+
+
+# Long queries, e.g. an insert with inline VALUES, are rarely repeated verbatim and would keep megabytes in the cache
+MAX_CACHED_QUERY_LENGTH = 2048
+
+# statements beyond this number are aggregated under OTHER_QUERY, so that the metrics stay bounded
+OTHER_QUERY = 'other'
+
+
+def _normalize_query(query: str) -> str:
+    query = WHITESPACE_PATTERN.sub(' ', query).strip()
+    query = LITERAL_PATTERN.sub(replace_literal, query)
+    query = LIST_PATTERN.sub('(...)', query)
+    return LIST_SEQUENCE_PATTERN.sub('(...)', query)
+
+
+_normalize_cached_query = lru_cache(maxsize=1024)(_normalize_query)
+
+
+def normalize_query(query: str) -> str:
+    if len(query) > MAX_CACHED_QUERY_LENGTH:
+        return _normalize_query(query)
+    return _normalize_cached_query(query)
+
+
+class LatencyHistogram:
+
+    # Log-linear buckets as in HDR histograms: values below 2^significant_bits microseconds are recorded exactly, larger
+    # values are rounded down to their significant_bits most significant bits (relative error < 2^-significant_bits).
+
+    def __init__(self, significant_bits: int = 6):
+        self.significant_bits = significant_bits
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+
+        microseconds = max(int(seconds * 1_000_000), 0)
+        shift = max(microseconds.bit_length() - self.significant_bits, 0)
+        bucket = (microseconds >> shift) << shift
+
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.sum += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percentile: float) -> float:
+
+        if not self.count:
+            return 0.0
+        elif percentile >= 100:
+            return self.max
+
+        threshold = percentile / 100 * self.count
+        cumulative = 0
+
+        for bucket in sorted(self.counts):
+            cumulative += self.counts[bucket]
+            if cumulative >= threshold:
+                width = 1 << max(bucket.bit_length() - self.significant_bits, 0)
+                return min((bucket + width / 2) / 1_000_000, self.max)
+
+        return self.max
+
+
+class StatementMetrics:
+
+    def __init__(self, query: str, significant_bits: int = 6):
+        self.query = query
+        self.operations: set[str] = set()
+        self.latency = LatencyHistogram(significant_bits)
+        self.rows = 0
+        self.errors = 0
+
+    def record(self, event: ExecuteEvent) -> None:
+
+        if event.operation:
+            self.operations.add(event.operation)
+
+        self.latency.record(event.duration or 0.0)
+
+        if event.error is not None:
+            self.errors += 1
+        elif event.row_count and event.row_count > 0:
+            self.rows += event.row_count
+
+    def snapshot(self, percentiles: tuple[float, ...]) -> dict[str, Any]:
+        return {
+            'operations': sorted(self.operations),
+            'count': self.latency.count,
+            'errors': self.errors,
+            'rows': self.rows,
+            'sum': self.latency.sum,
+            'min': self.latency.min if self.latency.count else 0.0,
+            'max': self.latency.max,
+            **{f'p{percentile:g}': self.latency.percentile(percentile) for percentile in percentiles},
+        }
+
+
+class Metrics(Hook):
+
+    def __init__(
+            self,
+            percentiles: tuple[float, ...] = (50, 90, 99),
+            significant_bits: int = 6,
+            max_statements: int = 1000,
+    ):
+        self.percentiles = percentiles
+        self.significant_bits = significant_bits
+        self.max_statements = max_statements
+        self._statements: dict[str, StatementMetrics] = {}
+        self._lock = Lock()
+
+    def after_execute(self, event: ExecuteEvent) -> None:
+
+        query = normalize_query(event.query)
+
+        with self._lock:
+            statement = self._statements.get(query)
+            if statement is None:
+                if len(self._statements) >= self.max_statements:
+                    query = OTHER_QUERY
+                    statement = self._statements.get(query)
+                if statement is None:
+                    statement = self._statements[query] = StatementMetrics(query, self.significant_bits)
+            statement.record(event)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._statements.clear()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {query: statement.snapshot(self.percentiles) for query, statement in self._statements.items()}
+
+    def to_prometheus(self, prefix: str = 'pgcrud_statement') -> str:
+
+        lines = [
+            f'# HELP {prefix}_duration_seconds Execution time of statements.',
+            f'# TYPE {prefix}_duration_seconds summary',
+        ]
+
+        with self._lock:
+            statements = list(self._statements.values())
+
+            for statement in statements:
+                label = f'query="{escape_label(statement.query)}"'
+                for percentile in self.percentiles:
+                    value = statement.latency.percentile(percentile)
+                    lines.append(f'{prefix}_duration_seconds{{{label},quantile="{percentile / 100:g}"}} {value:.6f}')
+                lines.append(f'{prefix}_duration_seconds_sum{{{label}}} {statement.latency.sum:.6f}')
+                lines.append(f'{prefix}_duration_seconds_count{{{label}}} {statement.latency.count}')
+
+            lines.append(f'# HELP {prefix}_rows_total Rows returned or affected by statements.')
+            lines.append(f'# TYPE {prefix}_rows_total counter')
+            for statement in statements:
+                lines.append(f'{prefix}_rows_total{{query="{escape_label(statement.query)}"}} {statement.rows}')
+
+            lines.append(f'# HELP {prefix}_errors_total Failed executions of statements.')
+            lines.append(f'# TYPE {prefix}_errors_total counter')
+            for statement in statements:
+                lines.append(f'{prefix}_errors_total{{query="{escape_label(statement.query)}"}} {statement.errors}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
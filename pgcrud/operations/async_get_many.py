@@ -1,14 +1,17 @@
 from collections.abc import Sequence
 from typing import Any, Literal, overload
 
-from pgcrud.db import AsyncCursor, AsyncServerCursor
-from pgcrud.operations.shared import construct_composed_get_query
-from pgcrud.types import Row
+from pgcrud.cache import MISSING, Cache, get_table_names
+from pgcrud.db import AsyncConnection, AsyncConnectionPool, AsyncCursor, AsyncRoutingPool, AsyncServerCursor, AsyncTypedConnection
+from pgcrud.explain import Plan
+from pgcrud.instrumentation import operation
+from pgcrud.operations.shared import async_acquire_cursor, construct_composed_get_query
+from pgcrud.types import Row, RowTypeHint
 
 
 @overload
 async def async_get_many(
-        cursor: AsyncCursor[Row] | AsyncServerCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
         select: Any | Sequence[Any],
         from_: Any,
         *,
@@ -19,13 +22,16 @@ async def async_get_many(
         order_by: Any | Sequence[Any] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[False] = False,
 ) -> list[Row]: ...
 
 
 @overload
 async def async_get_many(
-        cursor: AsyncCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row],
         select: Any | Sequence[Any],
         from_: Any,
         *,
@@ -36,6 +42,9 @@ async def async_get_many(
         order_by: Any | Sequence[Any] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[True],
 ) -> AsyncCursor[Row]: ...
 
@@ -53,12 +62,16 @@ async def async_get_many(
         order_by: Any | Sequence[Any] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[True],
 ) -> AsyncServerCursor[Row]: ...
 
 
+@overload
 async def async_get_many(
-        cursor: AsyncCursor[Row] | AsyncServerCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
         select: Any | Sequence[Any],
         from_: Any,
         *,
@@ -69,13 +82,57 @@ async def async_get_many(
         order_by: Any | Sequence[Any] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[True],
+        analyze: bool = False,
+        buffers: bool = False,
+        no_fetch: bool = False,
+) -> Plan: ...
+
+
+@operation('async_get_many')
+async def async_get_many(
+        cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
+        select: Any | Sequence[Any],
+        from_: Any,
+        *,
+        where: Any | None = None,
+        group_by: Any | Sequence[Any] | None = None,
+        having: Any | None = None,
+        window: Any | Sequence[Any] | None = None,
+        order_by: Any | Sequence[Any] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: bool = False,
+        analyze: bool = False,
+        buffers: bool = False,
         no_fetch: bool | None = False,
-) -> list[Row] | AsyncCursor[Row] | AsyncServerCursor[Row]:
+) -> list[Row] | AsyncCursor[Row] | AsyncServerCursor[Row] | Plan:
 
     query = construct_composed_get_query(select, from_, where, group_by, having, window, order_by, limit, offset)
-    await cursor.execute(query)
 
-    if no_fetch:
-        return cursor
-    else:
-        return await cursor.fetchall()
+    async with async_acquire_cursor(cursor, row_type, no_fetch, read=True) as cursor:
+        if explain:
+            return await query.async_explain(cursor, analyze, buffers)
+
+        if cache is not None and not no_fetch:
+            key = cache.make_key(cursor, query)
+            rows = cache.get(key)
+
+            if rows is MISSING:
+                version = cache.version
+                await cursor.execute(query)
+                rows = await cursor.fetchall()
+                cache.set(key, rows, get_table_names(query), version)
+
+            return list(rows)
+
+        await cursor.execute(query)
+
+        if no_fetch:
+            return cursor
+        else:
+            return await cursor.fetchall()
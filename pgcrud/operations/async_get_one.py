@@ -1,13 +1,16 @@
 from collections.abc import Sequence
 from typing import Any
 
-from pgcrud.db import AsyncCursor, AsyncServerCursor
-from pgcrud.operations.shared import construct_composed_get_query
-from pgcrud.types import Row
+from pgcrud.cache import MISSING, Cache, get_table_names
+from pgcrud.db import AsyncConnection, AsyncConnectionPool, AsyncCursor, AsyncRoutingPool, AsyncServerCursor, AsyncTypedConnection
+from pgcrud.instrumentation import operation
+from pgcrud.operations.shared import async_acquire_cursor, construct_composed_get_query
+from pgcrud.types import Row, RowTypeHint
 
 
+@operation('async_get_one')
 async def async_get_one(
-        cursor: AsyncCursor[Row] | AsyncServerCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
         select: Any | Sequence[Any],
         from_: Any,
         *,
@@ -17,9 +20,25 @@ async def async_get_one(
         window: Any | Sequence[Any] | None = None,
         order_by: Any | Sequence[Any] | None = None,
         offset: int | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
 ) -> Row | None:
 
     query = construct_composed_get_query(select, from_, where, group_by, having, window, order_by, 1, offset)
-    await cursor.execute(query)
 
-    return await cursor.fetchone()
+    async with async_acquire_cursor(cursor, row_type, read=True) as cursor:
+        if cache is not None:
+            key = cache.make_key(cursor, query)
+            row = cache.get(key)
+
+            if row is MISSING:
+                version = cache.version
+                await cursor.execute(query)
+                row = await cursor.fetchone()
+                cache.set(key, row, get_table_names(query), version)
+
+            return row
+
+        await cursor.execute(query)
+
+        return await cursor.fetchone()
@@ -1,47 +1,55 @@
 from collections.abc import Sequence
 from typing import Any, Literal, overload
 
-from pgcrud.db import AsyncCursor, AsyncServerCursor
+from pgcrud.cache import Cache, get_table_names
+from pgcrud.db import AsyncConnection, AsyncConnectionPool, AsyncCursor, AsyncRoutingPool, AsyncServerCursor, AsyncTypedConnection
 from pgcrud.expressions.base import IdentifierExpression
-from pgcrud.operations.shared import construct_composed_insert_query
-from pgcrud.types import Row
+from pgcrud.instrumentation import operation
+from pgcrud.operations.shared import async_acquire_cursor, construct_composed_insert_query
+from pgcrud.types import Row, RowTypeHint
 
 
 @overload
 async def async_insert_many(
-        cursor: AsyncCursor[Row] | AsyncServerCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
         insert_into: IdentifierExpression,
         values: Sequence[Any],
         *,
         # on_conflict: Any | None = None,
         returning: None = None,
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
         no_fetch: Literal[False] = False,
 ) -> None: ...
 
 
 @overload
 async def async_insert_many(
-        cursor: AsyncCursor[Row] | AsyncServerCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
         insert_into: IdentifierExpression,
         values: Sequence[Any],
         *,
         # on_conflict: Any | None = None,
         returning: Any | Sequence[Any],
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
         no_fetch: Literal[False] = False,
 ) -> list[Row]: ...
 
 
 @overload
 async def async_insert_many(
-        cursor: AsyncCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row],
         insert_into: IdentifierExpression,
         values: Sequence[Any],
         *,
         # on_conflict: Any | None = None,
         returning: Any | Sequence[Any],
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
         no_fetch: Literal[True],
 ) -> AsyncCursor[Row]: ...
 
@@ -55,26 +63,36 @@ async def async_insert_many(
         # on_conflict: Any | None = None,
         returning: Any | Sequence[Any],
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
         no_fetch: Literal[True],
 ) -> AsyncServerCursor[Row]: ...
 
 
+@operation('async_insert_many')
 async def async_insert_many(
-        cursor: AsyncCursor[Row] | AsyncServerCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
         insert_into: IdentifierExpression,
         values: Sequence[Any],
         *,
         # on_conflict: Any | None = None,
         returning: Any | Sequence[Any] | None = None,
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
         no_fetch: bool = False,
 ) -> list[Row] | AsyncCursor[Row] | AsyncServerCursor[Row] | None:
 
     query = construct_composed_insert_query(insert_into, values, returning, additional_values)
-    await cursor.execute(query)
 
-    if returning:
-        if no_fetch:
-            return cursor
-        else:
-            return await cursor.fetchall()
+    async with async_acquire_cursor(cursor, row_type, no_fetch) as cursor:
+        await cursor.execute(query)
+
+        if cache is not None:
+            await cache.async_notify(cursor, get_table_names(insert_into))
+
+        if returning:
+            if no_fetch:
+                return cursor
+            else:
+                return await cursor.fetchall()
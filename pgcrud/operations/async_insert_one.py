@@ -1,39 +1,45 @@
 from collections.abc import Sequence
 from typing import Any, overload
 
-from pgcrud.db import AsyncCursor, AsyncServerCursor
+from pgcrud.cache import Cache, get_table_names
+from pgcrud.db import AsyncConnection, AsyncConnectionPool, AsyncCursor, AsyncRoutingPool, AsyncServerCursor, AsyncTypedConnection
 from pgcrud.expressions.base import IdentifierExpression
-from pgcrud.operations.shared import construct_composed_insert_query
-from pgcrud.types import Row
+from pgcrud.instrumentation import operation
+from pgcrud.operations.shared import async_acquire_cursor, construct_composed_insert_query
+from pgcrud.types import Row, RowTypeHint
 
 
 @overload
 async def async_insert_one(
-        cursor: AsyncCursor[Row] | AsyncServerCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
         insert_into: IdentifierExpression,
         values: Any,
         *,
         # on_conflict: Any | None = None,
         returning: None = None,
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
 ) -> None: ...
 
 
 @overload
 async def async_insert_one(
-        cursor: AsyncCursor[Row] | AsyncServerCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
         insert_into: IdentifierExpression,
         values: Any,
         *,
         # on_conflict: None = None,
         returning: Any | Sequence[Any],
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
 ) -> Row: ...
 
 
 # @overload
 # async def async_insert_one(
-#         cursor: AsyncCursor[Row] | AsyncServerCursor[Row],
+#         cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
 #         insert_into: IdentifierExpression,
 #         values: Any,
 #         *,
@@ -43,18 +49,26 @@ async def async_insert_one(
 # ) -> Row | None: ...
 
 
+@operation('async_insert_one')
 async def async_insert_one(
-        cursor: AsyncCursor[Row] | AsyncServerCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
         insert_into: IdentifierExpression,
         values: Any,
         *,
         # on_conflict: Any | None = None,
         returning: Any | Sequence[Any] | None = None,
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
 ) -> Row | None:
 
     query = construct_composed_insert_query(insert_into, [values], returning, additional_values)
-    await cursor.execute(query)
 
-    if returning:
-        return await cursor.fetchone()
+    async with async_acquire_cursor(cursor, row_type) as cursor:
+        await cursor.execute(query)
+
+        if cache is not None:
+            await cache.async_notify(cursor, get_table_names(insert_into))
+
+        if returning:
+            return await cursor.fetchone()
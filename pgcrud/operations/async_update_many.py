@@ -1,15 +1,18 @@
 from collections.abc import Sequence
 from typing import Any, Literal, overload
 
-from pgcrud.db import AsyncCursor, AsyncServerCursor
+from pgcrud.cache import Cache, get_table_names
+from pgcrud.db import AsyncConnection, AsyncConnectionPool, AsyncCursor, AsyncRoutingPool, AsyncServerCursor, AsyncTypedConnection
 from pgcrud.expressions.base import IdentifierExpression
-from pgcrud.operations.shared import construct_composed_update_query
-from pgcrud.types import Row
+from pgcrud.explain import Plan
+from pgcrud.instrumentation import operation
+from pgcrud.operations.shared import async_acquire_cursor, construct_composed_update_query
+from pgcrud.types import Row, RowTypeHint
 
 
 @overload
 async def async_update_many(
-        cursor: AsyncCursor[Row] | AsyncServerCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
         update: Any,
         set_: tuple[IdentifierExpression | Sequence[IdentifierExpression], Any],
         *,
@@ -17,13 +20,16 @@ async def async_update_many(
         where: Any | None = None,
         returning: None = None,
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[False] = False,
 ) -> None: ...
 
 
 @overload
 async def async_update_many(
-        cursor: AsyncCursor[Row] | AsyncServerCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
         update: Any,
         set_: tuple[IdentifierExpression | Sequence[IdentifierExpression], Any],
         *,
@@ -31,13 +37,16 @@ async def async_update_many(
         where: Any | None = None,
         returning: Any | Sequence[Any],
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[False] = False,
 ) -> list[Row]: ...
 
 
 @overload
 async def async_update_many(
-        cursor: AsyncCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row],
         update: Any,
         set_: tuple[IdentifierExpression | Sequence[IdentifierExpression], Any],
         *,
@@ -45,6 +54,9 @@ async def async_update_many(
         where: Any | None = None,
         returning: Any | Sequence[Any],
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[True],
 ) -> AsyncCursor[Row]: ...
 
@@ -59,12 +71,16 @@ async def async_update_many(
         where: Any | None = None,
         returning: Any | Sequence[Any],
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[True],
 ) -> AsyncServerCursor[Row]: ...
 
 
+@overload
 async def async_update_many(
-        cursor: AsyncCursor[Row] | AsyncServerCursor[Row],
+        cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
         update: Any,
         set_: tuple[IdentifierExpression | Sequence[IdentifierExpression], Any],
         *,
@@ -72,14 +88,50 @@ async def async_update_many(
         where: Any | None = None,
         returning: Any | Sequence[Any] | None = None,
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[True],
+        analyze: bool = False,
+        buffers: bool = False,
         no_fetch: bool = False,
-) -> list[Row] | AsyncCursor[Row] | AsyncServerCursor[Row] | None:
+) -> Plan: ...
+
+
+@operation('async_update_many')
+async def async_update_many(
+        cursor: AsyncCursor[Row] | AsyncServerCursor[Row] | AsyncConnection[Row] | AsyncTypedConnection[Row] | AsyncConnectionPool[Row] | AsyncRoutingPool,
+        update: Any,
+        set_: tuple[IdentifierExpression | Sequence[IdentifierExpression], Any],
+        *,
+        from_: Any | None = None,
+        where: Any | None = None,
+        returning: Any | Sequence[Any] | None = None,
+        additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: bool = False,
+        analyze: bool = False,
+        buffers: bool = False,
+        no_fetch: bool = False,
+) -> list[Row] | AsyncCursor[Row] | AsyncServerCursor[Row] | Plan | None:
 
     query = construct_composed_update_query(update, set_, from_,  where, returning, additional_values)
-    await cursor.execute(query)
 
-    if returning:
-        if no_fetch:
-            return cursor
-        else:
-            return await cursor.fetchall()
+    async with async_acquire_cursor(cursor, row_type, no_fetch) as cursor:
+        if explain:
+            if analyze:
+                # EXPLAIN ANALYZE executes the statement, so the write is rolled back
+                async with cursor.connection.transaction(force_rollback=True):
+                    return await query.async_explain(cursor, analyze, buffers)
+            return await query.async_explain(cursor, analyze, buffers)
+
+        await cursor.execute(query)
+
+        if cache is not None:
+            await cache.async_notify(cursor, get_table_names(update))
+
+        if returning:
+            if no_fetch:
+                return cursor
+            else:
+                return await cursor.fetchall()
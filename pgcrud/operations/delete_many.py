@@ -1,43 +1,55 @@
 from collections.abc import Sequence
 from typing import Any, Literal, overload
 
-from pgcrud.db import Cursor, ServerCursor
-from pgcrud.operations.shared import construct_composed_delete_query
-from pgcrud.types import Row
+from pgcrud.cache import Cache, get_table_names
+from pgcrud.db import Connection, ConnectionPool, Cursor, RoutingPool, ServerCursor, TypedConnection
+from pgcrud.explain import Plan
+from pgcrud.instrumentation import operation
+from pgcrud.operations.shared import acquire_cursor, construct_composed_delete_query
+from pgcrud.types import Row, RowTypeHint
 
 
 @overload
 def delete_many(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         delete_from: Any,
         *,
         using: Any | None = None,
         where: Any | None = None,
         returning: None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[False] = False,
 ) -> None: ...
 
 
 @overload
 def delete_many(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         delete_from: Any,
         *,
         using: Any | None = None,
         where: Any | None = None,
         returning: Any | Sequence[Any],
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[False] = False,
 ) -> list[Row]: ...
 
 
 @overload
 def delete_many(
-        cursor: Cursor[Row],
+        cursor: Cursor[Row] | Connection[Row] | TypedConnection[Row],
         delete_from: Any,
         *,
         using: Any | None = None,
         where: Any | None = None,
         returning: Any | Sequence[Any],
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[True],
 ) -> Cursor[Row]: ...
 
@@ -50,25 +62,63 @@ def delete_many(
         using: Any | None = None,
         where: Any | None = None,
         returning: Any | Sequence[Any],
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[True],
 ) -> ServerCursor[Row]: ...
 
 
+@overload
 def delete_many(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         delete_from: Any,
         *,
         using: Any | None = None,
         where: Any | None = None,
         returning: Any | Sequence[Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[True],
+        analyze: bool = False,
+        buffers: bool = False,
         no_fetch: bool = False,
-) -> list[Row] | Cursor[Row] | ServerCursor[Row] | None:
+) -> Plan: ...
+
+
+@operation('delete_many')
+def delete_many(
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
+        delete_from: Any,
+        *,
+        using: Any | None = None,
+        where: Any | None = None,
+        returning: Any | Sequence[Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: bool = False,
+        analyze: bool = False,
+        buffers: bool = False,
+        no_fetch: bool = False,
+) -> list[Row] | Cursor[Row] | ServerCursor[Row] | Plan | None:
 
     query = construct_composed_delete_query(delete_from, using, where, returning)
-    cursor.execute(query)
 
-    if returning:
-        if no_fetch:
-            return cursor
-        else:
-            return cursor.fetchall()
+    with acquire_cursor(cursor, row_type, no_fetch) as cursor:
+        if explain:
+            if analyze:
+                # EXPLAIN ANALYZE executes the statement, so the write is rolled back
+                with cursor.connection.transaction(force_rollback=True):
+                    return query.explain(cursor, analyze, buffers)
+            return query.explain(cursor, analyze, buffers)
+
+        cursor.execute(query)
+
+        if cache is not None:
+            cache.notify(cursor, get_table_names(delete_from))
+
+        if returning:
+            if no_fetch:
+                return cursor
+            else:
+                return cursor.fetchall()
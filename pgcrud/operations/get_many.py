@@ -1,14 +1,17 @@
 from collections.abc import Sequence
 from typing import Any, Literal, overload
 
-from pgcrud.db import Cursor, ServerCursor
-from pgcrud.operations.shared import construct_composed_get_query
-from pgcrud.types import Row
+from pgcrud.cache import MISSING, Cache, get_table_names
+from pgcrud.db import Connection, ConnectionPool, Cursor, RoutingPool, ServerCursor, TypedConnection
+from pgcrud.explain import Plan
+from pgcrud.instrumentation import operation
+from pgcrud.operations.shared import acquire_cursor, construct_composed_get_query
+from pgcrud.types import Row, RowTypeHint
 
 
 @overload
 def get_many(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         select: Any | Sequence[Any],
         from_: Any,
         *,
@@ -19,13 +22,16 @@ def get_many(
         order_by: Any | Sequence[Any] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[False] = False,
 ) -> list[Row]: ...
 
 
 @overload
 def get_many(
-        cursor: Cursor[Row],
+        cursor: Cursor[Row] | Connection[Row] | TypedConnection[Row],
         select: Any | Sequence[Any],
         from_: Any,
         *,
@@ -36,6 +42,9 @@ def get_many(
         order_by: Any | Sequence[Any] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[True],
 ) -> Cursor[Row]: ...
 
@@ -53,12 +62,16 @@ def get_many(
         order_by: Any | Sequence[Any] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[True],
 ) -> ServerCursor[Row]: ...
 
 
+@overload
 def get_many(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         select: Any | Sequence[Any],
         from_: Any,
         *,
@@ -69,13 +82,57 @@ def get_many(
         order_by: Any | Sequence[Any] | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[True],
+        analyze: bool = False,
+        buffers: bool = False,
+        no_fetch: bool = False,
+) -> Plan: ...
+
+
+@operation('get_many')
+def get_many(
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
+        select: Any | Sequence[Any],
+        from_: Any,
+        *,
+        where: Any | None = None,
+        group_by: Any | Sequence[Any] | None = None,
+        having: Any | None = None,
+        window: Any | Sequence[Any] | None = None,
+        order_by: Any | Sequence[Any] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: bool = False,
+        analyze: bool = False,
+        buffers: bool = False,
         no_fetch: bool | None = False,
-) -> list[Row] | Cursor[Row] | ServerCursor[Row]:
+) -> list[Row] | Cursor[Row] | ServerCursor[Row] | Plan:
 
     query = construct_composed_get_query(select, from_, where, group_by, having, window, order_by, limit, offset)
-    cursor.execute(query)
 
-    if no_fetch:
-        return cursor
-    else:
-        return cursor.fetchall()
+    with acquire_cursor(cursor, row_type, no_fetch, read=True) as cursor:
+        if explain:
+            return query.explain(cursor, analyze, buffers)
+
+        if cache is not None and not no_fetch:
+            key = cache.make_key(cursor, query)
+            rows = cache.get(key)
+
+            if rows is MISSING:
+                version = cache.version
+                cursor.execute(query)
+                rows = cursor.fetchall()
+                cache.set(key, rows, get_table_names(query), version)
+
+            return list(rows)
+
+        cursor.execute(query)
+
+        if no_fetch:
+            return cursor
+        else:
+            return cursor.fetchall()
@@ -1,13 +1,16 @@
 from collections.abc import Sequence
 from typing import Any
 
-from pgcrud.db.cursor import Cursor, ServerCursor
-from pgcrud.operations.shared import construct_composed_get_query
-from pgcrud.types import Row
+from pgcrud.cache import MISSING, Cache, get_table_names
+from pgcrud.db import Connection, ConnectionPool, Cursor, RoutingPool, ServerCursor, TypedConnection
+from pgcrud.instrumentation import operation
+from pgcrud.operations.shared import acquire_cursor, construct_composed_get_query
+from pgcrud.types import Row, RowTypeHint
 
 
+@operation('get_one')
 def get_one(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         select: Any | Sequence[Any],
         from_: Any,
         *,
@@ -17,9 +20,25 @@ def get_one(
         window: Any | Sequence[Any] | None = None,
         order_by: Any | Sequence[Any] | None = None,
         offset: int | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
 ) -> Row | None:
 
     query = construct_composed_get_query(select, from_, where, group_by, having, window, order_by, 1, offset)
-    cursor.execute(query)
 
-    return cursor.fetchone()
+    with acquire_cursor(cursor, row_type, read=True) as cursor:
+        if cache is not None:
+            key = cache.make_key(cursor, query)
+            row = cache.get(key)
+
+            if row is MISSING:
+                version = cache.version
+                cursor.execute(query)
+                row = cursor.fetchone()
+                cache.set(key, row, get_table_names(query), version)
+
+            return row
+
+        cursor.execute(query)
+
+        return cursor.fetchone()
@@ -1,47 +1,55 @@
 from collections.abc import Sequence
 from typing import Any, Literal, overload
 
-from pgcrud.db import Cursor, ServerCursor
+from pgcrud.cache import Cache, get_table_names
+from pgcrud.db import Connection, ConnectionPool, Cursor, RoutingPool, ServerCursor, TypedConnection
 from pgcrud.expressions.base import IdentifierExpression
-from pgcrud.operations.shared import construct_composed_insert_query
-from pgcrud.types import Row
+from pgcrud.instrumentation import operation
+from pgcrud.operations.shared import acquire_cursor, construct_composed_insert_query
+from pgcrud.types import Row, RowTypeHint
 
 
 @overload
 def insert_many(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         insert_into: IdentifierExpression,
         values: Sequence[Any],
         *,
         # on_conflict: Any | None = None,
         returning: None = None,
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
         no_fetch: Literal[False] = False,
 ) -> None: ...
 
 
 @overload
 def insert_many(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         insert_into: IdentifierExpression,
         values: Sequence[Any],
         *,
         # on_conflict: Any | None = None,
         returning: Any | Sequence[Any],
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
         no_fetch: Literal[False] = False,
 ) -> list[Row]: ...
 
 
 @overload
 def insert_many(
-        cursor: Cursor[Row],
+        cursor: Cursor[Row] | Connection[Row] | TypedConnection[Row],
         insert_into: IdentifierExpression,
         values: Sequence[Any],
         *,
         # on_conflict: Any | None = None,
         returning: Any | Sequence[Any],
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
         no_fetch: Literal[True],
 ) -> Cursor[Row]: ...
 
@@ -55,26 +63,36 @@ def insert_many(
         # on_conflict: Any | None = None,
         returning: Any | Sequence[Any],
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
         no_fetch: Literal[True],
 ) -> ServerCursor[Row]: ...
 
 
+@operation('insert_many')
 def insert_many(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         insert_into: IdentifierExpression,
         values: Sequence[Any],
         *,
         # on_conflict: Any | None = None,
         returning: Any | Sequence[Any] | None = None,
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
         no_fetch: bool = False,
 ) -> list[Row] | Cursor[Row] | ServerCursor[Row] | None:
 
     query = construct_composed_insert_query(insert_into, values, returning, additional_values)
-    cursor.execute(query)
 
-    if returning:
-        if no_fetch:
-            return cursor
-        else:
-            return cursor.fetchall()
+    with acquire_cursor(cursor, row_type, no_fetch) as cursor:
+        cursor.execute(query)
+
+        if cache is not None:
+            cache.notify(cursor, get_table_names(insert_into))
+
+        if returning:
+            if no_fetch:
+                return cursor
+            else:
+                return cursor.fetchall()
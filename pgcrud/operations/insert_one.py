@@ -1,39 +1,45 @@
 from collections.abc import Sequence
 from typing import Any, overload
 
-from pgcrud.db import Cursor, ServerCursor
+from pgcrud.cache import Cache, get_table_names
+from pgcrud.db import Connection, ConnectionPool, Cursor, RoutingPool, ServerCursor, TypedConnection
 from pgcrud.expressions.base import IdentifierExpression
-from pgcrud.operations.shared import construct_composed_insert_query
-from pgcrud.types import Row
+from pgcrud.instrumentation import operation
+from pgcrud.operations.shared import acquire_cursor, construct_composed_insert_query
+from pgcrud.types import Row, RowTypeHint
 
 
 @overload
 def insert_one(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         insert_into: IdentifierExpression,
         values: Any,
         *,
         # on_conflict: Any | None = None,
         returning: None = None,
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
 ) -> None: ...
 
 
 @overload
 def insert_one(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         insert_into: IdentifierExpression,
         values: Any,
         *,
         # on_conflict_on_constraint: None = None,
         returning: Any | Sequence[Any],
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
 ) -> Row: ...
 
 
 # @overload
 # def insert_one(
-#         cursor: Cursor[Row] | ServerCursor[Row],
+#         cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
 #         insert_into: IdentifierExpression,
 #         values: Any,
 #         *,
@@ -43,18 +49,26 @@ def insert_one(
 # ) -> Row | None: ...
 
 
+@operation('insert_one')
 def insert_one(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         insert_into: IdentifierExpression,
         values: Any,
         *,
         # on_conflict: Any | None = None,
         returning: Any | Sequence[Any] | None = None,
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
 ) -> Row | None:
 
     query = construct_composed_insert_query(insert_into, [values], returning, additional_values)
-    cursor.execute(query)
 
-    if returning:
-        return cursor.fetchone()
+    with acquire_cursor(cursor, row_type) as cursor:
+        cursor.execute(query)
+
+        if cache is not None:
+            cache.notify(cursor, get_table_names(insert_into))
+
+        if returning:
+            return cursor.fetchone()
@@ -1,13 +1,23 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any
 
+from psycopg.pq import TransactionStatus
+
+from pgcrud.db.connection import Connection, AsyncConnection, TypedConnection, AsyncTypedConnection
+from pgcrud.db.connection_pool import ConnectionPool, AsyncConnectionPool
+from pgcrud.db.routing_pool import RoutingPool, AsyncRoutingPool
+from pgcrud.db.shared import get_params, get_row_factory
 from pgcrud.expressions.base import IdentifierExpression
 from pgcrud.query import Query
 from pgcrud.query_builder import QueryBuilder as q
+from pgcrud.types import RowTypeHint
 from pgcrud.utils import ensure_seq
 
 
 __all__ = [
+    'acquire_cursor',
+    'async_acquire_cursor',
     'construct_composed_get_query',
     'construct_composed_insert_query',
     'construct_composed_update_query',
@@ -108,3 +118,123 @@ def construct_composed_delete_query(
         query = query.RETURNING(*ensure_seq(returning))
 
     return query
+
+
+def is_idle(connection: Connection[Any] | AsyncConnection[Any]) -> bool:
+    return connection.info.transaction_status == TransactionStatus.IDLE
+
+
+@contextmanager
+def acquire_cursor(target: Any, row_type: RowTypeHint | None, no_fetch: bool | None = False, read: bool = False) -> Iterator[Any]:
+
+    if isinstance(target, (ConnectionPool, RoutingPool)):
+        if no_fetch:
+            raise TypeError('The connection of a pool is returned after the statement, use a connection to fetch from the cursor.')
+
+        # the connection is only held for the statement, reads go to a replica of a routing pool
+        with (target.read_connection() if read and isinstance(target, RoutingPool) else target.connection()) as connection:
+            if read and not connection.autocommit and is_idle(connection):
+                # a single read needs no transaction, which saves the BEGIN and COMMIT
+                connection.autocommit = True
+                try:
+                    with acquire_cursor(connection, row_type) as cursor:
+                        yield cursor
+                finally:
+                    if not connection.closed:
+                        connection.autocommit = False
+            else:
+                with acquire_cursor(connection, row_type) as cursor:
+                    yield cursor
+        return
+
+    if isinstance(target, TypedConnection):
+        connection: Connection[Any] = target.connection
+    elif isinstance(target, Connection):
+        connection = target
+    else:
+        # a cursor is used as it is, a row_type applies to this statement only
+        if row_type is None:
+            yield target
+        elif no_fetch:
+            raise TypeError('The row_type of a cursor would be reset before fetching, use cursor[row_type] instead.')
+        else:
+            previous_row_factory = target.row_factory
+            target.row_factory = get_row_factory(*get_params(row_type))  # type: ignore
+            try:
+                yield target
+            finally:
+                target.row_factory = previous_row_factory
+        return
+
+    if row_type is None:
+        row_factory = target.row_factory
+    else:
+        row_factory = get_row_factory(*get_params(row_type))  # type: ignore
+
+    # the caller fetches from the returned cursor, so it cannot be reused
+    if no_fetch:
+        yield connection.cursor(row_factory=row_factory)
+        return
+
+    cursor = connection._acquire_cursor(row_factory)
+    try:
+        yield cursor
+    finally:
+        connection._release_cursor(cursor)
+
+
+@asynccontextmanager
+async def async_acquire_cursor(target: Any, row_type: RowTypeHint | None, no_fetch: bool | None = False, read: bool = False) -> AsyncIterator[Any]:
+
+    if isinstance(target, (AsyncConnectionPool, AsyncRoutingPool)):
+        if no_fetch:
+            raise TypeError('The connection of a pool is returned after the statement, use a connection to fetch from the cursor.')
+
+        async with (target.read_connection() if read and isinstance(target, AsyncRoutingPool) else target.connection()) as connection:
+            if read and not connection.autocommit and is_idle(connection):
+                await connection.set_autocommit(True)
+                try:
+                    async with async_acquire_cursor(connection, row_type) as cursor:
+                        yield cursor
+                finally:
+                    if not connection.closed:
+                        await connection.set_autocommit(False)
+            else:
+                async with async_acquire_cursor(connection, row_type) as cursor:
+                    yield cursor
+        return
+
+    if isinstance(target, AsyncTypedConnection):
+        connection: AsyncConnection[Any] = target.connection
+    elif isinstance(target, AsyncConnection):
+        connection = target
+    else:
+        # a cursor is used as it is, a row_type applies to this statement only
+        if row_type is None:
+            yield target
+        elif no_fetch:
+            raise TypeError('The row_type of a cursor would be reset before fetching, use cursor[row_type] instead.')
+        else:
+            previous_row_factory = target.row_factory
+            target.row_factory = get_row_factory(*get_params(row_type))  # type: ignore
+            try:
+                yield target
+            finally:
+                target.row_factory = previous_row_factory
+        return
+
+    if row_type is None:
+        row_factory = target.row_factory
+    else:
+        row_factory = get_row_factory(*get_params(row_type))  # type: ignore
+
+    # the caller fetches from the returned cursor, so it cannot be reused
+    if no_fetch:
+        yield connection.cursor(row_factory=row_factory)
+        return
+
+    cursor = connection._acquire_cursor(row_factory)
+    try:
+        yield cursor
+    finally:
+        connection._release_cursor(cursor)
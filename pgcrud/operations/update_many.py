@@ -1,15 +1,18 @@
 from collections.abc import Sequence
 from typing import Any, Literal, overload
 
-from pgcrud.db import Cursor, ServerCursor
+from pgcrud.cache import Cache, get_table_names
+from pgcrud.db import Connection, ConnectionPool, Cursor, RoutingPool, ServerCursor, TypedConnection
 from pgcrud.expressions.base import IdentifierExpression
-from pgcrud.operations.shared import construct_composed_update_query
-from pgcrud.types import Row
+from pgcrud.explain import Plan
+from pgcrud.instrumentation import operation
+from pgcrud.operations.shared import acquire_cursor, construct_composed_update_query
+from pgcrud.types import Row, RowTypeHint
 
 
 @overload
 def update_many(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         update: Any,
         set_: tuple[IdentifierExpression | Sequence[IdentifierExpression], Any],
         *,
@@ -17,13 +20,16 @@ def update_many(
         where: Any | None = None,
         returning: None = None,
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[False] = False,
 ) -> None: ...
 
 
 @overload
 def update_many(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         update: Any,
         set_: tuple[IdentifierExpression | Sequence[IdentifierExpression], Any],
         *,
@@ -31,13 +37,16 @@ def update_many(
         where: Any | None = None,
         returning: Any | Sequence[Any],
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[False] = False,
 ) -> list[Row]: ...
 
 
 @overload
 def update_many(
-        cursor: Cursor[Row],
+        cursor: Cursor[Row] | Connection[Row] | TypedConnection[Row],
         update: Any,
         set_: tuple[IdentifierExpression | Sequence[IdentifierExpression], Any],
         *,
@@ -45,6 +54,9 @@ def update_many(
         where: Any | None = None,
         returning: Any | Sequence[Any],
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[True],
 ) -> Cursor[Row]: ...
 
@@ -59,12 +71,16 @@ def update_many(
         where: Any | None = None,
         returning: Any | Sequence[Any],
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[False] = False,
         no_fetch: Literal[True],
 ) -> ServerCursor[Row]: ...
 
 
+@overload
 def update_many(
-        cursor: Cursor[Row] | ServerCursor[Row],
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
         update: Any,
         set_: tuple[IdentifierExpression | Sequence[IdentifierExpression], Any],
         *,
@@ -72,14 +88,50 @@ def update_many(
         where: Any | None = None,
         returning: Any | Sequence[Any] | None = None,
         additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: Literal[True],
+        analyze: bool = False,
+        buffers: bool = False,
         no_fetch: bool = False,
-) -> list[Row] | Cursor[Row] | ServerCursor[Row] | None:
+) -> Plan: ...
+
+
+@operation('update_many')
+def update_many(
+        cursor: Cursor[Row] | ServerCursor[Row] | Connection[Row] | TypedConnection[Row] | ConnectionPool[Row] | RoutingPool,
+        update: Any,
+        set_: tuple[IdentifierExpression | Sequence[IdentifierExpression], Any],
+        *,
+        from_: Any | None = None,
+        where: Any | None = None,
+        returning: Any | Sequence[Any] | None = None,
+        additional_values: dict[str, Any] | None = None,
+        row_type: RowTypeHint | None = None,
+        cache: Cache | None = None,
+        explain: bool = False,
+        analyze: bool = False,
+        buffers: bool = False,
+        no_fetch: bool = False,
+) -> list[Row] | Cursor[Row] | ServerCursor[Row] | Plan | None:
 
     query = construct_composed_update_query(update, set_, from_, where, returning, additional_values)
-    cursor.execute(query)
 
-    if returning:
-        if no_fetch:
-            return cursor
-        else:
-            return cursor.fetchall()
+    with acquire_cursor(cursor, row_type, no_fetch) as cursor:
+        if explain:
+            if analyze:
+                # EXPLAIN ANALYZE executes the statement, so the write is rolled back
+                with cursor.connection.transaction(force_rollback=True):
+                    return query.explain(cursor, analyze, buffers)
+            return query.explain(cursor, analyze, buffers)
+
+        cursor.execute(query)
+
+        if cache is not None:
+            cache.notify(cursor, get_table_names(update))
+
+        if returning:
+            if no_fetch:
+                return cursor
+            else:
+                return cursor.fetchall()
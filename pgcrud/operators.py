@@ -0,0 +1,17 @@
+from typing import Any
+
+from pgcrud.expressions.base import make_expr, ConjunctionOperationExpression, DisjunctionOperationExpression
+
+
+__all__ = [
+    'all_of',
+    'any_of',
+]
+
+
+def all_of(*args: Any) -> ConjunctionOperationExpression:
+    return ConjunctionOperationExpression([make_expr(arg) for arg in args])
+
+
+def any_of(*args: Any) -> DisjunctionOperationExpression:
+    return DisjunctionOperationExpression([make_expr(arg) for arg in args])
@@ -1,22 +1,19 @@
-# pyright: reportPossiblyUnboundVariable=false, reportMissingImports=false
+# pyright: reportMissingImports=false
 
 from collections.abc import Sequence
+from functools import cache
 import importlib.util
-from typing import Any, Callable
+import sys
+from types import ModuleType
+from typing import Any, Callable, TYPE_CHECKING
 
 from psycopg._cursor_base import BaseCursor
 from psycopg.rows import BaseRowFactory, RowMaker, scalar_row
 
 
-is_pydantic_installed = bool(importlib.util.find_spec('pydantic'))
-is_msgspec_installed = bool(importlib.util.find_spec('msgspec'))
-
-if is_pydantic_installed:
+if TYPE_CHECKING:
     from pydantic import BaseModel as PydanticModel, TypeAdapter as PydanticTypeAdapter
-
-if is_msgspec_installed:
-    from msgspec import Struct as MsgspecModel, to_builtins as msgspec_to_builtins, convert as msgspec_convert
-    from msgspec.json import encode as msgspec_encode, decode as msgspec_decode
+    from msgspec import Struct as MsgspecModel
 
 
 __all__ = [
@@ -40,23 +37,53 @@ __all__ = [
 ]
 
 
-pydantic_type_adapters: dict[type, 'PydanticTypeAdapter'] = {}
+# pydantic and msgspec are imported on first use only. A model or an instance of a model can only exist if the
+# library has already been imported by someone else, so the checks below never trigger the import themselves.
+
+is_pydantic_installed = bool(importlib.util.find_spec('pydantic'))
+is_msgspec_installed = bool(importlib.util.find_spec('msgspec'))
+
+
+pydantic_type_adapters: dict[Any, 'PydanticTypeAdapter'] = {}
+
+
+@cache
+def import_pydantic() -> ModuleType:
+    import pydantic
+    return pydantic
+
+
+@cache
+def import_msgspec() -> ModuleType:
+    import msgspec
+    import msgspec.json
+    return msgspec
+
+
+def get_pydantic_type_adapter(row_type: Any) -> 'PydanticTypeAdapter':
+
+    ta = pydantic_type_adapters.get(row_type)
+
+    if ta is None:
+        ta = pydantic_type_adapters[row_type] = import_pydantic().TypeAdapter(row_type)
+
+    return ta
 
 
 def is_pydantic_model(type_: type) -> bool:
-    return issubclass(type_, PydanticModel)
+    return 'pydantic' in sys.modules and issubclass(type_, import_pydantic().BaseModel)
 
 
 def is_msgspec_model(type_: type) -> bool:
-    return issubclass(type_, MsgspecModel)
+    return 'msgspec' in sys.modules and issubclass(type_, import_msgspec().Struct)
 
 
 def is_pydantic_instance(value: Any) -> bool:
-    return isinstance(value, PydanticModel)
+    return 'pydantic' in sys.modules and isinstance(value, import_pydantic().BaseModel)
 
 
 def is_msgspec_instance(value: Any) -> bool:
-    return isinstance(value, MsgspecModel)
+    return 'msgspec' in sys.modules and isinstance(value, import_msgspec().Struct)
 
 
 def pydantic_to_dict(value: 'PydanticModel') -> dict[str, Any]:
@@ -64,12 +91,12 @@ def pydantic_to_dict(value: 'PydanticModel') -> dict[str, Any]:
 
 
 def msgspec_to_dict(value: 'MsgspecModel') -> dict[str, Any]:
-    return msgspec_to_builtins(value)
+    return import_msgspec().to_builtins(value)
 
 
 def pydantic_kwargs_fun_generator(row_type: type, strict: bool) -> Callable[..., Any]:
 
-    ta = pydantic_type_adapters.get(row_type) or PydanticTypeAdapter(row_type)
+    ta = get_pydantic_type_adapter(row_type)
 
     def kwargs_fun(**kwargs: Any) -> Any:
         return ta.validate_python(kwargs, strict=strict)
@@ -79,15 +106,17 @@ def pydantic_kwargs_fun_generator(row_type: type, strict: bool) -> Callable[...,
 
 def msgspec_kwargs_fun_generator(row_type: type, strict: bool) -> Callable[..., Any]:
 
+    convert = import_msgspec().convert
+
     def kwargs_fun(**kwargs: Any) -> Any:
-        return msgspec_convert(kwargs, type=row_type, strict=strict)
+        return convert(kwargs, type=row_type, strict=strict)
 
     return kwargs_fun
 
 
 def pydantic_args_fun_generator(row_type: type, strict: bool) -> Callable[..., Any]:
 
-    ta = pydantic_type_adapters.get(row_type) or PydanticTypeAdapter(row_type)
+    ta = get_pydantic_type_adapter(row_type)
 
     def args_fun(*args: Any) -> Any:
         return ta.validate_python(args, strict=strict)
@@ -97,15 +126,17 @@ def pydantic_args_fun_generator(row_type: type, strict: bool) -> Callable[..., A
 
 def msgspec_args_fun_generator(row_type: type, strict: bool) -> Callable[..., Any]:
 
+    convert = import_msgspec().convert
+
     def args_fun(*args: Any) -> Any:
-        return msgspec_convert(args, type=row_type, strict=strict)
+        return convert(args, type=row_type, strict=strict)
 
     return args_fun
 
 
 def pydantic_scalar_row_generator(row_type: type, strict: bool) -> BaseRowFactory[Any]:
 
-    ta = pydantic_type_adapters.get(row_type) or PydanticTypeAdapter(row_type)
+    ta = get_pydantic_type_adapter(row_type)
 
     def pydantic_scalar_row(cursor: BaseCursor[Any, Any]) -> RowMaker[Any]:
         scalar_row(cursor)
@@ -120,11 +151,13 @@ def pydantic_scalar_row_generator(row_type: type, strict: bool) -> BaseRowFactor
 
 def msgspec_scalar_row_generator(row_type: type, strict: bool) -> BaseRowFactory[Any]:
 
+    convert = import_msgspec().convert
+
     def msgspec_scalar_row(cursor: BaseCursor[Any, Any]) -> RowMaker[Any]:
         scalar_row(cursor)
 
         def msgspec_scalar_row_(values: Sequence[Any]) -> Any:
-            return msgspec_convert(values[0], type=row_type, strict=strict)
+            return convert(values[0], type=row_type, strict=strict)
 
         return msgspec_scalar_row_
 
@@ -132,8 +165,8 @@ def msgspec_scalar_row_generator(row_type: type, strict: bool) -> BaseRowFactory
 
 
 def msgspec_json_dumps(obj: Any) -> bytes:
-    return msgspec_encode(obj)
+    return import_msgspec().json.encode(obj)
 
 
 def msgspec_json_loads(buf: bytes | str) -> Any:
-    return msgspec_decode(buf)
+    return import_msgspec().json.decode(buf)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
-from typing import Any, Self
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from psycopg._cursor_base import BaseCursor
 
 from pgcrud.clauses import (
     Clause,
@@ -36,6 +38,8 @@ from pgcrud.expressions.base import (
     AsClauseExpression,
 )
 from pgcrud.expressions.base import QueryExpression
+from pgcrud.explain import Plan, explain, async_explain
+from pgcrud.schema import current_schema, exclude_tables, use_schema
 from pgcrud.utils import ensure_seq
 
 
@@ -44,11 +48,35 @@ __all__ = ['Query']
 
 class Query:
 
-    def __init__(self, clauses: list[Clause]):
-        self.clauses = clauses
+    # Queries are immutable, every clause returns a new query which shares the clauses of the previous one. They can be
+    # reused across threads and used as dictionary keys, equal queries render to the same SQL.
+    __slots__ = ('_clauses', '_sql', '_hash')
+
+    def __init__(self, clauses: Iterable[Clause]):
+        self._clauses = tuple(clauses)
+        self._sql: str | None = None
+        self._hash: int | None = None
 
     def __str__(self):
-        return ' '.join([str(clause) for clause in self.clauses if clause])
+
+        if current_schema.get() is None:
+            if self._sql is None:
+                self._sql = self._render()
+            return self._sql
+
+        return self._render()
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self.key)
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        # anything but a query is compared by the expression on the other side, e.g. i.id == q.SELECT(...)
+        if isinstance(other, Query):
+            return self is other or (hash(self) == hash(other) and self.key == other.key)
+        else:
+            return NotImplemented
 
     def __repr__(self):
         return str(self)
@@ -57,113 +85,124 @@ class Query:
     def _expr(self) -> QueryExpression:
         return QueryExpression(self)
 
-    def merge(self, query: Query) -> Self:
-        self.clauses += query.clauses
-        return self
+    @property
+    def clauses(self) -> tuple[Clause, ...]:
+        return self._clauses
+
+    @property
+    def key(self) -> str:
+        # the SQL without a schema, which identifies the query wherever it is executed
+        if current_schema.get() is None:
+            return str(self)
+        with use_schema(None):
+            return str(self)
+
+    def _render(self) -> str:
+
+        if current_schema.get() is not None:
+            names = {
+                expression.alias._name
+                for clause in self._clauses if isinstance(clause, WithClause)
+                for expression in clause.expressions
+                if isinstance(expression, AsClauseExpression) and isinstance(expression.alias, IdentifierExpression)
+            }
+            if names:
+                with exclude_tables(names):
+                    return ' '.join([str(clause) for clause in self._clauses if clause])
+
+        return ' '.join([str(clause) for clause in self._clauses if clause])
+
+    def _append(self, clause: Clause) -> Query:
+        return Query((*self._clauses, clause))
+
+    def explain(self, cursor: BaseCursor[Any, Any], analyze: bool = False, buffers: bool = False, *, params: Any = None) -> Plan:
+        return explain(cursor, self, analyze, buffers, params=params)
+
+    async def async_explain(self, cursor: BaseCursor[Any, Any], analyze: bool = False, buffers: bool = False, *, params: Any = None) -> Plan:
+        return await async_explain(cursor, self, analyze, buffers, params=params)
+
+    def merge(self, query: Query) -> Query:
+        return Query(self._clauses + query.clauses)
 
     def AS(self, value: Any) -> AsClauseExpression:
         return AsClauseExpression(QueryExpression(self), value)
 
-    def DELETE_FROM(self, value: Any) -> Self:
-        self.clauses.append(DeleteFromClause(make_expr(value)))
-        return self
+    def DELETE_FROM(self, value: Any) -> Query:
+        return self._append(DeleteFromClause(make_expr(value)))
 
     @property
-    def DO_NOTHING(self) -> Self:
-        self.clauses.append(DoNothingClause())
-        return self
+    def DO_NOTHING(self) -> Query:
+        return self._append(DoNothingClause())
 
     @property
-    def DO_UPDATE(self) -> Self:
-        self.clauses.append(DoUpdateClause())
-        return self
+    def DO_UPDATE(self) -> Query:
+        return self._append(DoUpdateClause())
 
-    def FROM(self, value: Any) -> Self:
-        self.clauses.append(FromClause(make_expr(value)))
-        return self
+    def FROM(self, value: Any) -> Query:
+        return self._append(FromClause(make_expr(value)))
 
-    def GROUP_BY(self, *args: Any) -> Self:
-        self.clauses.append(GroupByClause([make_expr(arg) for arg in args]))
-        return self
+    def GROUP_BY(self, *args: Any) -> Query:
+        return self._append(GroupByClause([make_expr(arg) for arg in args]))
 
-    def HAVING(self, value: Any) -> Self:
-        self.clauses.append(HavingClause(make_expr(value)))
-        return self
+    def HAVING(self, value: Any) -> Query:
+        return self._append(HavingClause(make_expr(value)))
 
-    def INSERT_INTO(self, value: IdentifierExpression) -> Self:
-        self.clauses.append(InsertIntoClause(value))
-        return self
+    def INSERT_INTO(self, value: IdentifierExpression) -> Query:
+        return self._append(InsertIntoClause(value))
 
-    def LIMIT(self, value: int) -> Self:
-        self.clauses.append(LimitClause(value))
-        return self
+    def LIMIT(self, value: int) -> Query:
+        return self._append(LimitClause(value))
 
-    def OFFSET(self, value: int) -> Self:
-        self.clauses.append(OffsetClause(value))
-        return self
+    def OFFSET(self, value: int) -> Query:
+        return self._append(OffsetClause(value))
 
     @property
-    def ON_CONFLICT(self) -> Self:
-        self.clauses.append(OnConflictExpression())
-        return self
+    def ON_CONFLICT(self) -> Query:
+        return self._append(OnConflictExpression())
 
-    def ON_CONSTRAINT(self, value: Any) -> Self:
-        self.clauses.append(OnConstraintClause(make_expr(value)))
-        return self
+    def ON_CONSTRAINT(self, value: Any) -> Query:
+        return self._append(OnConstraintClause(make_expr(value)))
 
-    def ORDER_BY(self, *args: Any) -> Self:
-        self.clauses.append(OrderByClause([make_expr(arg) for arg in args]))
-        return self
+    def ORDER_BY(self, *args: Any) -> Query:
+        return self._append(OrderByClause([make_expr(arg) for arg in args]))
 
-    def PARTITION_BY(self, *args: Any) -> Self:
-        self.clauses.append(PartitionByClause([make_expr(arg) for arg in args]))
-        return self
+    def PARTITION_BY(self, *args: Any) -> Query:
+        return self._append(PartitionByClause([make_expr(arg) for arg in args]))
 
-    def RANGE_BETWEEN(self, start: Any, end: Any) -> Self:
-        self.clauses.append(RangeBetweenClause(make_expr(start), make_expr(end)))
-        return self
+    def RANGE_BETWEEN(self, start: Any, end: Any) -> Query:
+        return self._append(RangeBetweenClause(make_expr(start), make_expr(end)))
 
-    def RETURNING(self, *args: Any) -> Self:
-        self.clauses.append(ReturningClause([make_expr(arg) for arg in args]))
-        return self
+    def RETURNING(self, *args: Any) -> Query:
+        return self._append(ReturningClause([make_expr(arg) for arg in args]))
 
-    def ROWS_BETWEEN(self, start: Any, end: Any) -> Self:
-        self.clauses.append(RowsBetweenClause(make_expr(start), make_expr(end)))
-        return self
+    def ROWS_BETWEEN(self, start: Any, end: Any) -> Query:
+        return self._append(RowsBetweenClause(make_expr(start), make_expr(end)))
 
-    def SELECT(self, *args: Any) -> Self:
-        self.clauses.append(SelectClause([make_expr(arg) for arg in args]))
-        return self
+    def SELECT(self, *args: Any) -> Query:
+        return self._append(SelectClause([make_expr(arg) for arg in args]))
 
-    def SET(self, columns: IdentifierExpression | Sequence[IdentifierExpression], values: Any, **kwargs: Any) -> Self:
-        self.clauses.append(SetClause(ensure_seq(columns), values, kwargs))
-        return self
+    def SET(self, columns: IdentifierExpression | Sequence[IdentifierExpression], values: Any, **kwargs: Any) -> Query:
+        return self._append(SetClause(ensure_seq(columns), values, kwargs))
 
-    def UPDATE(self, value: Any) -> Self:
-        self.clauses.append(UpdateClause(make_expr(value)))
-        return self
+    def UPDATE(self, value: Any) -> Query:
+        return self._append(UpdateClause(make_expr(value)))
 
-    def USING(self, value: Any) -> Self:
-        self.clauses.append(UsingClause(make_expr(value)))
-        return self
+    def USING(self, value: Any) -> Query:
+        return self._append(UsingClause(make_expr(value)))
 
-    def VALUES(self, *args: Any, **kwargs: Any) -> Self:
+    def VALUES(self, *args: Any, **kwargs: Any) -> Query:
         order = None
-        if len(self.clauses) > 0:
-            clause = self.clauses[-1]
+        if len(self._clauses) > 0:
+            clause = self._clauses[-1]
             if isinstance(clause, InsertIntoClause):
                 order = clause.identifier_expression._columns
-        self.clauses.append(ValuesClause(args, kwargs, order))
-        return self
+        return self._append(ValuesClause(args, kwargs, order))
 
-    def WINDOW(self, *args: Any) -> Self:
-        self.clauses.append(WindowClause([make_expr(arg) for arg in args]))
-        return self
+    def WINDOW(self, *args: Any) -> Query:
+        return self._append(WindowClause([make_expr(arg) for arg in args]))
 
-    def WITH(self, *args: Any) -> Self:
-        self.clauses.append(WithClause([make_expr(arg) for arg in args]))
-        return self
+    def WITH(self, *args: Any) -> Query:
+        return self._append(WithClause([make_expr(arg) for arg in args]))
 
-    def WHERE(self, value: Any) -> Self:
-        self.clauses.append(WhereClause(make_expr(value)))
-        return self
+    def WHERE(self, value: Any) -> Query:
+        return self._append(WhereClause(make_expr(value)))
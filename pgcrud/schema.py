@@ -0,0 +1,86 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from pgcrud.expressions.base import (
+    Expression,
+    IdentifierExpression,
+    AsClauseExpression,
+    JoinClauseExpression,
+    LeftJoinClauseExpression,
+    RightJoinClauseExpression,
+    InnerJoinClauseExpression,
+    FullJoinClauseExpression,
+    CrossJoinClauseExpression,
+    OnClauseExpression,
+)
+
+
+__all__ = [
+    'current_schema',
+    'use_schema',
+    'exclude_tables',
+    'qualify',
+]
+
+
+current_schema: ContextVar[str | None] = ContextVar('current_schema', default=None)
+
+# names of common table expressions, which must not be qualified
+excluded_tables: ContextVar[frozenset[str]] = ContextVar('excluded_tables', default=frozenset())
+
+JoinClauseExpressions = (
+    JoinClauseExpression,
+    LeftJoinClauseExpression,
+    RightJoinClauseExpression,
+    InnerJoinClauseExpression,
+    FullJoinClauseExpression,
+    CrossJoinClauseExpression,
+)
+
+
+@contextmanager
+def use_schema(schema: str | None) -> Iterator[None]:
+    token = current_schema.set(schema)
+    try:
+        yield
+    finally:
+        current_schema.reset(token)
+
+
+@contextmanager
+def exclude_tables(names: set[str]) -> Iterator[None]:
+    token = excluded_tables.set(excluded_tables.get() | names)
+    try:
+        yield
+    finally:
+        excluded_tables.reset(token)
+
+
+def qualify(expression: Expression) -> Expression:
+
+    schema = current_schema.get()
+
+    if schema is None:
+        return expression
+    else:
+        return qualify_table(expression, schema)
+
+
+def qualify_table(expression: Expression, schema: str) -> Expression:
+
+    if isinstance(expression, IdentifierExpression):
+        if expression._parent is None and expression._name not in excluded_tables.get():
+            qualified = IdentifierExpression(expression._name, IdentifierExpression(schema))
+            qualified._columns = expression._columns
+            return qualified
+        else:
+            return expression
+    elif isinstance(expression, AsClauseExpression):
+        return AsClauseExpression(qualify_table(expression.expression, schema), expression.alias)
+    elif isinstance(expression, OnClauseExpression):
+        return OnClauseExpression(qualify_table(expression.left, schema), expression.right)
+    elif isinstance(expression, JoinClauseExpressions):
+        return type(expression)(qualify_table(expression.left, schema), qualify_table(expression.right, schema))
+    else:
+        return expression
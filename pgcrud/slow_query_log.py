@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import random
+from threading import Lock
+import time
+from typing import Any, TYPE_CHECKING
+
+import psycopg
+import psycopg_pool
+
+from pgcrud.explain import Plan, get_explain_query
+from pgcrud.instrumentation import ExecuteEvent, Hook, current_operation
+
+
+if TYPE_CHECKING:
+    from pgcrud.db import ConnectionPool, AsyncConnectionPool
+
+
+__all__ = [
+    'EXPLAIN_OPERATION',
+    'SlowQuery',
+    'SlowQueryLog',
+]
+
+
+EXPLAIN_OPERATION = 'slow_query_log.explain'
+
+
+def is_select(query: Any) -> bool:
+    if isinstance(query, bytes):
+        query = query.decode()
+    return str(query).lstrip().lstrip('(').upper().startswith('SELECT')
+
+
+class SlowQuery:
+
+    __slots__ = ('operation', 'query', 'params', 'duration', 'row_count', 'error', 'timestamp', 'plan', 'analyzed', 'explain_error')
+
+    def __init__(self, event: ExecuteEvent):
+        self.operation = event.operation
+        self.query = event.query
+        self.params = event.params
+        self.duration = event.duration or 0.0
+        self.row_count = event.row_count
+        self.error = event.error
+        self.timestamp = time.time()
+        self.plan: Plan | None = None
+        self.analyzed = False
+        self.explain_error: BaseException | None = None
+
+    def __str__(self):
+        return f'SlowQuery(operation={self.operation}, query={self.query}, duration={self.duration}, analyzed={self.analyzed})'
+
+    def __repr__(self):
+        return str(self)
+
+
+class SlowQueryLog(Hook):
+
+    def __init__(
+            self,
+            threshold: float = 1.0,
+            max_size: int = 100,
+            pool: ConnectionPool[Any] | AsyncConnectionPool[Any] | None = None,
+            analyze_rate: float = 0.0,
+    ):
+        self.threshold = threshold
+        self.pool = pool
+        self.analyze_rate = analyze_rate
+        self._entries: deque[SlowQuery] = deque(maxlen=max_size)
+        self._lock = Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._pending = False
+        self._conn: Any = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def entries(self) -> list[SlowQuery]:
+        with self._lock:
+            return list(self._entries)
+
+    def after_execute(self, event: ExecuteEvent) -> None:
+
+        if event.operation == EXPLAIN_OPERATION or event.duration is None or event.duration < self.threshold:
+            return
+
+        entry = SlowQuery(event)
+
+        with self._lock:
+            self._entries.append(entry)
+
+        # executemany does not pass its parameters, so there is nothing to explain, and a failed statement is not run again
+        if self.pool is None or event.error is not None or (event.params is None and event.params_count):
+            return
+
+        # EXPLAIN ANALYZE executes the statement, writes are only explained without it
+        analyze = is_select(event.query) and random.random() < self.analyze_rate
+
+        # one explain at a time, entries logged while it is pending are kept without a plan
+        with self._lock:
+            if self._pending:
+                return
+            self._pending = True
+
+        # the plan is captured in the background, so that the slow statement does not get any slower
+        if isinstance(self.pool, psycopg_pool.AsyncConnectionPool):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # a sync cursor executed the statement, there is no event loop to run the async pool on
+                self._pending = False
+                return
+            task = loop.create_task(self._async_explain(entry, analyze))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pgcrud-slow-query-log')
+            self._executor.submit(self._explain, entry, analyze)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def async_close(self) -> None:
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+    def _explain(self, entry: SlowQuery, analyze: bool) -> None:
+
+        token = current_operation.set(EXPLAIN_OPERATION)
+
+        try:
+            # a connection of its own, since a rollback drops the prepared statements of a pooled one
+            if self._conn is None or self._conn.closed:
+                self._conn = self.pool.connect()  # type: ignore
+            # the transaction is rolled back in autocommit mode as well, nothing explained is ever committed
+            with self._conn.transaction(force_rollback=True):
+                entry.plan = Plan(self._conn.execute(get_explain_query(entry.query, analyze), entry.params).fetchone()[0])
+                entry.analyzed = analyze
+        except psycopg.Error as e:
+            entry.explain_error = e
+        finally:
+            current_operation.reset(token)
+            self._pending = False
+
+    async def _async_explain(self, entry: SlowQuery, analyze: bool) -> None:
+
+        current_operation.set(EXPLAIN_OPERATION)
+
+        try:
+            if self._conn is None or self._conn.closed:
+                self._conn = await self.pool.connect()  # type: ignore
+            async with self._conn.transaction(force_rollback=True):
+                cursor = await self._conn.execute(get_explain_query(entry.query, analyze), entry.params)
+                entry.plan = Plan((await cursor.fetchone())[0])
+                entry.analyzed = analyze
+        except psycopg.Error as e:
+            entry.explain_error = e
+        finally:
+            self._pending = False
@@ -13,7 +13,8 @@ __all__ = [
     'SequenceType',
     'ValidationType',
     'ParamsType',
-    'QueryType'
+    'QueryType',
+    'RowTypeHint',
 ]
 
 
@@ -25,3 +26,4 @@ SequenceType = list | tuple
 ValidationType = Literal['pydantic', 'msgspec', None]
 QueryType = Union[LiteralString, bytes, 'Query']
 ParamsType = Union[Any, Sequence[Any], dict[str, Any]]
+RowTypeHint = Union[type[Any], tuple[type[Any], dict[str, Any]]]
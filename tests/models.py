@@ -1,9 +1,40 @@
+from dataclasses import dataclass
+from typing import NamedTuple
+
 from msgspec import Struct
 
 
-__all__ = ['Customer']
+__all__ = [
+    'Customer',
+    'Account',
+    'CustomerWithAccounts',
+    'CustomerDataclass',
+    'CustomerNamedTuple',
+]
 
 
 class Customer(Struct):
     id: int
     name: str
+
+
+class Account(Struct):
+    id: int
+    balance: float
+
+
+class CustomerWithAccounts(Struct):
+    id: int
+    name: str
+    accounts: list[Account]
+
+
+@dataclass
+class CustomerDataclass:
+    id: int
+    name: str
+
+
+class CustomerNamedTuple(NamedTuple):
+    id: int
+    name: str
@@ -0,0 +1,63 @@
+import importlib.metadata
+from typing import Any
+
+import pytest
+
+from benchmarks.compare import compare
+from benchmarks import end_to_end
+from benchmarks.end_to_end import WARMUP_CALLS, get_pgcrud_version, summarize
+from benchmarks.query_construction import CASES, QUERIES
+from benchmarks.row_factories import CASES as ROW_FACTORY_CASES, ROWS, make_fetch
+
+
+def test_query_construction_cases():
+    for case in CASES:
+        case.fun()
+
+    assert str(QUERIES['simple_lookup'][0]()) == 'SELECT "id", "name", "email" FROM "customer" WHERE "id" = 1 LIMIT 1'
+    assert str(QUERIES['where_tree'][0]()).count(' = ') == 20
+    assert str(QUERIES['values_10k'][0]()).count('), (') == 9_999
+
+
+def test_row_factory_cases():
+    names = {case.name for case in ROW_FACTORY_CASES}
+
+    for row_type in ('scalar', 'tuple', 'list', 'set', 'dict', 'dataclass', 'named_tuple', 'pydantic_model', 'msgspec_struct'):
+        assert f'{row_type}.none' in names
+
+    assert make_fetch(list[Any], None, False)()[0] == list(ROWS[0])
+    assert make_fetch(set[Any], None, False)()[0] == set(ROWS[0])
+
+
+def test_summarize_skips_warmup_calls():
+    latencies = [1.0] * WARMUP_CALLS + [0.5] * 4
+    rows = [100] * WARMUP_CALLS + [10] * 4
+    result = summarize('get_many', 'sync', 'tuple', latencies, rows)
+
+    assert result['calls'] == 4
+    assert result['rows_per_sec'] == 20.0
+    assert result['p50'] == 0.5
+
+    with pytest.raises(ValueError):
+        summarize('get_many', 'sync', 'tuple', latencies[:WARMUP_CALLS], rows[:WARMUP_CALLS])
+
+
+def test_pgcrud_version_of_a_checkout(monkeypatch: pytest.MonkeyPatch):
+
+    def version(name: str) -> str:
+        raise importlib.metadata.PackageNotFoundError(name)
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        raise FileNotFoundError('git')
+
+    monkeypatch.setattr(importlib.metadata, 'version', version)
+    assert get_pgcrud_version() != ''
+
+    monkeypatch.setattr(end_to_end.subprocess, 'run', run)
+    assert get_pgcrud_version() == 'unknown'
+
+
+def test_compare():
+    comparisons = compare({'a': 1.0, 'b': 1.0, 'removed': 1.0}, {'a': 1.1, 'b': 2.0, 'added': 1.0}, 1.3)
+
+    assert [(comparison['name'], comparison['regression']) for comparison in comparisons] == [('a', False), ('b', True)]
@@ -0,0 +1,195 @@
+import logging
+import time
+
+from psycopg.pq import TransactionStatus
+import pytest
+
+import pgcrud as pg
+from pgcrud import IdentifierExpression as i, QueryBuilder as q
+from pgcrud.cache import MISSING, CacheListener, get_table_names
+
+
+class Info:
+    transaction_status = TransactionStatus.IDLE
+    search_path: str | None = '"$user", public'
+
+    def parameter_status(self, name: str) -> str | None:
+        return self.search_path
+
+
+class Connection:
+    closed = False
+
+    def __init__(self):
+        self.info = Info()
+
+
+class Cursor:
+    row_factory = None
+
+    def __init__(self, connection: Connection | None = None):
+        self.connection = connection or Connection()
+
+
+def test_get_table_names():
+    assert get_table_names(i.customer) == {'customer'}
+    assert get_table_names(i.customer.AS(i.c).JOIN(i.account.AS(i.a)).ON(i.c.id == i.a.customer_id)) == {'customer', 'account'}
+    assert get_table_names(q.SELECT(i.id).FROM(i.customer).AS(i.c)) == {'customer'}
+
+
+def test_get_table_names_of_subqueries():
+    customer_id = q.SELECT(i.customer_id).FROM(i.account).LIMIT(1)
+    assert get_table_names(q.SELECT(i.id).FROM(i.customer).WHERE(i.id == customer_id).AS(i.c)) == {'customer', 'account'}
+
+    balance = q.SELECT(i.balance).FROM(i.account).WHERE(i.account.customer_id == i.customer.id)
+    assert get_table_names(q.SELECT(i.id, balance.AS(i.balance)).FROM(i.customer).AS(i.c)) == {'customer', 'account'}
+
+    cte = q.WITH(i.a.AS(q.SELECT(i.id).FROM(i.account))).SELECT(i.id).FROM(i.a)
+    assert 'account' in get_table_names(cte.AS(i.c))
+
+
+def test_make_key_depends_on_schema():
+    query = q.SELECT(i.id).FROM(i.customer)
+    cursor = Cursor()
+    key = pg.Cache.make_key(cursor, query)
+
+    with pg.use_schema('tenant'):
+        assert pg.Cache.make_key(cursor, query) != key
+
+    cursor.connection.info.search_path = 'tenant'
+    assert pg.Cache.make_key(cursor, query) != key
+
+
+def test_get_and_set():
+    cache = pg.Cache()
+    key = cache.make_key(Cursor(), q.SELECT(i.id).FROM(i.customer))
+
+    assert cache.get(key) is MISSING
+    cache.set(key, [1, 2], {'customer'})
+    assert cache.get(key) == [1, 2]
+    assert cache.stats == {'size': 1, 'hits': 1, 'misses': 1, 'evictions': 0}
+
+
+def test_ttl():
+    cache = pg.Cache(ttl=0.01)
+    cache.set('key', 1, set())
+    time.sleep(0.02)
+
+    assert cache.get('key') is MISSING
+    assert cache.size == 0
+
+
+def test_lru_eviction():
+    cache = pg.Cache(max_size=2)
+    cache.set('a', 1, set())
+    cache.set('b', 2, set())
+    cache.get('a')
+    cache.set('c', 3, set())
+
+    assert cache.get('b') is MISSING
+    assert cache.get('a') == 1
+    assert cache.evictions == 1
+
+
+def test_invalidate():
+    cache = pg.Cache()
+    cache.set('a', 1, {'customer'})
+    cache.set('b', 2, {'customer', 'account'})
+    cache.set('c', 3, {'transaction'})
+    cache.invalidate('customer')
+
+    assert cache.size == 1
+    assert cache.get('c') == 3
+
+
+def test_notify_invalidates_without_channel():
+    cache = pg.Cache()
+    cache.set('a', 1, {'customer'})
+    cache.notify(Cursor(), {'customer'})  # type: ignore
+
+    assert cache.get('a') is MISSING
+
+
+def test_listen_requires_channel():
+    with pytest.raises(ValueError):
+        CacheListener(pg.Cache(), None)  # type: ignore
+
+
+def test_set_drops_results_read_before_invalidation():
+    cache = pg.Cache()
+    version = cache.version
+    cache.invalidate('customer')
+    cache.set('a', 1, {'customer'}, version)
+    cache.set('b', 2, {'account'}, version)
+
+    assert cache.get('a') is MISSING
+    assert cache.get('b') == 2
+
+
+def test_set_drops_results_read_before_clear():
+    cache = pg.Cache()
+    version = cache.version
+    cache.clear()
+    cache.set('a', 1, {'customer'}, version)
+
+    assert cache.get('a') is MISSING
+
+
+def test_notify_in_transaction():
+    cache = pg.Cache()
+    connection = Connection()
+    connection.info.transaction_status = TransactionStatus.INTRANS
+    cache.notify(Cursor(connection), {'customer'})  # type: ignore
+
+    # a concurrent read still sees the old rows until the write is committed
+    version = cache.version
+    cache.set('a', 1, {'customer'}, version)
+    assert cache.get('a') is MISSING
+
+    connection.info.transaction_status = TransactionStatus.IDLE
+    cache.set('a', 1, {'customer'}, version)
+    assert cache.get('a') is MISSING
+
+    cache.set('a', 1, {'customer'}, cache.version)
+    assert cache.get('a') == 1
+
+
+def test_listener_survives_unexpected_errors(caplog):
+
+    class Pool:
+        kwargs = None
+        conninfo = ''
+
+        class connection_class:
+            calls = 0
+
+            @classmethod
+            def connect(cls, conninfo, **kwargs):
+                cls.calls += 1
+                if cls.calls == 2:
+                    listener._stop_event.set()
+                raise RuntimeError('unexpected')
+
+    cache = pg.Cache(channel='cache')
+    listener = CacheListener(cache, Pool(), reconnect_delay=0)  # type: ignore
+
+    with caplog.at_level(logging.ERROR, logger='pgcrud.cache'):
+        listener._run()
+
+    assert Pool.connection_class.calls == 2
+    assert 'reconnecting' in caplog.text
+
+
+def test_unknown_search_path_is_not_cached():
+    cache = pg.Cache()
+    cursor = Cursor()
+    cursor.connection.info.search_path = None
+    key = cache.make_key(cursor, q.SELECT(i.id).FROM(i.customer))
+
+    assert key is None
+    cache.set(key, [1], {'customer'})
+    assert cache.get(key) is MISSING
+    assert cache.size == 0
+
+    with pg.use_schema('tenant'):
+        assert cache.make_key(cursor, q.SELECT(i.id).FROM(i.customer)) is not None
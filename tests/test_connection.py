@@ -0,0 +1,118 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import psycopg
+from psycopg.adapt import AdaptersMap, PyFormat
+from psycopg.rows import dict_row, scalar_row, tuple_row
+from psycopg.types.string import StrDumper
+import pytest
+
+import pgcrud as pg
+from pgcrud import IdentifierExpression as i
+from pgcrud.db import TypedConnection
+from pgcrud.db.shared import has_adapters_of
+
+
+class Cursor:
+
+    def __init__(self, row_factory: Any):
+        self.row_factory = row_factory
+        self.format = 0
+
+    def execute(self, query, params=None, *, prepare=None):
+        self.query = query
+        return self
+
+    def fetchall(self):
+        return [self.row_factory]
+
+
+class Connection:
+
+    __getitem__ = pg.Connection.__getitem__
+    autocommit = True
+
+    def __init__(self):
+        self.row_factory = tuple_row
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.closed = True
+
+    def cursor(self, name: str = '', *, row_factory: Any = None):
+        return Cursor(row_factory or self.row_factory)
+
+
+def test_typed_connection_does_not_change_connection():
+    conn = Connection()
+    typed = conn[(dict, {'validation': None})]
+
+    assert isinstance(typed, TypedConnection)
+    assert typed.cursor().row_factory is dict_row
+    assert typed.execute('SELECT 1').row_factory is dict_row
+    assert conn.row_factory is tuple_row
+    assert conn.cursor().row_factory is tuple_row
+    assert typed.autocommit is True
+
+
+def test_typed_connections_across_threads():
+    conn = Connection()
+
+    def row_factory(row_type: Any) -> Any:
+        return conn[(row_type, {'validation': None})].cursor().row_factory
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(row_factory, [int, dict] * 50))
+
+    assert results == [scalar_row, dict_row] * 50
+    assert conn.row_factory is tuple_row
+
+
+def test_has_adapters_of():
+    connection = Connection()
+    connection.adapters = AdaptersMap(psycopg.adapters)
+    cursor = Cursor(tuple_row)
+    cursor.adapters = AdaptersMap(connection.adapters)
+
+    assert has_adapters_of(cursor, connection)
+
+    connection.adapters.register_dumper(str, StrDumper)
+    assert not has_adapters_of(cursor, connection)
+
+    cursor.adapters = AdaptersMap(connection.adapters)
+    assert has_adapters_of(cursor, connection)
+
+
+# the idle cursors rely on these psycopg internals, the supported versions are pinned in pyproject.toml
+def test_psycopg_internals():
+    adapters = AdaptersMap(psycopg.adapters)
+
+    assert isinstance(adapters._loaders, list) and len(adapters._loaders) == 2
+    assert isinstance(adapters._dumpers_by_oid, list) and len(adapters._dumpers_by_oid) == 2
+    assert all(format_ in adapters._dumpers for format_ in PyFormat)
+    assert isinstance(adapters.types._registry, dict)
+    assert callable(psycopg.Cursor._reset) and callable(psycopg.AsyncCursor._reset)
+
+
+def test_typed_connection_as_context_manager():
+    conn = Connection()
+
+    with conn[(dict, {'validation': None})] as typed:
+        assert isinstance(typed, TypedConnection)
+        assert typed.cursor().row_factory is dict_row
+
+    assert conn.closed is True
+
+
+def test_row_type_does_not_change_cursor():
+    cursor = Cursor(tuple_row)
+
+    assert pg.get_many(cursor, select=i.id, from_=i.customer, row_type=(dict, {'validation': None})) == [dict_row]  # type: ignore
+    assert cursor.row_factory is tuple_row
+
+    with pytest.raises(TypeError):
+        pg.get_many(cursor, select=i.id, from_=i.customer, row_type=dict, no_fetch=True)  # type: ignore
+    assert cursor.row_factory is tuple_row
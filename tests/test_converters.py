@@ -0,0 +1,75 @@
+from dataclasses import dataclass, asdict
+from datetime import date
+
+from msgspec import Struct
+from pydantic import BaseModel
+
+import pgcrud as pg
+from pgcrud import IdentifierExpression as i, QueryBuilder as q
+from pgcrud.converters import get_converter
+from pgcrud.db.shared import deserialize_params_seq
+
+
+@dataclass
+class Customer:
+    id: int
+    name: str
+
+
+def test_dict_and_sequence_values():
+    query = q.INSERT_INTO(i.customer[i.id, i.name]).VALUES({'name': 'A', 'id': 1}, (2, 'B'))
+    assert str(query) == """INSERT INTO "customer" ("id", "name") VALUES (1, 'A'), (2, 'B')"""
+
+
+def test_registered_converter():
+    pg.config.register_converter(Customer, asdict)
+
+    query = q.INSERT_INTO(i.customer[i.id, i.name]).VALUES(Customer(1, 'A'))
+    assert str(query) == """INSERT INTO "customer" ("id", "name") VALUES (1, 'A')"""
+
+    query = q.UPDATE(i.customer).SET((i.id, i.name), Customer(1, 'A'), name='B')
+    assert str(query) == """UPDATE "customer" SET ("id", "name") = (1, 'B')"""
+
+
+def test_converter_is_cached():
+    assert get_converter(dict) is get_converter(dict)
+
+
+def test_deserialize_params_seq():
+    pg.config.register_converter(Customer, asdict)
+    params_seq = iter([Customer(1, 'A'), {'id': 2, 'name': 'B'}, (3, 'C')])
+
+    converted = deserialize_params_seq('INSERT INTO "customer" VALUES (%s, %s)', params_seq)
+    assert list(converted) == [(1, 'A'), {'id': 2, 'name': 'B'}, (3, 'C')]
+
+    converted = deserialize_params_seq('INSERT INTO "customer" VALUES (%(id)s, %(name)s)', [Customer(1, 'A')])
+    assert list(converted) == [{'id': 1, 'name': 'A'}]
+
+
+def test_positional_dataclass_without_converter():
+
+    @dataclass
+    class Account:
+        id: int
+        balance: float
+
+    converted = deserialize_params_seq('INSERT INTO "account" VALUES (%s, %s)', [Account(1, 2.5)])
+    assert list(converted) == [(1, 2.5)]
+
+
+def test_positional_models_keep_all_fields():
+
+    class Account(Struct, omit_defaults=True):
+        id: int
+        overdraft: int = 0
+        balance: int = 0
+
+    class Order(BaseModel):
+        id: int
+        day: date
+
+    converted = deserialize_params_seq('INSERT INTO "account" VALUES (%s, %s, %s)', [Account(1, 0, 7)])
+    assert list(converted) == [(1, 0, 7)]
+
+    converted = deserialize_params_seq('INSERT INTO "order" VALUES (%s, %s)', [Order(id=1, day=date(2024, 1, 1))])
+    assert list(converted) == [(1, date(2024, 1, 1))]
@@ -0,0 +1,70 @@
+from contextlib import contextmanager
+
+import pgcrud as pg
+from pgcrud import IdentifierExpression as i, QueryBuilder as q
+from pgcrud.explain import get_explain_query
+
+
+RAW_PLAN = [{
+    'Plan': {
+        'Node Type': 'Nested Loop',
+        'Total Cost': 16.6,
+        'Plan Rows': 1,
+        'Actual Rows': 3,
+        'Plans': [
+            {'Node Type': 'Index Scan', 'Relation Name': 'customer', 'Index Name': 'customer_pkey', 'Total Cost': 8.2, 'Plan Rows': 1, 'Actual Rows': 1},
+            {'Node Type': 'Seq Scan', 'Relation Name': 'account', 'Total Cost': 8.3, 'Plan Rows': 1, 'Actual Rows': 3},
+        ],
+    },
+    'Planning Time': 0.1,
+    'Execution Time': 0.2,
+}]
+
+
+def test_plan():
+    plan = pg.Plan(RAW_PLAN)
+
+    assert plan.total_cost == 16.6
+    assert plan.plan_rows == 1
+    assert plan.actual_rows == 3
+    assert plan.analyzed
+    assert plan.node_types == ['Nested Loop', 'Index Scan', 'Seq Scan']
+    assert plan.index_names == {'customer_pkey'}
+    assert plan.uses_index
+    assert plan.uses_seq_scan
+    assert plan.execution_time == 0.2
+
+
+def test_get_explain_query():
+    query = q.SELECT(i.id).FROM(i.customer)
+    assert get_explain_query(query) == 'EXPLAIN (FORMAT JSON) SELECT "id" FROM "customer"'
+    assert get_explain_query(query, analyze=True, buffers=True) == 'EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT "id" FROM "customer"'
+
+
+class Cursor:
+
+    def __init__(self):
+        self.connection = self
+        self.executed = []
+
+    @contextmanager
+    def cursor(self, row_factory=None):
+        yield self
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+    def fetchone(self):
+        return [RAW_PLAN]
+
+
+def test_explain_params_are_keyword_only():
+    cursor = Cursor()
+    query = q.SELECT(i.id).FROM(i.customer).WHERE(i.id == pg.PlaceholderExpression('id'))
+    query.explain(cursor, True)  # type: ignore
+    query.explain(cursor, params={'id': 1})  # type: ignore
+
+    assert cursor.executed == [
+        ('EXPLAIN (ANALYZE, FORMAT JSON) SELECT "id" FROM "customer" WHERE "id" = %(id)s', None),
+        ('EXPLAIN (FORMAT JSON) SELECT "id" FROM "customer" WHERE "id" = %(id)s', {'id': 1}),
+    ]
@@ -1,4 +1,7 @@
-from pgcrud import IdentifierExpression
+import pytest
+
+from pgcrud import IdentifierExpression, QueryBuilder, UNDEFINED, all_of, any_of, functions as f
+from pgcrud.expressions.base import ConjunctionOperationExpression, compile_expression
 
 
 def test_generate_expr():
@@ -44,3 +47,141 @@ def test_comparison_operations():
     assert str(a.NOT_IN([1, 2])) == '"a" NOT IN (1, 2)'
     assert str(a.IS(None)) == '"a" IS NULL'
     assert str(a.IS_NOT(None)) == '"a" IS NOT NULL'
+
+
+def test_json_nest():
+    a = IdentifierExpression('a')
+
+    assert str(f.json_nest(a.id, a.name.AS(IdentifierExpression('title')))) == (
+        "coalesce(json_agg(json_build_object('id', \"a\".\"id\", 'title', \"a\".\"name\")) FILTER (WHERE \"a\".\"id\" IS NOT NULL), '[]')"
+    )
+    assert str(f.json_nest(a.name, key=a.id)) == (
+        "coalesce(json_agg(json_build_object('name', \"a\".\"name\")) FILTER (WHERE \"a\".\"id\" IS NOT NULL), '[]')"
+    )
+
+    with pytest.raises(TypeError):
+        f.json_nest()
+
+
+def test_logical_operations():
+    a = IdentifierExpression('a') == 1
+    b = IdentifierExpression('b') == 2
+    c = IdentifierExpression('c') == 3
+
+    assert str(a & b & c) == '"a" = 1 AND "b" = 2 AND "c" = 3'
+    assert str(a & (b & c)) == '"a" = 1 AND "b" = 2 AND "c" = 3'
+    assert str((a | b) & c) == '("a" = 1 OR "b" = 2) AND "c" = 3'
+    assert str((a & b) | c) == '("a" = 1 AND "b" = 2) OR "c" = 3'
+
+
+def test_logical_operations_pruning():
+    a = IdentifierExpression('a') == 1
+    b = IdentifierExpression('b') == 2
+    undefined = IdentifierExpression('x') == UNDEFINED
+
+    assert str(a & undefined) == '"a" = 1'
+    assert str((a | undefined) & b) == '"a" = 1 AND "b" = 2'
+    assert str(undefined & undefined) == ''
+    assert not undefined | undefined
+    assert str(QueryBuilder.SELECT(a).WHERE(undefined & undefined)) == 'SELECT "a" = 1'
+
+
+def test_logical_operations_constant_folding():
+    a = IdentifierExpression('a') == 1
+
+    assert str(a & True) == '"a" = 1'
+    assert str(a & False) == 'false'
+    assert str(a | True) == 'true'
+    assert str(a | False) == '"a" = 1'
+    assert str(True & (IdentifierExpression('x') == UNDEFINED)) == 'true'
+
+
+def test_logical_operations_deep():
+    expression = IdentifierExpression('c') == 0
+    for n in range(1, 10_000):
+        expression = expression & (IdentifierExpression('c') == (n if n % 2 else UNDEFINED))
+
+    compiled = compile_expression(expression)
+
+    assert isinstance(compiled, ConjunctionOperationExpression)
+    assert len(compiled.expressions) == 5_001
+    assert compile_expression(compiled) is compiled
+
+
+def test_all_of_any_of():
+    a = IdentifierExpression('a') == 1
+    b = IdentifierExpression('b') == 2
+    c = IdentifierExpression('c') == 3
+    undefined = IdentifierExpression('x') == UNDEFINED
+
+    assert str(all_of(a, b, c)) == '"a" = 1 AND "b" = 2 AND "c" = 3'
+    assert str(any_of(a, b, c)) == '"a" = 1 OR "b" = 2 OR "c" = 3'
+    assert str(all_of(any_of(a, b), c)) == '("a" = 1 OR "b" = 2) AND "c" = 3'
+    assert str(any_of(all_of(a, b), c)) == '("a" = 1 AND "b" = 2) OR "c" = 3'
+    assert str(all_of(a, undefined) & all_of(b, c)) == '"a" = 1 AND "b" = 2 AND "c" = 3'
+    assert str(any_of(undefined)) == ''
+    assert not all_of()
+    assert str(QueryBuilder.SELECT(a).WHERE(all_of(undefined, undefined))) == 'SELECT "a" = 1'
+
+
+def test_all_of_many():
+    expression = all_of(*(IdentifierExpression(f'c{n}') == n for n in range(10_000)))
+
+    assert str(expression).count(' AND ') == 9_999
+    assert str(QueryBuilder.SELECT(IdentifierExpression('id')).WHERE(expression)).startswith('SELECT "id" WHERE "c0" = 0 AND')
+
+
+def test_sort_operations():
+    a = IdentifierExpression('a')
+
+    assert str(a.ASC()) == '"a" ASC'
+    assert str(a.ASC(False)) == '"a" DESC'
+    assert str(a.DESC()) == '"a" DESC'
+    assert str(a.ASC(UNDEFINED)) == ''
+    assert str(QueryBuilder.SELECT(a).ORDER_BY(a.ASC(), a.DESC(UNDEFINED))) == 'SELECT "a" ORDER BY "a" ASC'
+
+
+def test_render_deep_arithmetic():
+    expression = IdentifierExpression('a')
+    for n in range(10_000):
+        expression = expression + n
+
+    assert str(expression).count(' + ') == 10_000
+
+    expression = IdentifierExpression('a')
+    for n in range(10_000):
+        expression = n - expression
+
+    assert str(expression).count('(') == 9_999
+
+
+def test_render_deep_logical():
+    expression = IdentifierExpression('c') == 0
+    for n in range(1, 10_000):
+        if n % 2:
+            expression = expression | (IdentifierExpression('c') == n)
+        else:
+            expression = (IdentifierExpression('c') == n) & expression
+
+    rendered = str(expression)
+
+    assert rendered.count(' OR ') == 5_000
+    assert rendered.count(' AND ') == 4_999
+    assert rendered.count('(') == 9_998
+
+
+def test_render_deep_functions():
+    expression = IdentifierExpression('a')
+    for _ in range(10_000):
+        expression = f.lower(expression.AS(IdentifierExpression('b')))
+
+    assert str(expression).startswith('lower(lower(')
+    assert str(expression).endswith(' AS "b")')
+
+
+def test_render_deep_where():
+    expression = IdentifierExpression('c') == 0
+    for n in range(1, 10_000):
+        expression = any_of(expression, IdentifierExpression('c') == n) & (IdentifierExpression('d') == n)
+
+    assert str(QueryBuilder.SELECT(IdentifierExpression('id')).WHERE(expression)).count(' OR ') == 9_999
@@ -0,0 +1,106 @@
+import os
+
+import pgcrud as pg
+from pgcrud import IdentifierExpression as i, QueryBuilder as q, functions as f
+
+from tests.models import Customer, CustomerWithAccounts
+
+
+def test_get_customers_with_accounts(cursor: pg.Cursor):
+
+    customers = pg.get_many(
+        cursor=cursor[CustomerWithAccounts],
+        select=(i.customer.id, i.customer.name, f.json_nest(i.account.id, i.account.balance).AS(i.accounts)),
+        from_=i.customer.LEFT_JOIN(i.account).ON(i.account.customer_id == i.customer.id),
+        group_by=i.customer.id,
+        order_by=i.customer.id,
+    )
+
+    assert len(customers) == 2
+    assert isinstance(customers[0], CustomerWithAccounts)
+    assert sorted(account.id for account in customers[0].accounts) == [1, 2, 3]
+    assert sorted(account.id for account in customers[1].accounts) == [4, 5]
+
+
+def test_get_customers_cached(cursor: pg.Cursor):
+    cache = pg.Cache()
+
+    for _ in range(2):
+        customers = pg.get_many(
+            cursor=cursor[Customer],
+            select=(i.id, i.name),
+            from_=i.customer,
+            order_by=i.id,
+            cache=cache,
+        )
+        assert [customer.id for customer in customers] == [1, 2]
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_explain_get_customers(cursor: pg.Cursor):
+
+    plan = pg.get_many(
+        cursor=cursor[Customer],
+        select=(i.id, i.name),
+        from_=i.customer,
+        where=i.id == 1,
+        explain=True,
+    )
+
+    assert isinstance(plan, pg.Plan)
+    assert not plan.analyzed
+    assert any(node.relation_name == 'customer' for node in plan.nodes)
+
+    plan = q.SELECT(i.id).FROM(i.customer).explain(cursor, analyze=True)
+    assert plan.actual_rows == 2
+
+    plan = pg.get_many(
+        cursor=cursor,
+        select=i.id,
+        from_=i.customer,
+        explain=True,
+        analyze=True,
+    )
+    assert plan.actual_rows == 2
+
+
+def test_get_customers_from_connection(conn: pg.Connection):
+
+    with pg.use_schema('test_schema'):
+        customer_ids = pg.get_many(
+            cursor=conn,
+            select=i.id,
+            from_=i.customer,
+            order_by=i.id,
+            row_type=int,
+        )
+
+        customers = pg.get_many(
+            cursor=conn[Customer],
+            select=(i.id, i.name),
+            from_=i.customer,
+            order_by=i.id,
+            no_fetch=True,
+        )
+
+    assert customer_ids == [1, 2]
+    assert [customer.id for customer in customers] == [1, 2]
+
+
+def test_get_customers_from_pool():
+
+    with pg.ConnectionPool(os.environ['CONN_STR'], min_size=1) as pool, pg.use_schema('test_schema'):
+        customers = pg.get_many(
+            cursor=pool,
+            select=(i.id, i.name),
+            from_=i.customer,
+            order_by=i.id,
+            row_type=Customer,
+        )
+
+        with pool.connection() as conn:
+            assert not conn.autocommit
+
+    assert [customer.id for customer in customers] == [1, 2]
@@ -1,7 +1,7 @@
 import pgcrud as pg
 from pgcrud import IdentifierExpression as i
 
-from tests.models import Customer
+from tests.models import Customer, CustomerDataclass, CustomerNamedTuple
 
 
 def test_get_customer_by_id(cursor: pg.Cursor):
@@ -67,3 +67,55 @@ def test_get_customer_tuple_by_id(cursor: pg.Cursor):
     assert isinstance(customer_tuple, tuple)
     assert customer_tuple[0] == 1
     assert customer_tuple[1] == 'Customer A'
+
+
+def test_get_customer_dataclass_by_id(cursor: pg.Cursor):
+
+    customer = pg.get_one(
+        cursor=cursor[CustomerDataclass, {'validation': None}],
+        select=(i.name, i.id),
+        from_=i.customer,
+        where=i.id == 1,
+    )
+
+    assert isinstance(customer, CustomerDataclass)
+    assert customer.id == 1
+    assert customer.name == 'Customer A'
+
+
+def test_get_customer_named_tuple_by_id(cursor: pg.Cursor):
+
+    customer = pg.get_one(
+        cursor=cursor[CustomerNamedTuple],
+        select=(i.id, i.name),
+        from_=i.customer,
+        where=i.id == 1,
+    )
+
+    assert isinstance(customer, CustomerNamedTuple)
+    assert customer.id == 1
+
+
+def test_get_customer_from_connection(conn: pg.Connection):
+
+    with pg.use_schema('test_schema'):
+        for _ in range(2):
+            customer = pg.get_one(
+                cursor=conn,
+                select=(i.id, i.name),
+                from_=i.customer,
+                where=i.id == 1,
+                row_type=Customer,
+            )
+
+            assert isinstance(customer, Customer)
+            assert customer.id == 1
+
+        customer_name = pg.get_one(
+            cursor=conn[str],
+            select=i.name,
+            from_=i.customer,
+            where=i.id == 1,
+        )
+
+    assert customer_name == 'Customer A'
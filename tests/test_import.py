@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+
+def import_pgcrud() -> dict[str, int]:
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import pgcrud'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    self_times = {}
+
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            self_time, _, name = line.removeprefix('import time:').split('|')
+            if self_time.strip().isdigit():
+                self_times[name.strip()] = int(self_time)
+
+    return self_times
+
+
+def test_import_does_not_load_optional_dependencies():
+    self_times = import_pgcrud()
+
+    assert 'pgcrud' in self_times
+    assert 'pydantic' not in self_times
+    assert 'msgspec' not in self_times
+
+
+def test_import_time():
+    self_times = import_pgcrud()
+    pgcrud_time = sum(t for name, t in self_times.items() if name == 'pgcrud' or name.startswith('pgcrud.'))
+
+    # pgcrud's own modules only, dependencies such as psycopg are excluded
+    assert pgcrud_time < 200_000
@@ -0,0 +1,66 @@
+import pytest
+
+import pgcrud as pg
+from pgcrud.instrumentation import Instrumentation, current_operation, operation, instrument_stream
+
+
+class Cursor:
+    rowcount = 3
+
+
+class RecordingHook(pg.Hook):
+
+    def __init__(self):
+        self.events = []
+
+    def before_execute(self, event: pg.ExecuteEvent) -> None:
+        assert event.duration is None
+
+    def after_execute(self, event: pg.ExecuteEvent) -> None:
+        self.events.append(event)
+
+
+def test_instrumentation():
+    hook = RecordingHook()
+
+    with Instrumentation([hook], Cursor(), 'SELECT %s, %s', (1, 2)):  # type: ignore
+        pass
+
+    event = hook.events[0]
+    assert event.query == 'SELECT %s, %s'
+    assert event.params_count == 2
+    assert event.row_count == 3
+    assert event.duration is not None and event.duration >= 0
+    assert event.error is None
+
+
+def test_instrumentation_error():
+    hook = RecordingHook()
+
+    with pytest.raises(ValueError):
+        with Instrumentation([hook], Cursor(), 'SELECT 1', None):  # type: ignore
+            raise ValueError
+
+    assert isinstance(hook.events[0].error, ValueError)
+
+
+def test_instrument_stream():
+    hook = RecordingHook()
+    rows = list(instrument_stream(Instrumentation([hook], Cursor(), 'SELECT 1', None), iter([1, 2])))  # type: ignore
+
+    assert rows == [1, 2]
+    assert hook.events[0].row_count == 2
+
+
+def test_operation():
+    hook = RecordingHook()
+
+    @operation('get_many')
+    def get_many():
+        with Instrumentation([hook], Cursor(), 'SELECT 1', None):  # type: ignore
+            pass
+
+    get_many()
+
+    assert hook.events[0].operation == 'get_many'
+    assert current_operation.get() is None
@@ -0,0 +1,63 @@
+import pgcrud as pg
+from pgcrud import IdentifierExpression as i, QueryBuilder as q
+from pgcrud.metrics import LatencyHistogram, normalize_query
+
+
+def make_event(query: str, duration: float, row_count: int = 1, error: BaseException | None = None) -> pg.ExecuteEvent:
+    event = pg.ExecuteEvent('get_many', query, 0)
+    event.duration = duration
+    event.row_count = row_count
+    event.error = error
+    return event
+
+
+def test_normalize_query():
+    query = q.SELECT(i.id).FROM(i.customer).WHERE((i.name == 'A') & i.id.IN([1, 2, 3])).LIMIT(10)
+    assert normalize_query(str(query)) == 'SELECT "id" FROM "customer" WHERE "name" = ? AND "id" IN (...) LIMIT ?'
+
+    query = q.INSERT_INTO(i.customer[i.id, i.name]).VALUES((1, 'A'), (2, 'B'))
+    assert normalize_query(str(query)) == 'INSERT INTO "customer" ("id", "name") VALUES (...)'
+
+    assert normalize_query('SELECT %s, %(id)s FROM "table1"') == 'SELECT %s, %(id)s FROM "table1"'
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+
+    for value in range(1, 1001):
+        histogram.record(value / 10_000)
+
+    assert abs(histogram.percentile(50) - 0.05) / 0.05 < 0.02
+    assert abs(histogram.percentile(99) - 0.099) / 0.099 < 0.02
+    assert histogram.percentile(100) == 0.1
+
+
+def test_metrics():
+    metrics = pg.Metrics()
+    metrics.after_execute(make_event('SELECT 1', 0.001))
+    metrics.after_execute(make_event('SELECT 2', 0.003, row_count=2))
+    metrics.after_execute(make_event('SELECT 3', 0.002, error=ValueError()))
+
+    snapshot = metrics.snapshot()['SELECT ?']
+    assert snapshot['count'] == 3
+    assert snapshot['rows'] == 3
+    assert snapshot['errors'] == 1
+    assert snapshot['operations'] == ['get_many']
+
+    text = metrics.to_prometheus()
+    assert 'pgcrud_statement_duration_seconds_count{query="SELECT ?"} 3' in text
+    assert 'pgcrud_statement_errors_total{query="SELECT ?"} 1' in text
+
+
+def test_metrics_are_bounded():
+    metrics = pg.Metrics(max_statements=2)
+
+    for table in ('a', 'b', 'c', 'd'):
+        metrics.after_execute(make_event(f'SELECT 1 FROM "{table}"', 0.001))
+
+    snapshot = metrics.snapshot()
+    assert list(snapshot) == ['SELECT ? FROM "a"', 'SELECT ? FROM "b"', 'other']
+    assert snapshot['other']['count'] == 2
+
+    query = str(q.INSERT_INTO(i.customer[i.id, i.name]).VALUES(*[(n, 'A' * 10) for n in range(1000)]))
+    assert normalize_query(query) == 'INSERT INTO "customer" ("id", "name") VALUES (...)'
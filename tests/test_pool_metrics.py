@@ -0,0 +1,99 @@
+import logging
+import time
+
+import psycopg_pool
+
+import pgcrud as pg
+from pgcrud.db.pool_metrics import PoolMetrics
+
+
+class Connection:
+    pass
+
+
+def test_pool_metrics():
+    metrics = PoolMetrics()
+    conns = [Connection(), Connection()]
+
+    for conn in conns:
+        metrics.end_wait(metrics.start_wait(), conn)
+
+    assert metrics.peak_waiting == 0
+
+    # a caller without a ready connection is queued by the pool
+    start = metrics.start_wait()
+    metrics.block()
+    assert metrics.waiting == 1
+    metrics.end_wait(start, None)
+
+    assert metrics.waiting == 0
+    assert metrics.in_use == 2
+    assert metrics.peak_in_use == 2
+    assert metrics.errors == 1
+
+    for conn in conns:
+        metrics.checkin(conn)
+
+    snapshot = metrics.snapshot()
+    assert snapshot['in_use'] == 0
+    assert snapshot['peak_in_use'] == 2
+    assert snapshot['peak_waiting'] == 1
+    assert snapshot['wait_count'] == 3
+    assert snapshot['hold_count'] == 2
+
+
+def test_pool_metrics_leaks():
+    metrics = PoolMetrics(leak_threshold=0.01)
+    conn = Connection()
+
+    metrics.end_wait(metrics.start_wait(), conn)
+    assert metrics.leaks() == []
+
+    time.sleep(0.02)
+    leaks = metrics.leaks()
+    assert len(leaks) == 1
+    assert 'test_pool_metrics_leaks' in leaks[0].stack
+
+    metrics.report_leaks()
+    metrics.report_leaks()
+    assert metrics.leaks_reported == 1
+
+    metrics.checkin(conn)
+    assert metrics.leaks() == []
+
+
+def test_pool_metrics_reports_leaks_of_idle_pool(caplog):
+    metrics = PoolMetrics(leak_threshold=0.01)
+
+    with caplog.at_level(logging.WARNING, logger='pgcrud.pool'):
+        metrics.end_wait(metrics.start_wait(), Connection())
+        time.sleep(0.1)
+        metrics.stop_reaper()
+
+    assert metrics.leaks_reported == 1
+    assert 'has been held for' in caplog.text
+
+
+def test_pool_counts_a_blocked_caller_once(monkeypatch):
+    checks = []
+
+    def check_connection(self, conn):
+        checks.append(conn)
+        if len(checks) < 3:
+            raise RuntimeError('bad connection')
+
+    # no connection is ready, and the first two connections handed out fail the check
+    monkeypatch.setattr(psycopg_pool.ConnectionPool, '_check_open_getconn', lambda self: None)
+    monkeypatch.setattr(psycopg_pool.ConnectionPool, '_get_ready_connection', lambda self, timeout: None)
+    monkeypatch.setattr(psycopg_pool.ConnectionPool, '_getconn_unchecked', lambda self, timeout: self._get_ready_connection(timeout) or Connection())
+    monkeypatch.setattr(psycopg_pool.ConnectionPool, '_check_connection', check_connection)
+    monkeypatch.setattr(psycopg_pool.ConnectionPool, '_putconn', lambda self, conn, from_getconn: None)
+    monkeypatch.setattr(psycopg_pool.pool, 'sleep', lambda delay: None)
+
+    pool = pg.ConnectionPool('', open=False)
+    pool.getconn()
+
+    assert len(checks) == 3
+    assert pool.metrics.waiting == 0
+    assert pool.metrics.peak_waiting == 1
+    assert pool.metrics.in_use == 1
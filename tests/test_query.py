@@ -0,0 +1,93 @@
+from threading import Thread
+
+from pgcrud import IdentifierExpression as i, QueryBuilder as q, use_schema
+from pgcrud.converters import register_converter
+
+
+def test_builder_returns_new_queries():
+    base = q.SELECT(i.id).FROM(i.customer)
+    by_id = base.WHERE(i.id == 1)
+    by_name = base.WHERE(i.name == 'x')
+
+    assert str(base) == 'SELECT "id" FROM "customer"'
+    assert str(by_id) == 'SELECT "id" FROM "customer" WHERE "id" = 1'
+    assert str(by_name) == 'SELECT "id" FROM "customer" WHERE "name" = \'x\''
+    assert by_id.clauses[:2] == base.clauses[:2]
+    assert by_id.clauses[0] is base.clauses[0]
+
+
+def test_merge_returns_new_query():
+    select = q.SELECT(i.id)
+    query = select.merge(q.FROM(i.customer))
+
+    assert str(select) == 'SELECT "id"'
+    assert str(query) == 'SELECT "id" FROM "customer"'
+
+
+def test_hash_and_equality():
+    a = q.SELECT(i.id).FROM(i.customer).WHERE(i.id == 1)
+    b = q.SELECT(i.id).FROM(i.customer).WHERE(i.id == 1)
+    c = q.SELECT(i.id).FROM(i.customer).WHERE(i.id == 2)
+
+    assert a == b
+    assert a != c
+    assert hash(a) == hash(b)
+    assert {a: 1}[b] == 1
+    assert len({a, b, c}) == 2
+
+
+def test_hash_does_not_depend_on_schema():
+    query = q.SELECT(i.id).FROM(i.customer)
+
+    with use_schema('tenant'):
+        assert str(query) == 'SELECT "id" FROM "tenant"."customer"'
+        assert hash(query) == hash(q.SELECT(i.id).FROM(i.customer))
+
+    assert str(query) == 'SELECT "id" FROM "customer"'
+
+
+def test_comparison_with_expression():
+    query = q.SELECT(i.id).FROM(i.customer)
+
+    assert str(i.customer_id == query) == '"customer_id" = (SELECT "id" FROM "customer")'
+    assert str(query == i.customer_id) == '"customer_id" = (SELECT "id" FROM "customer")'
+
+
+def test_shared_query_across_threads():
+    base = q.SELECT(i.id).FROM(i.customer)
+    results = {}
+
+    def build(n: int) -> None:
+        results[n] = str(base.WHERE(i.id == n))
+
+    threads = [Thread(target=build, args=(n,)) for n in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(results[n] == f'SELECT "id" FROM "customer" WHERE "id" = {n}' for n in range(20))
+    assert str(base) == 'SELECT "id" FROM "customer"'
+
+
+def test_sql_does_not_change_with_its_inputs():
+    rows = [{'id': 1, 'name': 'A'}]
+    customer = i.customer[i.id, i.name]
+    query = q.INSERT_INTO(customer).VALUES(*rows)
+    sql = str(query)
+
+    rows[0]['name'] = 'B'
+    rows.append({'id': 2, 'name': 'C'})
+    assert str(query) == sql == 'INSERT INTO "customer" ("id", "name") VALUES (1, \'A\')'
+    assert str(customer[i.email]) == '"customer" ("id", "name", "email")'
+    assert str(customer) == '"customer" ("id", "name")'
+
+    class Customer(dict):
+        pass
+
+    query = q.INSERT_INTO(customer).VALUES(Customer(id=1, name='a'))
+    sql = str(query)
+    register_converter(Customer, lambda row: {**row, 'name': row['name'].upper()})
+
+    assert str(query) == sql == 'INSERT INTO "customer" ("id", "name") VALUES (1, \'a\')'
+    assert str(q.INSERT_INTO(customer).VALUES(Customer(id=1, name='a'))) == 'INSERT INTO "customer" ("id", "name") VALUES (1, \'A\')'
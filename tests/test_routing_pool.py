@@ -0,0 +1,142 @@
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+
+import psycopg
+from psycopg_pool import PoolTimeout
+import pytest
+
+import pgcrud as pg
+from pgcrud import IdentifierExpression as i
+from pgcrud.db.pool_metrics import PoolMetrics
+
+
+class Connection:
+
+    autocommit = True
+
+    def __init__(self, name: str, lag: float):
+        self.name = name
+        self.lag = lag
+
+    def execute(self, query):
+        return self
+
+    def fetchone(self):
+        return self.lag,
+
+
+class ConnectionPool:
+
+    def __init__(self, name: str, lag: float = 0.0, in_use: int = 0):
+        self.name = name
+        self.lag = lag
+        self.metrics = PoolMetrics()
+        self.metrics.in_use = in_use
+
+    @contextmanager
+    def connection(self, timeout=None):
+        yield Connection(self.name, self.lag)
+
+
+class FailingConnectionPool(ConnectionPool):
+
+    def __init__(self, name: str, error: Exception):
+        super().__init__(name)
+        self.error = error
+
+    @contextmanager
+    def connection(self, timeout=None):
+        raise self.error
+        yield
+
+
+class AsyncConnectionPool(ConnectionPool):
+
+    def __init__(self, name: str, error: Exception | None = None):
+        super().__init__(name)
+        self.error = error
+
+    @asynccontextmanager
+    async def connection(self, timeout=None):
+        if self.error:
+            raise self.error
+        yield Connection(self.name, self.lag)
+
+
+def read(pool: pg.RoutingPool) -> str:
+    with pool.read_connection() as conn:
+        return conn.name  # type: ignore
+
+
+def test_round_robin():
+    pool = pg.RoutingPool(ConnectionPool('primary'), [ConnectionPool('replica1'), ConnectionPool('replica2')], read_your_writes=0)  # type: ignore
+    assert [read(pool) for _ in range(4)] == ['replica1', 'replica2', 'replica1', 'replica2']
+
+
+def test_least_busy():
+    replicas = [ConnectionPool('replica1', in_use=3), ConnectionPool('replica2', in_use=1)]
+    pool = pg.RoutingPool(ConnectionPool('primary'), replicas, strategy='least_busy')  # type: ignore
+    assert [read(pool) for _ in range(2)] == ['replica2', 'replica2']
+
+
+def test_read_your_writes():
+    pool = pg.RoutingPool(ConnectionPool('primary'), [ConnectionPool('replica')], read_your_writes=60)  # type: ignore
+    assert read(pool) == 'replica'
+
+    with pool.connection() as conn:
+        assert conn.name == 'primary'  # type: ignore
+
+    assert read(pool) == 'primary'
+
+
+def test_max_lag():
+    replicas = [ConnectionPool('replica1', lag=10), ConnectionPool('replica2', lag=0.5)]
+    pool = pg.RoutingPool(ConnectionPool('primary'), replicas, max_lag=1, lag_check_interval=60)  # type: ignore
+    assert [read(pool) for _ in range(3)] == ['replica2', 'replica2', 'replica2']
+    assert pool.replicas[0].lag == 10
+
+    replicas[1].lag = 5
+    pool.replicas[1].checked_at = float('-inf')
+    assert read(pool) == 'primary'
+
+
+def test_unavailable_replica():
+    replicas = [FailingConnectionPool('replica1', PoolTimeout()), ConnectionPool('replica2')]
+    pool = pg.RoutingPool(ConnectionPool('primary'), replicas, read_your_writes=0)  # type: ignore
+    assert [read(pool) for _ in range(2)] == ['replica2', 'replica2']
+
+    replicas = [FailingConnectionPool('replica1', PoolTimeout()), FailingConnectionPool('replica2', psycopg.OperationalError())]
+    pool = pg.RoutingPool(ConnectionPool('primary'), replicas, read_your_writes=0)  # type: ignore
+    assert read(pool) == 'primary'
+
+    # an error of the caller is not retried on another replica
+    pool = pg.RoutingPool(ConnectionPool('primary'), [ConnectionPool('replica')], read_your_writes=0)  # type: ignore
+    with pytest.raises(psycopg.OperationalError):
+        with pool.read_connection():
+            raise psycopg.OperationalError()
+
+
+def test_async_unavailable_replica():
+
+    async def read_async(pool: pg.AsyncRoutingPool) -> str:
+        async with pool.read_connection() as conn:
+            return conn.name  # type: ignore
+
+    replicas = [AsyncConnectionPool('replica1', PoolTimeout()), AsyncConnectionPool('replica2')]
+    pool = pg.AsyncRoutingPool(AsyncConnectionPool('primary'), replicas, read_your_writes=0)  # type: ignore
+    assert asyncio.run(read_async(pool)) == 'replica2'
+
+    replicas = [AsyncConnectionPool('replica1', psycopg.OperationalError())]
+    pool = pg.AsyncRoutingPool(AsyncConnectionPool('primary'), replicas, read_your_writes=0)  # type: ignore
+    assert asyncio.run(read_async(pool)) == 'primary'
+
+
+def test_operations():
+    pool = pg.RoutingPool(ConnectionPool('primary', lag=0.0), [ConnectionPool('replica', lag=0.5)], read_your_writes=0)  # type: ignore
+
+    # the fake connections return their lag, which tells the pools apart
+    assert pg.get_one(pool, select=i.id, from_=i.author) == (0.5,)
+    assert pg.insert_one(pool, insert_into=i.author[i.name], values={'name': 'J.K. Rowling'}, returning=i.id) == (0.0,)
+
+    with pytest.raises(TypeError):
+        pg.get_many(pool, select=i.id, from_=i.author, no_fetch=True)
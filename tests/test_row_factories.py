@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from psycopg import pq
+
+from pgcrud.db.shared import get_row_factory
+
+
+class Column:
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class Result:
+
+    status = pq.ExecStatus.TUPLES_OK
+
+    def __init__(self, names: tuple[str, ...]):
+        self.nfields = len(names)
+        self._names = [name.encode() for name in names]
+
+    def fname(self, column_number: int) -> bytes:
+        return self._names[column_number]
+
+
+class Cursor:
+
+    _encoding = 'utf-8'
+
+    def __init__(self, names: tuple[str, ...]):
+        self.pgresult = Result(names)
+        self.description = [Column(name) for name in names]
+
+
+@dataclass(kw_only=True)
+class KwOnlyCustomer:
+    id: int
+    name: str
+
+
+@dataclass
+class CustomerWithKwOnlyField:
+    id: int
+    name: str = field(kw_only=True)
+    balance: float = 0.0
+
+
+class CustomerNamedTuple(NamedTuple):
+    id: int
+    name: str
+    balance: float = 0.0
+
+
+def make_row(row_type, validation, *names, values):
+    return get_row_factory(row_type, validation, False)(Cursor(names))(values)  # type: ignore
+
+
+def test_kw_only_dataclasses():
+    assert make_row(KwOnlyCustomer, None, 'id', 'name', values=(1, 'A')) == KwOnlyCustomer(id=1, name='A')
+    assert make_row(CustomerWithKwOnlyField, None, 'name', 'id', values=('A', 1)) == CustomerWithKwOnlyField(1, name='A')
+
+
+def test_named_tuple_by_column_name():
+    for validation in (None, 'pydantic', 'msgspec'):
+        assert make_row(CustomerNamedTuple, validation, 'name', 'id', values=('A', 1)) == CustomerNamedTuple(1, 'A')
@@ -0,0 +1,29 @@
+import pgcrud as pg
+from pgcrud import IdentifierExpression as i, QueryBuilder as q
+from pgcrud.db.connection_pool import get_set_search_path_query
+
+
+def test_use_schema():
+    query = q.SELECT(i.customer.id, i.account.id).FROM(i.customer.LEFT_JOIN(i.account.AS(i.a)).ON(i.a.customer_id == i.customer.id))
+    assert str(query) == 'SELECT "customer"."id", "account"."id" FROM "customer" LEFT JOIN "account" AS "a" ON "a"."customer_id" = "customer"."id"'
+
+    with pg.use_schema('tenant'):
+        assert str(query) == 'SELECT "customer"."id", "account"."id" FROM "tenant"."customer" LEFT JOIN "tenant"."account" AS "a" ON "a"."customer_id" = "customer"."id"'
+        assert str(q.INSERT_INTO(i.customer[i.id]).VALUES((1,))) == 'INSERT INTO "tenant"."customer" ("id") VALUES (1)'
+        assert str(q.UPDATE(i.customer).SET(i.name, 'A').FROM(i.account)) == 'UPDATE "tenant"."customer" SET "name" = \'A\' FROM "tenant"."account"'
+        assert str(q.DELETE_FROM(i.customer).USING(i.account)) == 'DELETE FROM "tenant"."customer" USING "tenant"."account"'
+        assert str(q.SELECT(i.id).FROM(i.public.customer)) == 'SELECT "id" FROM "public"."customer"'
+
+    assert str(q.SELECT(i.id).FROM(i.customer)) == 'SELECT "id" FROM "customer"'
+
+
+def test_use_schema_with_cte():
+    query = q.WITH(q.SELECT(i.id).FROM(i.customer).AS(i.c)).SELECT(i.id).FROM(i.c)
+
+    with pg.use_schema('tenant'):
+        assert 'FROM "tenant"."customer"' in str(query)
+        assert str(query).endswith('FROM "c"')
+
+
+def test_set_search_path_query():
+    assert get_set_search_path_query(['tenant', 'public']).as_string(None) == 'SET search_path TO "tenant", "public"'
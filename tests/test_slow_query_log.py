@@ -0,0 +1,115 @@
+from contextlib import contextmanager
+from threading import Event
+
+import pgcrud as pg
+
+
+class Connection:
+
+    def __init__(self):
+        self.queries = []
+        self.rolled_back = False
+        self.closed = False
+        self.released = Event()
+        self.released.set()
+
+    def execute(self, query, params=None):
+        self.released.wait()
+        self.queries.append((query, params))
+        return self
+
+    def fetchone(self):
+        return [{'Plan': {'Node Type': 'Seq Scan', 'Relation Name': 'customer'}}],
+
+    @contextmanager
+    def transaction(self, force_rollback=False):
+        yield
+        self.rolled_back = force_rollback
+
+    def close(self):
+        self.closed = True
+
+
+class ConnectionPool:
+
+    def __init__(self):
+        self.conn = Connection()
+        self.connects = 0
+
+    def connect(self):
+        self.connects += 1
+        return self.conn
+
+
+def make_event(query: str, duration: float, params=None, error=None) -> pg.ExecuteEvent:
+    event = pg.ExecuteEvent('get_many', query, 0 if params is None else len(params), params)
+    event.duration = duration
+    event.error = error
+    return event
+
+
+def test_slow_query_log():
+    log = pg.SlowQueryLog(threshold=0.5, max_size=2)
+
+    log.after_execute(make_event('SELECT 1', 0.1))
+    log.after_execute(make_event('SELECT 2', 0.6))
+    log.after_execute(make_event('SELECT 3', 0.7))
+    log.after_execute(make_event('SELECT 4', 0.8))
+
+    assert [entry.query for entry in log.entries] == ['SELECT 3', 'SELECT 4']
+    assert all(entry.plan is None for entry in log.entries)
+
+
+def test_slow_query_log_explain():
+    pool = ConnectionPool()
+    log = pg.SlowQueryLog(threshold=0.5, pool=pool, analyze_rate=1.0)  # type: ignore
+
+    log.after_execute(make_event('SELECT * FROM "customer" WHERE "id" = %s', 0.6, (1,)))
+    log.close()
+
+    entry = log.entries[0]
+    assert entry.plan is not None and entry.plan.node_types == ['Seq Scan']
+    assert entry.analyzed
+    assert pool.conn.queries == [('EXPLAIN (ANALYZE, FORMAT JSON) SELECT * FROM "customer" WHERE "id" = %s', (1,))]
+    assert pool.conn.rolled_back
+    assert pool.conn.closed
+
+
+def test_slow_query_log_explains_one_at_a_time():
+    pool = ConnectionPool()
+    log = pg.SlowQueryLog(threshold=0.5, pool=pool)  # type: ignore
+
+    pool.conn.released.clear()
+    log.after_execute(make_event('SELECT 1', 0.6))
+    log.after_execute(make_event('SELECT 2', 0.6))
+    pool.conn.released.set()
+    log._executor.submit(lambda: None).result()  # type: ignore
+    log.after_execute(make_event('SELECT 3', 0.6))
+    log.close()
+
+    assert [entry.plan is not None for entry in log.entries] == [True, False, True]
+    assert [query for query, _ in pool.conn.queries] == ['EXPLAIN (FORMAT JSON) SELECT 1', 'EXPLAIN (FORMAT JSON) SELECT 3']
+    assert pool.connects == 1
+
+
+def test_slow_query_log_does_not_analyze_writes():
+    pool = ConnectionPool()
+    log = pg.SlowQueryLog(threshold=0.5, pool=pool, analyze_rate=1.0)  # type: ignore
+
+    log.after_execute(make_event('DELETE FROM "customer" WHERE "id" = %s', 0.6, (1,)))
+    log.after_execute(make_event('SELECT pg_sleep(10)', 0.6, error=Exception('canceling statement due to statement timeout')))
+    log.close()
+
+    assert [entry.analyzed for entry in log.entries] == [False, False]
+    assert pool.conn.queries == [('EXPLAIN (FORMAT JSON) DELETE FROM "customer" WHERE "id" = %s', (1,))]
+    assert pool.conn.rolled_back
+
+
+def test_slow_query_log_async_pool_without_loop():
+    pool = pg.AsyncConnectionPool('', open=False)
+    log = pg.SlowQueryLog(threshold=0.5, pool=pool)
+
+    log.after_execute(make_event('SELECT 1', 0.6))
+
+    assert len(log) == 1
+    assert log.entries[0].plan is None
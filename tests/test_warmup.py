@@ -0,0 +1,39 @@
+from contextlib import contextmanager
+
+import pgcrud as pg
+from pgcrud import IdentifierExpression as i, QueryBuilder as q
+from pgcrud.instrumentation import current_operation
+
+
+class Connection:
+
+    autocommit = False
+
+    def __init__(self):
+        self.executed = []
+        self.committed = False
+
+    @contextmanager
+    def transaction(self):
+        yield
+        self.committed = True
+
+    def execute(self, query, params=None, *, prepare=None):
+        self.executed.append((str(query), params, prepare, current_operation.get()))
+
+
+def test_warmup():
+    warmup = pg.Warmup([
+        (q.SELECT(i.id, i.name).FROM(i.customer).WHERE(i.id == pg.PlaceholderExpression()), (1,)),
+        ('SELECT * FROM "account" WHERE "customer_id" = %s', (1,)),
+    ])
+    conn = Connection()
+
+    warmup.run(conn)  # type: ignore
+
+    assert conn.executed == [
+        ('SET TRANSACTION READ ONLY', None, None, 'warmup'),
+        ('SELECT "id", "name" FROM "customer" WHERE "id" = %s', (1,), True, 'warmup'),
+        ('SELECT * FROM "account" WHERE "customer_id" = %s', (1,), True, 'warmup'),
+    ]
+    assert conn.committed